@@ -0,0 +1,190 @@
+import json
+import math
+import time
+from collections import deque
+from metrics import metrics
+
+
+def linear(t):
+    return t
+
+
+def ease_out_quad(t):
+    return 1 - (1 - t) ** 2
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_out_expo(t):
+    return 1.0 if t >= 1 else 1 - 2 ** (-10 * t)
+
+
+EASINGS = {
+    'linear': linear,
+    'ease_out_quad': ease_out_quad,
+    'ease_out_cubic': ease_out_cubic,
+    'ease_out_expo': ease_out_expo,
+}
+
+
+class FrameTimings:
+    """Per-frame timing samples: when a frame was due, when it ran, how long it took"""
+
+    def __init__(self, late_threshold_ms=None, max_frames=100000):
+        self.late_threshold_ms = late_threshold_ms
+        self.frames = deque(maxlen=max_frames)
+        self.dropped = 0
+
+    def record(self, due, started, finished, interval_ms):
+        self.frames.append((due, started, finished, interval_ms))
+
+    def rows(self):
+        """Yield one dict per frame, times in milliseconds"""
+        origin = self.frames[0][0] if self.frames else 0
+        for due, started, finished, interval_ms in self.frames:
+            yield {
+                'due_ms': round((due - origin) * 1000, 3),
+                'lateness_ms': round((started - due) * 1000, 3),
+                'render_ms': round((finished - started) * 1000, 3),
+                'interval_ms': round(interval_ms, 3),
+            }
+
+    def summary(self):
+        rows = list(self.rows())
+        if not rows:
+            return {'frames': 0, 'dropped': self.dropped}
+        lateness = [r['lateness_ms'] for r in rows]
+        render = sorted(r['render_ms'] for r in rows)
+        mean = sum(lateness) / len(lateness)
+        late = [
+            r for r in rows
+            if r['lateness_ms'] > (self.late_threshold_ms or r['interval_ms'] / 2)
+        ]
+        return {
+            'frames': len(rows),
+            'dropped': self.dropped,
+            'late_frames': len(late),
+            'mean_lateness_ms': round(mean, 3),
+            'jitter_ms': round(math.sqrt(sum((x - mean) ** 2 for x in lateness) / len(lateness)), 3),
+            'max_lateness_ms': round(max(lateness), 3),
+            'render_p50_ms': render[len(render) // 2],
+            'render_p95_ms': render[min(len(render) - 1, int(len(render) * 0.95))],
+            'render_max_ms': render[-1],
+        }
+
+    def export_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': self.summary(), 'frames': list(self.rows())}, f, indent=4)
+
+
+class AnimationScheduler:
+    """Runs a frame callback on Tk's event loop against a monotonic clock.
+
+    Each frame is due at a fixed deadline rather than "interval after the
+    last one finished", so timer slop does not accumulate; if frames are
+    missed the deadline skips ahead and they are counted as dropped.
+    decelerate() stretches the interval along an easing curve and calls
+    a landing callback on the final frame.
+    """
+
+    def __init__(self, root, on_frame, interval_ms=50, timings=None, clock=time.monotonic,
+                 name='animation'):
+        self.root = root
+        self.name = name
+        self._frame_metric = f"{name}_frame"
+        self._error_metric = f"{name}_frame_errors"
+        self._dropped_metric = f"{name}_frames_dropped"
+        self.on_frame = on_frame
+        self.interval_ms = interval_ms
+        self.timings = timings if timings is not None else FrameTimings()
+        self.clock = clock
+        self.running = False
+        self._job = None
+        self._due = None
+        self._slowdown = None
+
+    def start(self):
+        self.stop()
+        self.running = True
+        self._slowdown = None
+        self._due = self.clock()
+        self._schedule()
+
+    def stop(self):
+        self.running = False
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def decelerate(self, duration_ms, on_land, easing='ease_out_cubic', final_interval_ms=600):
+        """Slow the frames down over duration_ms, then call on_land() instead of a frame"""
+        self._slowdown = {
+            'started': self.clock(),
+            'duration': duration_ms / 1000,
+            'easing': EASINGS.get(easing, easing),
+            'final_interval_ms': final_interval_ms,
+            'on_land': on_land,
+        }
+
+    def land_now(self):
+        """Cut a deceleration short and call its on_land(); False if not decelerating"""
+        slowdown = self._slowdown
+        self.stop()
+        self._slowdown = None
+        if slowdown is None:
+            return False
+        slowdown['on_land']()
+        return True
+
+    def _current_interval(self, now):
+        slowdown = self._slowdown
+        if slowdown is None:
+            return self.interval_ms, False
+        progress = (now - slowdown['started']) / slowdown['duration']
+        if progress >= 1:
+            return slowdown['final_interval_ms'], True
+        eased = slowdown['easing'](max(0.0, progress))
+        return self.interval_ms + (slowdown['final_interval_ms'] - self.interval_ms) * eased, False
+
+    def _schedule(self):
+        delay = max(0, int(round((self._due - self.clock()) * 1000)))
+        self._job = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        self._job = None
+        if not self.running:
+            return
+        started = self.clock()
+        interval_ms, landing = self._current_interval(started)
+        if landing:
+            on_land = self._slowdown['on_land']
+            self.running = False
+            self._slowdown = None
+            on_land()
+            self.timings.record(self._due, started, self.clock(), interval_ms)
+            return
+        try:
+            self.on_frame()
+        except Exception as e:
+            # One bad frame must not stop the loop and strand the controls
+            print(f"Error in {self.name} frame: {e}")
+            metrics.count(self._error_metric)
+        finished = self.clock()
+        self.timings.record(self._due, started, finished, interval_ms)
+        metrics.observe(self._frame_metric, finished - started)
+        if not self.running:
+            return  # on_frame() stopped the animation
+        interval = interval_ms / 1000
+        self._due += interval
+        if self._due < finished:
+            # Too late for one or more frames: skip them instead of bunching up
+            missed = int((finished - self._due) / interval) + 1
+            self.timings.dropped += missed
+            metrics.count(self._dropped_metric, missed)
+            self._due += missed * interval
+        if self._slowdown is not None:
+            # Land exactly when the slowdown ends, not up to a frame later
+            self._due = min(self._due, self._slowdown['started'] + self._slowdown['duration'])
+        self._schedule()
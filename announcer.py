@@ -0,0 +1,182 @@
+import hashlib
+import math
+import os
+import wave
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from metrics import metrics
+
+
+def announcement_text(winner):
+    """Return the sentence read out for a winner"""
+    if 'Group' in winner and 'Department' in winner:
+        return f"Xin chúc mừng {winner['Name']} - {winner['Group']} - {winner['Department']} ĐÃ GIÀNH CHIẾN THẮNG."
+    return f"Xin chúc mừng {winner['Name']} ĐÃ GIÀNH CHIẾN THẮNG."
+
+
+class Synthesizer:
+    """Turns announcement text into an audio file.
+
+    Subclasses set a unique name (part of the cache key) and the file
+    extension they produce, and implement synthesize().
+    """
+
+    name = 'base'
+    extension = '.mp3'
+
+    def synthesize(self, text, path):
+        raise NotImplementedError
+
+
+class GTTSSynthesizer(Synthesizer):
+    """Google Text-to-Speech; needs network access"""
+
+    extension = '.mp3'
+
+    def __init__(self, lang='vi'):
+        self.lang = lang
+        self.name = f"gtts-{lang}"
+
+    def synthesize(self, text, path):
+        from gtts import gTTS
+
+        gTTS(text=text, lang=self.lang).save(path)
+
+
+class ToneSynthesizer(Synthesizer):
+    """Offline stand-in that renders a short two-note chime as WAV"""
+
+    name = 'tone'
+    extension = '.wav'
+
+    def __init__(self, sample_rate=22050, note_seconds=0.3):
+        self.sample_rate = sample_rate
+        self.note_seconds = note_seconds
+
+    def synthesize(self, text, path):
+        samples = array('h')
+        frames = int(self.sample_rate * self.note_seconds)
+        for frequency in (784.0, 1046.5):
+            for i in range(frames):
+                envelope = 1.0 - i / frames
+                value = math.sin(2 * math.pi * frequency * i / self.sample_rate)
+                samples.append(int(12000 * envelope * value))
+        with wave.open(str(path), 'wb') as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(samples.tobytes())
+
+
+class TTSCache:
+    """Content-addressed store of synthesized announcements"""
+
+    def __init__(self, directory='.tts_cache'):
+        self.directory = Path(directory)
+
+    def path_for(self, synthesizer, text):
+        key = hashlib.sha256(f"{synthesizer.name}\0{text}".encode('utf-8')).hexdigest()
+        return self.directory / f"{key}{synthesizer.extension}"
+
+    def fetch(self, synthesizer, text):
+        """Return the cached file for a message, synthesizing it on a miss"""
+        path = self.path_for(synthesizer, text)
+        if path.exists():
+            metrics.count('tts_cache_hits')
+            return path
+        metrics.count('tts_cache_misses')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+        with metrics.timer(f"tts_synthesis_{synthesizer.name}"):
+            synthesizer.synthesize(text, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+
+class Announcer:
+    """Synthesizes announcements on a worker pool and plays them off the Tk loop.
+
+    Requests are played in the order they were made. The Tk thread polls
+    with root.after for finished syntheses and for the end of playback,
+    so nothing ever busy-waits inside a Tk callback. The player needs
+    play(source), is_busy() and stop() methods, where source is a file
+    path or a pre-rendered SoundClip.
+    """
+
+    def __init__(self, root, player, synthesizer=None, fallback=None, cache=None,
+                 max_workers=2, poll_interval=50):
+        self.root = root
+        self.player = player
+        self.synthesizer = synthesizer or GTTSSynthesizer()
+        self.fallback = fallback
+        self.cache = cache or TTSCache()
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._waiting = deque()
+        self._playing = False
+        self._on_played = None
+        self._polling = False
+
+    def prepare(self, text):
+        """Start synthesizing a message in the background and return a Future"""
+        return self._executor.submit(self._synthesize, text)
+
+    def _synthesize(self, text):
+        try:
+            return self.cache.fetch(self.synthesizer, text)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            print(f"Falling back to {self.fallback.name} voice: {e}")
+            metrics.count('tts_fallbacks')
+            return self.cache.fetch(self.fallback, text)
+
+    def announce(self, text, on_done=None, clip=None):
+        """Queue a message for playback; on_done(ok) runs on the Tk thread.
+
+        A pre-rendered clip, when given, is played as-is with no synthesis.
+        """
+        if clip is None:
+            future = self.prepare(text)
+        else:
+            future = Future()
+            future.set_result(clip)
+        self._waiting.append((future, on_done))
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        if self._playing:
+            if self.player.is_busy():
+                self._schedule_poll()
+                return
+            self.player.stop()
+            self._playing = False
+            self._finish(self._on_played, True)
+        if self._waiting and self._waiting[0][0].done():
+            future, on_done = self._waiting.popleft()
+            try:
+                with metrics.timer('announcement_play_start'):
+                    self.player.play(future.result())
+                self._playing = True
+                self._on_played = on_done
+            except Exception as e:
+                print(f"Error announcing winner: {e}")
+                metrics.count('announcement_errors')
+                self._finish(on_done, False)
+        if self._playing or self._waiting:
+            self._schedule_poll()
+
+    def _finish(self, on_done, ok):
+        if on_done:
+            on_done(ok)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
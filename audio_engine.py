@@ -0,0 +1,265 @@
+import io
+import math
+import os
+import random
+import threading
+import time
+from array import array
+
+MUSIC_CHANNEL = 0
+VOICE_CHANNEL = 1
+RESERVED_CHANNELS = 2
+
+
+def _render(frequency, channels, seconds, sample):
+    """Render sample(t) -> -1..1 into interleaved signed 16-bit PCM"""
+    frames = int(frequency * seconds)
+    pcm = array('h', bytes(2 * frames * channels))
+    for i in range(frames):
+        value = int(max(-1.0, min(1.0, sample(i / frequency))) * 32767)
+        for c in range(channels):
+            pcm[i * channels + c] = value
+    return pcm
+
+
+def drumroll_samples(frequency, channels, seconds=2.5):
+    """A snare roll that speeds up and swells"""
+    rng = random.Random(7)
+    noise = [rng.uniform(-1, 1) for _ in range(4096)]
+    hits = []
+    t = 0.0
+    while t < seconds:
+        hits.append(t)
+        t += 0.07 - 0.035 * (t / seconds)
+
+    def sample(t):
+        index = max(0, min(len(hits) - 1, int(t / 0.05)))
+        while index and hits[index] > t:
+            index -= 1
+        while index + 1 < len(hits) and hits[index + 1] <= t:
+            index += 1
+        since = t - hits[index]
+        swell = 0.35 + 0.55 * (t / seconds)
+        return noise[int(t * frequency) % len(noise)] * math.exp(-since * 45) * swell
+
+    return _render(frequency, channels, seconds, sample)
+
+
+def fanfare_samples(frequency, channels):
+    """A short brass-like arpeggio ending on a held chord"""
+    notes = [(0.0, 523.25), (0.15, 659.25), (0.3, 783.99), (0.45, 1046.5)]
+    length = 1.8
+
+    def sample(t):
+        value = 0.0
+        for start, pitch in notes:
+            if t >= start:
+                since = t - start
+                envelope = min(1.0, since * 40) * math.exp(-since * 1.6)
+                phase = 2 * math.pi * pitch * t
+                value += envelope * (math.sin(phase) + 0.5 * math.sin(2 * phase) + 0.25 * math.sin(3 * phase))
+        fade = min(1.0, (length - t) * 8)
+        return 0.16 * value * fade
+
+    return _render(frequency, channels, length, sample)
+
+
+class _Ramp:
+    __slots__ = ('start', 'target', 'started', 'duration', 'on_done')
+
+    def __init__(self, start, target, started, duration, on_done):
+        self.start = start
+        self.target = target
+        self.started = started
+        self.duration = duration
+        self.on_done = on_done
+
+    def value(self, now):
+        if self.duration <= 0 or now >= self.started + self.duration:
+            return self.target
+        return self.start + (self.target - self.start) * (now - self.started) / self.duration
+
+
+class AudioEngine:
+    """Preloaded sounds on a fixed pygame channel pool with scheduled fades.
+
+    Channel 0 is reserved for music and channel 1 for announcements; the
+    rest are a pool that overlapping effects are spread over. Every sound
+    is decoded once into memory when the engine opens, so playing never
+    touches the disk. Volume changes are linear ramps evaluated against a
+    monotonic clock by an automation thread, never by sleeping on the Tk
+    thread. Music is ducked while an announcement plays and restored when
+    it ends. Fades to silence use SDL_mixer's own per-sample fade.
+    """
+
+    def __init__(self, base_path, channels=8, buffer=512, tick=0.01,
+                 duck_level=0.25, duck_ms=150, restore_ms=600):
+        self.base_path = base_path
+        self.channels = max(channels, RESERVED_CHANNELS + 1)
+        self.buffer = buffer
+        self.tick = tick
+        self.duck_level = duck_level
+        self.duck_ms = duck_ms
+        self.restore_ms = restore_ms
+        self.mixer = None
+        self.sounds = {}
+        self.music_volume = 1.0
+        self.duck_gain = 1.0
+        self._ramps = {}
+        self._ducked = False
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def open(self):
+        """Initialize the mixer and decode the sound bank (call off the Tk thread)"""
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        from pygame import mixer
+        mixer.pre_init(44100, -16, 2, self.buffer)
+        mixer.init()
+        mixer.set_num_channels(self.channels)
+        mixer.set_reserved(RESERVED_CHANNELS)
+        self.mixer = mixer
+        self.load_bank()
+        self._running = True
+        self._thread = threading.Thread(target=self._automate, name='audio-automation', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self.mixer is not None:
+            self.mixer.stop()
+
+    def load_bank(self):
+        """Decode music, drumroll and fanfare; effects missing on disk are generated"""
+        frequency, _, channels = self.mixer.get_init()
+        generators = {
+            'drumroll': lambda: drumroll_samples(frequency, channels),
+            'fanfare': lambda: fanfare_samples(frequency, channels),
+        }
+        for name, filename in (('music', 'music_background.mp3'),
+                               ('drumroll', 'drumroll.wav'),
+                               ('fanfare', 'fanfare.wav')):
+            path = os.path.join(self.base_path, 'audio', filename)
+            try:
+                if os.path.exists(path):
+                    self.sounds[name] = self.mixer.Sound(path)
+                elif name in generators:
+                    self.sounds[name] = self.mixer.Sound(buffer=generators[name]())
+                else:
+                    print(f"Audio file not found: {path}")
+            except Exception as e:
+                print(f"Error loading {name} sound: {e}")
+
+    def _channel(self, index):
+        return self.mixer.Channel(index)
+
+    # Music
+
+    def play_music(self, volume=0.9, fade_ms=0):
+        sound = self.sounds.get('music')
+        if sound is None:
+            return False
+        with self._cond:
+            self._ramps.pop('music_volume', None)
+            self.music_volume = volume
+        self._channel(MUSIC_CHANNEL).play(sound, loops=-1, fade_ms=fade_ms)
+        self._apply_music_volume()
+        return True
+
+    def ramp_music(self, target, duration_ms, on_done=None):
+        """Move the music level to target over duration_ms"""
+        self._ramp('music_volume', target, duration_ms, on_done)
+
+    def fade_out_music(self, duration_ms=1000):
+        """Fade the music to silence sample-accurately, then stop it"""
+        if self.mixer is not None:
+            self._channel(MUSIC_CHANNEL).fadeout(int(duration_ms))
+
+    def stop_music(self):
+        if self.mixer is not None:
+            self._channel(MUSIC_CHANNEL).stop()
+
+    def music_playing(self):
+        return self.mixer is not None and self._channel(MUSIC_CHANNEL).get_busy()
+
+    # Effects
+
+    def play_effect(self, name, volume=1.0):
+        """Play a preloaded effect on a free pool channel (stealing the oldest if none)"""
+        sound = self.sounds.get(name)
+        if sound is None or self.mixer is None:
+            return None
+        channel = self.mixer.find_channel(True)
+        if channel is None:
+            return None
+        channel.set_volume(volume)
+        channel.play(sound)
+        return channel
+
+    def stop_effect(self, channel, fade_ms=300):
+        if channel is not None:
+            channel.fadeout(int(fade_ms))
+
+    # Announcements
+
+    def play_voice(self, source, extension=None):
+        """Play an announcement (file path or encoded bytes), ducking the music under it"""
+        if extension is None:
+            sound = self.mixer.Sound(str(source))
+        else:
+            sound = self.mixer.Sound(file=io.BytesIO(source))
+        self._channel(VOICE_CHANNEL).play(sound)
+        with self._cond:
+            self._ducked = True
+        self._ramp('duck_gain', self.duck_level, self.duck_ms)
+
+    def voice_busy(self):
+        return self.mixer is not None and self._channel(VOICE_CHANNEL).get_busy()
+
+    def stop_voice(self):
+        if self.mixer is not None:
+            self._channel(VOICE_CHANNEL).stop()
+
+    # Automation
+
+    def _ramp(self, parameter, target, duration_ms, on_done=None):
+        with self._cond:
+            self._ramps[parameter] = _Ramp(
+                getattr(self, parameter), target, time.monotonic(), duration_ms / 1000, on_done
+            )
+            self._cond.notify_all()
+
+    def _apply_music_volume(self):
+        if self.mixer is not None:
+            self._channel(MUSIC_CHANNEL).set_volume(max(0.0, min(1.0, self.music_volume * self.duck_gain)))
+
+    def _automate(self):
+        while True:
+            finished = []
+            with self._cond:
+                while self._running and not self._ramps and not self._ducked:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                now = time.monotonic()
+                for parameter, ramp in list(self._ramps.items()):
+                    setattr(self, parameter, ramp.value(now))
+                    if now >= ramp.started + ramp.duration:
+                        del self._ramps[parameter]
+                        finished.append(ramp.on_done)
+                restore = self._ducked and not self._channel(VOICE_CHANNEL).get_busy()
+                if restore:
+                    self._ducked = False
+            try:
+                self._apply_music_volume()
+            except Exception as e:
+                print(f"Error applying audio fade: {e}")
+            if restore:
+                self._ramp('duck_gain', 1.0, self.restore_ms)
+            for on_done in finished:
+                if on_done:
+                    on_done()
+            time.sleep(self.tick)
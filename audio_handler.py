@@ -1,97 +1,139 @@
-from pygame import mixer
-from gtts import gTTS
-import pygame
 import os
+import threading
+from announcer import Announcer, GTTSSynthesizer, ToneSynthesizer, announcement_text
+from audio_engine import AudioEngine
+from sound_bank import SoundBank, SoundClip
+from metrics import metrics
 
 class AudioHandler:
-    def __init__(self, root=None):
+    def __init__(self, root=None, synthesizer=None):
         self.root = root
-        mixer.init()
-        self.background_music = None
         self.base_path = os.path.dirname(os.path.abspath(__file__))
+        self.engine = AudioEngine(self.base_path)
+        self.audio_ready = threading.Event()
+        self.announcer = Announcer(
+            root,
+            player=self,
+            synthesizer=synthesizer or GTTSSynthesizer(lang='vi'),
+            fallback=ToneSynthesizer()
+        )
+        self.sound_bank = SoundBank()
+        self.prerender_progress = (0, 0)
+        self._prerender_cancel = None
+        self._drumroll = None
+
+    @property
+    def mixer(self):
+        """pygame.mixer once setup_audio has initialized it, else None"""
+        return self.engine.mixer
 
     def setup_audio(self):
-        """Setup background music"""
+        """Initialize the mixer and decode the sound bank in the background"""
+        threading.Thread(target=self._load_audio, name='audio-setup', daemon=True).start()
+
+    def _load_audio(self):
         try:
-            music_path = os.path.join(self.base_path, "audio", "music_background.mp3")
-            if os.path.exists(music_path):
-                self.background_music = mixer.Sound(music_path)
-                self.background_music.set_volume(1.0)
-                print("Background music loaded successfully.")
-            else:
-                print("Background music file not found.")
+            with metrics.timer('audio_setup'):
+                self.engine.open()
+            print(f"Audio ready: {', '.join(sorted(self.engine.sounds))}")
         except Exception as e:
-            print(f"Error loading background music: {e}")
+            print(f"Error initializing audio: {e}")
+            metrics.count('audio_errors')
+        self.audio_ready.set()
 
     def play_background_music(self):
         """Play the background music"""
         try:
-            if self.background_music:
-                self.background_music.set_volume(0.9)
-                self.background_music.play(loops=-1)
-                print("Background music started.")
-            else:
-                print("Background music not available.")
+            with metrics.timer('music_start'):
+                if not self.engine.play_music(volume=0.9):
+                    print("Background music not available.")
         except Exception as e:
             print(f"Error playing background music: {e}")
+            metrics.count('audio_errors')
 
-    def stop_background_music(self):
-        """Stop the background music"""
+    def stop_background_music(self, fade_ms=800):
+        """Fade out the background music and any drumroll"""
         try:
-            if self.background_music:
-                self.background_music.stop()
-        except:
+            self.engine.fade_out_music(fade_ms)
+            self.engine.stop_effect(self._drumroll, fade_ms)
+            self._drumroll = None
+        except Exception:
             pass
 
-    def reduce_volume(self):
-        """Gradually reduce the volume of the background music"""
+    def reduce_volume(self, duration_ms=3000):
+        """Bring the music down over duration_ms under a drumroll"""
         try:
-            if self.background_music:
-                current_volume = self.background_music.get_volume()
-                if current_volume > 0:
-                    new_volume = max(0, current_volume - 0.1)
-                    self.background_music.set_volume(new_volume)
-                    if self.root:
-                        self.root.after(300, self.reduce_volume)
-                else:
-                    self.background_music.stop()
-        except AttributeError:
-            pass
+            self.engine.ramp_music(0.3, duration_ms)
+            self._drumroll = self.engine.play_effect('drumroll', volume=0.8)
+        except Exception as e:
+            print(f"Error reducing volume: {e}")
+            metrics.count('audio_errors')
 
-    def cleanup_winner_audio(self):
-        """Ensure winner.mp3 is closed before next round"""
+    def play_fanfare(self):
+        """Play the winner fanfare over whatever else is sounding"""
         try:
-            winner_path = os.path.join(self.base_path, "winner.mp3")
-            if os.path.exists(winner_path):
-                os.remove(winner_path)
+            self.engine.play_effect('fanfare')
         except Exception as e:
-            print(f"Error cleaning up winner.mp3: {e}")
-
-    def fade_out(self, sound, duration=3000):
-        """Gradually decrease volume and stop the sound"""
-        for i in range(10, -1, -1):
-            sound.set_volume(i / 10)
-            pygame.time.wait(duration // 10)
-        sound.stop()
-
-    def announce_winner(self, winner):
-        """Announce the winner"""
-        if 'Group' in winner and 'Department' in winner:
-            message_text = f"Xin chúc mừng {winner['Name']} - {winner['Group']} - {winner['Department']} ĐÃ GIÀNH CHIẾN THẮNG."
+            print(f"Error playing fanfare: {e}")
+            metrics.count('audio_errors')
+
+    def prerender_announcements(self, participants, on_done=None):
+        """Pre-render every participant's announcement into the sound bank.
+
+        Runs in a background thread; progress is published through
+        prerender_progress as (done, total) and on_done(failures) is called
+        from that thread when the render finishes.
+        """
+        if self._prerender_cancel is not None:
+            self._prerender_cancel.set()
+        cancel = threading.Event()
+        self._prerender_cancel = cancel
+        jobs = [(p.get('STT'), announcement_text(p)) for p in participants]
+        synthesizer = self.announcer.synthesizer
+
+        def progress(done, total):
+            if not cancel.is_set():
+                self.prerender_progress = (done, total)
+
+        def worker():
+            try:
+                failures = self.sound_bank.prerender(
+                    jobs, synthesizer, progress=progress, cancel=cancel
+                )
+            except Exception as e:
+                print(f"Error pre-rendering announcements: {e}")
+                metrics.count('audio_errors')
+                failures = len(jobs)
+            if on_done and not cancel.is_set():
+                on_done(failures)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def cancel_prerender(self):
+        if self._prerender_cancel is not None:
+            self._prerender_cancel.set()
+
+    def announce_winner(self, winner, on_done=None):
+        """Announce the winner without blocking the Tk loop"""
+        text = announcement_text(winner)
+        clip = self.sound_bank.get(winner.get('STT'), self.announcer.synthesizer, text)
+        metrics.count('sound_bank_hits' if clip is not None else 'sound_bank_misses')
+        self.announcer.announce(text, on_done, clip=clip)
+
+    def play(self, source):
+        """Play an announcement file or pre-rendered clip on the voice channel"""
+        if self.mixer is None:
+            raise RuntimeError("Audio is not initialized yet")
+        if isinstance(source, SoundClip):
+            self.engine.play_voice(source.data, source.extension)
         else:
-            message_text = f"Xin chúc mừng {winner['Name']} ĐÃ GIÀNH CHIẾN THẮNG."
-        tts = gTTS(text=message_text, lang='vi')
-        try:
-            winner_path = os.path.join(self.base_path, "winner.mp3")
-            if os.path.exists(winner_path):
-                os.remove(winner_path)
-            tts.save(winner_path)
-            mixer.music.load(winner_path)
-            mixer.music.set_volume(1.0)  # Set volume to maximum
-            mixer.music.play()
-        except Exception as e:
-            print(f"Error announcing winner: {e}")
-        while mixer.music.get_busy():
-            pygame.time.wait(10)
-        mixer.music.unload()
-        os.remove(winner_path)
+            self.engine.play_voice(source)
+
+    def is_busy(self):
+        return self.engine.voice_busy()
+
+    def stop(self):
+        self.engine.stop_voice()
+
+    def shutdown(self):
+        self.engine.close()
@@ -0,0 +1,49 @@
+import random
+
+
+def _weights(pool, column):
+    """Return a probability vector from a numeric column, or None if unusable"""
+    import numpy as np
+
+    weights = np.fromiter(
+        (_to_float(record.get(column)) for record in pool), dtype=float, count=len(pool)
+    )
+    weights[~np.isfinite(weights) | (weights < 0)] = 0.0
+    total = weights.sum()
+    if total <= 0:
+        return None
+    return weights / total
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def sample_indexes(pool, count, weight_column=None, seed=None):
+    """Pick up to count distinct pool positions without replacement.
+
+    With weight_column, each participant's chance is proportional to that
+    column (blank or invalid counts as 0, so they are never picked, even
+    when nobody else is left).
+    """
+    import numpy as np
+
+    size = len(pool)
+    if size == 0 or count <= 0:
+        return []
+    rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+    if not weight_column:
+        return rng.choice(size, size=min(count, size), replace=False).tolist()
+    probabilities = _weights(pool, weight_column)
+    if probabilities is None:
+        return []  # nobody has a positive weight
+    count = min(count, int(np.count_nonzero(probabilities)))
+    return rng.choice(size, size=count, replace=False, p=probabilities).tolist()
+
+
+def sample_winners(pool, count, weight_column=None, seed=None):
+    """Return up to count distinct winner records, in reveal order"""
+    return [pool[i] for i in sample_indexes(pool, count, weight_column, seed)]
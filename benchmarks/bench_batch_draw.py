@@ -0,0 +1,73 @@
+"""Benchmark drawing a batch of winners from a large pool.
+
+Times NumPy sampling without replacement (uniform and weighted) and the
+single persistence pass that commits the batch. Usage:
+
+    python benchmarks/bench_batch_draw.py --participants 100000 --winners 1000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_draw import sample_winners
+from draw_engine import DrawEngine
+from participant_pool import ParticipantPool
+from roster_cache import RosterCache
+from winners_journal import WinnersJournal
+
+
+def synthetic_pool(size):
+    return ParticipantPool(
+        {'STT': str(i), 'Name': f"Participant {i}", 'Group': 'HCM',
+         'Department': f"Dept {i % 40}", 'Weight': str(1 + i % 5)}
+        for i in range(1, size + 1)
+    )
+
+
+def timed(label, func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<34} {best * 1000:9.2f} ms (best of {repeat})")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--participants', type=int, default=100_000)
+    parser.add_argument('--winners', type=int, default=1_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pool = synthetic_pool(args.participants)
+    print(f"Drawing {args.winners:,} winners from {args.participants:,} participants")
+    timed("uniform sampling", lambda: sample_winners(pool, args.winners), args.repeat)
+    timed("weighted sampling", lambda: sample_winners(pool, args.winners, 'Weight'), args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        def commit():
+            engine = DrawEngine(
+                journal=WinnersJournal(os.path.join(directory, 'winners.jsonl'),
+                                       os.path.join(directory, 'winners.json')),
+                roster_cache=RosterCache(os.path.join(directory, 'cache')),
+            )
+            engine.set_pool(synthetic_pool(args.participants))
+            winners = sample_winners(engine.eligible, args.winners)
+            started = time.perf_counter()
+            engine.commit_winners(winners)
+            elapsed = time.perf_counter() - started
+            engine.close()
+            return elapsed
+
+        best = min(commit() for _ in range(args.repeat))
+        print(f"  {'commit batch (pool + journal)':<34} {best * 1000:9.2f} ms (best of {args.repeat})")
+
+
+if __name__ == '__main__':
+    main()
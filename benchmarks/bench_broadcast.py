@@ -0,0 +1,140 @@
+"""Load-test the draw broadcast with many simulated display clients.
+
+Runs a BroadcastServer on the loopback interface, joins N subscriber
+sockets to its group, and drives it like a live draw: rolling names at
+--fps with a burst of winners every second. Reports the cost of
+publish() on the calling (UI) thread, how many updates were coalesced,
+datagrams sent, per-client delivery, sequence gaps and delivery
+latency. Usage:
+
+    python benchmarks/bench_broadcast.py --clients 10 50 100 --seconds 5
+"""
+import argparse
+import json
+import os
+import selectors
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broadcast import BroadcastServer
+from broadcast_client import DrawState, subscribe
+
+GROUP = '239.255.42.99'
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def run(clients, seconds, fps, port):
+    server = BroadcastServer(GROUP, port, interface='127.0.0.1')
+    selector = selectors.DefaultSelector()
+    states = []
+    for _ in range(clients):
+        sock = subscribe(GROUP, port, '127.0.0.1')
+        sock.setblocking(False)
+        state = DrawState()
+        states.append(state)
+        selector.register(sock, selectors.EVENT_READ, state)
+
+    latencies = []
+    received = [0]
+    done = threading.Event()
+
+    def receive():
+        while not done.is_set():
+            for key, _ in selector.select(timeout=0.1):
+                while True:
+                    try:
+                        data = key.fileobj.recv(65535)
+                    except BlockingIOError:
+                        break
+                    now = time.perf_counter()
+                    message = json.loads(data)
+                    key.data.apply(message)
+                    received[0] += 1
+                    rolling = message.get('state', {}).get('rolling')
+                    if message['type'] == 'delta' and rolling:
+                        latencies.append((now - float(rolling)) * 1000)
+
+    receiver = threading.Thread(target=receive, daemon=True)
+    receiver.start()
+    server.start()
+
+    publish_us = []
+    published = 0
+    frame = 1 / fps
+    started = time.perf_counter()
+    next_burst = started + 1
+    stt = 0
+    while time.perf_counter() - started < seconds:
+        t0 = time.perf_counter()
+        # The name is the publish time so clients can measure latency
+        server.publish(phase='rolling', rolling=repr(t0))
+        publish_us.append((time.perf_counter() - t0) * 1e6)
+        published += 1
+        if t0 >= next_burst:
+            entries = []
+            for _ in range(5):
+                stt += 1
+                entries.append({'time': '2026-10-18 20:00', 'prize': 'GRAND PRIZE',
+                                'winner': {'STT': stt, 'Name': f"Nguyễn Văn {stt}",
+                                           'Group': 'HCM', 'Department': 'DT Team'}})
+            t1 = time.perf_counter()
+            server.on_winners_committed(entries)
+            publish_us.append((time.perf_counter() - t1) * 1e6)
+            published += 1
+            next_burst += 1
+        time.sleep(max(0, frame - (time.perf_counter() - t0)))
+
+    time.sleep(server.keyframe_interval + 0.5)  # let a final keyframe arrive
+    server.stop()
+    done.set()
+    receiver.join()
+    for key in list(selector.get_map().values()):
+        key.fileobj.close()
+
+    complete = sum(1 for s in states if s.synced and s.winners_total == stt)
+    return {
+        'clients': clients,
+        'published': published,
+        'coalesced': server.coalesced,
+        'datagrams': server.sent,
+        'publish_p50_us': statistics.median(publish_us),
+        'publish_p99_us': percentile(publish_us, 0.99),
+        'delivered': received[0],
+        'expected': server.sent * clients,
+        'gaps': sum(s.gaps for s in states),
+        'latency_p50_ms': statistics.median(latencies) if latencies else 0.0,
+        'latency_p99_ms': percentile(latencies, 0.99),
+        'complete_clients': complete,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, nargs='+', default=[10, 50, 100])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--port', type=int, default=50142)
+    args = parser.parse_args()
+
+    header = (f"{'clients':>8} {'publish':>8} {'coalesce':>9} {'sent':>6} {'pub p50':>9} "
+              f"{'pub p99':>9} {'delivered':>13} {'gaps':>6} {'lat p50':>9} {'lat p99':>9} {'synced':>7}")
+    print(header)
+    for clients in args.clients:
+        r = run(clients, args.seconds, args.fps, args.port)
+        print(f"{r['clients']:>8} {r['published']:>8} {r['coalesced']:>9} {r['datagrams']:>6} "
+              f"{r['publish_p50_us']:>7.1f}us {r['publish_p99_us']:>7.1f}us "
+              f"{r['delivered']:>6}/{r['expected']:<6} {r['gaps']:>6} "
+              f"{r['latency_p50_ms']:>7.2f}ms {r['latency_p99_ms']:>7.2f}ms "
+              f"{r['complete_clients']:>3}/{r['clients']:<3}")
+
+
+if __name__ == '__main__':
+    main()
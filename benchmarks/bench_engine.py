@@ -0,0 +1,117 @@
+"""Benchmark the headless draw engine on synthetic rosters.
+
+For each roster size this reports roster load time (cold parse and warm
+snapshot cache), peak traced memory of the load, per-draw pick latency,
+per-draw commit latency (pool update + fsync'd journal append), and the
+time for the background write-back to flush a burst of draws. Usage:
+
+    python benchmarks/bench_engine.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import csv
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draw_engine import DrawEngine
+from roster_cache import RosterCache
+from winners_journal import WinnersJournal
+
+GROUPS = ['HCM', 'HN', 'DN', 'Logistic']
+
+
+def write_roster(directory, size, fmt):
+    """Write a synthetic roster and return its path"""
+    header = ('STT', 'Name', 'Group', 'Department')
+    rows = (
+        (i, f"Nguyễn Văn Thành {i}", GROUPS[i % len(GROUPS)], f"DT Team {i % 50}")
+        for i in range(1, size + 1)
+    )
+    path = os.path.join(directory, f"roster_{size}.{fmt}")
+    if fmt == 'xlsx':
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Sheet1')
+        sheet.append(header)
+        for row in rows:
+            sheet.append(row)
+        workbook.save(path)
+    else:
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    return path
+
+
+def new_engine(directory):
+    return DrawEngine(
+        journal=WinnersJournal(os.path.join(directory, 'winners.jsonl'),
+                               os.path.join(directory, 'winners.json')),
+        roster_cache=RosterCache(os.path.join(directory, 'cache')),
+    )
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"median {statistics.median(samples) * 1e6:8.1f} us  p95 {p95 * 1e6:8.1f} us"
+
+
+def bench_size(directory, size, fmt, draws):
+    path = write_roster(directory, size, fmt)
+    print(f"{size:,} participants ({fmt})")
+
+    engine = new_engine(directory)
+    started = time.perf_counter()
+    engine.load_roster(path)
+    print(f"  load (parse)        {(time.perf_counter() - started) * 1000:10.1f} ms")
+
+    engine = new_engine(directory)
+    started = time.perf_counter()
+    engine.load_roster(path)
+    print(f"  load (cached)       {(time.perf_counter() - started) * 1000:10.1f} ms")
+
+    gc.collect()
+    tracemalloc.start()
+    new_engine(directory).load_roster(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  load peak memory    {peak / 2**20:10.1f} MiB")
+
+    picks, commits = [], []
+    for _ in range(min(draws, size)):
+        started = time.perf_counter()
+        winner = engine.pick()
+        picked = time.perf_counter()
+        engine.commit_winner(winner)
+        picks.append(picked - started)
+        commits.append(time.perf_counter() - picked)
+    print(f"  pick                {percentiles(picks)}")
+    print(f"  commit + journal    {percentiles(commits)}")
+
+    started = time.perf_counter()
+    engine.close()
+    print(f"  write-back flush    {(time.perf_counter() - started) * 1000:10.1f} ms  ({len(picks)} draws coalesced)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+    parser.add_argument('--draws', type=int, default=200)
+    args = parser.parse_args()
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            bench_size(directory, size, args.format, args.draws)
+
+
+if __name__ == '__main__':
+    main()
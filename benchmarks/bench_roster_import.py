@@ -0,0 +1,108 @@
+"""Compare roster import paths on synthetic rosters.
+
+Measures load time and peak traced memory of the old pandas path
+(read_excel + to_dict) against the streaming import, plus the CSV and
+Parquet readers. Usage:
+
+    python benchmarks/bench_roster_import.py --sizes 10000 100000 1000000
+"""
+import argparse
+import csv
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from roster_import import load_roster
+
+GROUPS = ['HCM', 'HN', 'DN', 'Logistic']
+DEPARTMENTS = ['DT BSS HCM', 'DT OSS HCM', 'DT CLOUD', 'DT DATA', 'DT QA']
+
+
+def synthetic_rows(size):
+    for i in range(1, size + 1):
+        yield (i, f"Nguyễn Văn Thành {i}", GROUPS[i % len(GROUPS)],
+               DEPARTMENTS[i % len(DEPARTMENTS)], f"note {i}")
+
+
+def write_rosters(directory, size):
+    """Write the same synthetic roster as .xlsx, .csv and (if possible) .parquet"""
+    from openpyxl import Workbook
+
+    header = ('STT', 'Name', 'Group', 'Department', 'Note')
+    paths = {}
+    xlsx_path = os.path.join(directory, f"roster_{size}.xlsx")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(header)
+    for row in synthetic_rows(size):
+        sheet.append(row)
+    workbook.save(xlsx_path)
+    paths['xlsx'] = xlsx_path
+
+    csv_path = os.path.join(directory, f"roster_{size}.csv")
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(synthetic_rows(size))
+    paths['csv'] = csv_path
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return paths
+    columns = list(zip(*synthetic_rows(size)))
+    table = pa.table({name: list(values) for name, values in zip(header, columns)})
+    parquet_path = os.path.join(directory, f"roster_{size}.parquet")
+    pq.write_table(table, parquet_path)
+    paths['parquet'] = parquet_path
+    return paths
+
+
+def load_with_pandas(path):
+    import pandas as pd
+
+    df = pd.read_excel(path, dtype=str)
+    return df.to_dict('records')
+
+
+def measure(label, loader, path):
+    """Time one load, then repeat it under tracemalloc for the memory peak"""
+    gc.collect()
+    started = time.perf_counter()
+    rows = len(loader(path))
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    loader(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {rows:>9} rows  {elapsed:8.2f} s  {peak / 2**20:9.1f} MiB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--skip-pandas', action='store_true',
+                        help="skip the pandas baseline (slow on 1M rows)")
+    args = parser.parse_args()
+    if not args.skip_pandas:
+        import pandas  # noqa: F401  keep import cost out of the first timing
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            print(f"{size:,} rows")
+            paths = write_rosters(directory, size)
+            if not args.skip_pandas:
+                measure('pandas read_excel', load_with_pandas, paths['xlsx'])
+            for kind, path in paths.items():
+                measure(f"streaming {kind}", load_roster, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark concurrent stations drawing from one SQLite store.
+
+Imports a synthetic roster into a fresh database, then starts several
+processes that each open it through a DrawEngine and draw winners as
+fast as they can. Reports per-draw commit latency (claim + local
+journal append), how often a station lost a claim to another one, and
+checks that no participant was drawn twice. Usage:
+
+    python benchmarks/bench_sqlite_store.py --size 100000 --stations 4 --draws 500
+"""
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draw_engine import DrawEngine
+from roster_cache import RosterCache
+from sqlite_store import SQLiteStore
+from winners_journal import WinnersJournal
+
+GROUPS = ['HCM', 'HN', 'DN', 'Logistic']
+
+
+def station(directory, database, index, draws, start, results):
+    engine = DrawEngine(
+        journal=WinnersJournal(os.path.join(directory, f'winners_{index}.jsonl'),
+                               os.path.join(directory, f'winners_{index}.json')),
+        roster_cache=RosterCache(os.path.join(directory, 'cache')),
+    )
+    engine.load_roster(database)
+    start.wait()
+    latencies = []
+    lost = 0
+    drawn = []
+    for _ in range(draws):
+        winner = engine.pick()
+        if winner is None:
+            break
+        t0 = time.perf_counter()
+        entry = engine.commit_winner(winner)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if entry is None:
+            lost += 1
+        else:
+            drawn.append(entry['winner']['STT'])
+    engine.close()
+    results.put((latencies, lost, drawn))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--stations', type=int, default=4)
+    parser.add_argument('--draws', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'draw.db')
+        store = SQLiteStore(database)
+        t0 = time.perf_counter()
+        store.import_records(
+            {'STT': str(i), 'Name': f"Nguyễn Văn Thành {i}",
+             'Group': GROUPS[i % len(GROUPS)], 'Department': f"DT Team {i % 50}"}
+            for i in range(1, args.size + 1)
+        )
+        store.close()
+        print(f"import {args.size} participants: {time.perf_counter() - t0:.2f}s")
+
+        start = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=station, args=(directory, database, i, args.draws, start, results))
+            for i in range(args.stations)
+        ]
+        for process in processes:
+            process.start()
+        time.sleep(1.0)  # let every station load the pool
+        t0 = time.perf_counter()
+        start.set()
+        outcomes = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - t0
+        for process in processes:
+            process.join()
+
+        latencies = sorted(l for outcome in outcomes for l in outcome[0])
+        lost = sum(outcome[1] for outcome in outcomes)
+        drawn = [stt for outcome in outcomes for stt in outcome[2]]
+        claimed = sqlite3.connect(database).execute(
+            'SELECT COUNT(*) FROM participants WHERE won_seq IS NOT NULL'
+        ).fetchone()[0]
+        print(f"{args.stations} stations x {args.draws} draws in {elapsed:.2f}s")
+        print(f"commit latency p50 {statistics.median(latencies):.2f}ms "
+              f"p95 {latencies[int(len(latencies) * 0.95)]:.2f}ms max {latencies[-1]:.2f}ms")
+        print(f"lost claims {lost}, winners {len(drawn)}, claimed rows {claimed}, "
+              f"duplicates {len(drawn) - len(set(drawn))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+import json
+import socket
+import threading
+import time
+
+DEFAULT_GROUP = '239.255.42.99'
+DEFAULT_PORT = 50042
+MAX_DATAGRAM = 8000
+WINNER_FIELDS = ('STT', 'Name', 'Group', 'Department')
+
+
+def winner_summary(entry):
+    """Return the part of a journal entry display clients need"""
+    winner = entry['winner']
+    summary = {field: winner[field] for field in WINNER_FIELDS if field in winner}
+    summary['time'] = entry.get('time')
+    summary['prize'] = entry.get('prize')
+    return summary
+
+
+def encode(message):
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def multicast_socket(interface='0.0.0.0', ttl=1):
+    """Return a UDP socket that sends to multicast groups on interface"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    if interface != '0.0.0.0':
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+    return sock
+
+
+class BroadcastServer:
+    """Publishes draw state to display clients over UDP multicast.
+
+    publish() only records the latest value of each key and returns, so
+    the Tk thread never waits on the network. A sender thread wakes every
+    interval, coalesces whatever changed since the last frame into one
+    delta datagram, and every keyframe_interval sends the full state so
+    clients that joined late or lost packets can resynchronise. Winners
+    are sent as appends; a keyframe carries only the most recent ones
+    plus the total. Every datagram has a sequence number.
+    """
+
+    def __init__(self, group=DEFAULT_GROUP, port=DEFAULT_PORT, interface='0.0.0.0', ttl=1,
+                 interval=0.05, keyframe_interval=2.0, keyframe_winners=50):
+        self.address = (group, port)
+        self.interface = interface
+        self.ttl = ttl
+        self.interval = interval
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_winners = keyframe_winners
+        self.sequence = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._state = {'phase': 'idle', 'rolling': None, 'winner': None, 'prize': None}
+        self._winners = []
+        self._sent_winners = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._sock = None
+        self._thread = None
+        self._running = False
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Build a server from --broadcast[=group:port], or return None"""
+        for arg in argv[1:]:
+            if arg == '--broadcast':
+                return cls()
+            if arg.startswith('--broadcast='):
+                group, _, port = arg.split('=', 1)[1].partition(':')
+                return cls(group or DEFAULT_GROUP, int(port) if port else DEFAULT_PORT)
+        return None
+
+    def start(self):
+        self._sock = multicast_socket(self.interface, self.ttl)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='broadcast', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+        if self._sock:
+            self._sock.close()
+
+    def publish(self, **changes):
+        """Record state changes; the sender thread ships them on its next frame"""
+        with self._lock:
+            self.coalesced += sum(1 for key in changes if key in self._pending)
+            self._pending.update(changes)
+        self._wake.set()
+
+    def add_winners(self, entries):
+        with self._lock:
+            self._winners.extend(winner_summary(entry) for entry in entries)
+        self._wake.set()
+
+    def set_winners(self, entries):
+        """Replace the winners list, e.g. after replaying or clearing the journal"""
+        with self._lock:
+            self._winners = [winner_summary(entry) for entry in entries]
+            self._sent_winners = None  # forces a full resend
+        self._wake.set()
+
+    def attach(self, engine):
+        """Follow a DrawEngine: rolling candidates and committed winners"""
+        engine.add_candidate_listener(
+            lambda record: self.publish(phase='rolling', rolling=record.get('Name'))
+        )
+        engine.add_listener(self.on_winners_committed)
+        self.set_winners(engine.winner_entries)
+
+    def on_winners_committed(self, entries):
+        self.add_winners(entries)
+        latest = winner_summary(entries[-1])
+        self.publish(phase='winner', rolling=None, winner=latest, prize=latest['prize'])
+
+    def _run(self):
+        next_keyframe = time.monotonic()
+        while self._running:
+            self._wake.wait(self.keyframe_interval)
+            if not self._running:
+                break
+            now = time.monotonic()
+            keyframe = now >= next_keyframe
+            self._send_frame(keyframe)
+            if keyframe:
+                next_keyframe = now + self.keyframe_interval
+            # Anything published while we slept is batched into the next frame
+            time.sleep(self.interval)
+
+    def _send_frame(self, keyframe=False):
+        with self._lock:
+            self._wake.clear()
+            changes = {k: v for k, v in self._pending.items() if self._state.get(k) != v}
+            self._pending = {}
+            self._state.update(changes)
+            winners = self._winners
+            sent_winners = self._sent_winners
+            self._sent_winners = len(winners)
+            state = dict(self._state)
+        if keyframe or sent_winners is None or sent_winners > len(winners):
+            recent = winners[-self.keyframe_winners:]
+            self._send({'type': 'key', 'state': state, 'winners': recent,
+                        'winners_total': len(winners)})
+            if sent_winners is not None and sent_winners < len(winners) - len(recent):
+                # Older appends that did not fit in the keyframe
+                self._send_winners(winners, sent_winners, len(winners) - len(recent))
+            return
+        if changes:
+            self._send({'type': 'delta', 'state': changes})
+        if sent_winners < len(winners):
+            self._send_winners(winners, sent_winners, len(winners))
+
+    def _send_winners(self, winners, start, end):
+        # Keep datagrams well under the fragmentation limit
+        while start < end:
+            chunk = winners[start:start + 40]
+            self._send({'type': 'winners', 'from': start, 'items': chunk})
+            start += len(chunk)
+
+    def _send(self, message):
+        self.sequence += 1
+        message['seq'] = self.sequence
+        data = encode(message)
+        if len(data) > MAX_DATAGRAM and message.get('winners'):
+            message['winners'] = message['winners'][-10:]
+            data = encode(message)
+        try:
+            self._sock.sendto(data, self.address)
+            self.sent += 1
+        except OSError as e:
+            self.errors += 1
+            print(f"Error broadcasting draw state: {e}")
@@ -0,0 +1,94 @@
+"""Minimal display client for the draw broadcast.
+
+Joins the multicast group, applies keyframes, deltas and winner appends
+to a local copy of the draw state, and prints it. Usage:
+
+    python broadcast_client.py [--group 239.255.42.99] [--port 50042]
+"""
+import argparse
+import json
+import socket
+import struct
+from broadcast import DEFAULT_GROUP, DEFAULT_PORT
+
+
+def subscribe(group=DEFAULT_GROUP, port=DEFAULT_PORT, interface='0.0.0.0'):
+    """Return a UDP socket joined to the broadcast group"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, 'SO_REUSEPORT'):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(('', port))
+    membership = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton(interface))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+    return sock
+
+
+class DrawState:
+    """A display client's copy of the draw state"""
+
+    def __init__(self):
+        self.state = {}
+        self.winners = {}  # position in the full winners list -> winner
+        self.winners_total = 0
+        self.last_seq = None
+        self.synced = False
+        self.gaps = 0
+
+    def apply(self, message):
+        """Apply one datagram; returns False if it was stale"""
+        seq = message['seq']
+        if self.last_seq is not None:
+            if seq <= self.last_seq:
+                return False
+            if seq != self.last_seq + 1:
+                self.gaps += 1
+        self.last_seq = seq
+        kind = message['type']
+        if kind == 'key':
+            self.state = message['state']
+            total = message['winners_total']
+            recent = message['winners']
+            if total < self.winners_total:
+                self.winners = {}
+            self.winners_total = total
+            self.winners.update(enumerate(recent, total - len(recent)))
+            self.synced = True
+        elif kind == 'delta':
+            self.state.update(message['state'])
+        elif kind == 'winners':
+            self.winners.update(enumerate(message['items'], message['from']))
+            self.winners_total = max(self.winners_total, message['from'] + len(message['items']))
+        return True
+
+    def recent_winners(self, count=10):
+        return [self.winners[i] for i in sorted(self.winners)[-count:]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--group', default=DEFAULT_GROUP)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--interface', default='0.0.0.0')
+    args = parser.parse_args()
+
+    sock = subscribe(args.group, args.port, args.interface)
+    draw = DrawState()
+    shown = None
+    while True:
+        data, _ = sock.recvfrom(65535)
+        draw.apply(json.loads(data))
+        state = draw.state
+        if state.get('phase') == 'winner' and state.get('winner'):
+            line = f"🏆 {state['winner'].get('Name')} ({state.get('prize')})"
+        elif state.get('phase') == 'rolling':
+            line = f"   {state.get('rolling')}"
+        else:
+            line = f"   Waiting... {draw.winners_total} winners so far"
+        if line != shown:
+            print(line, flush=True)
+            shown = line
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+import json
+import os
+import unicodedata
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from participant_pool import normalize_stt
+from draw_engine import roster_key
+
+_FOLD = str.maketrans({'đ': 'd', 'Đ': 'd'})
+
+
+@lru_cache(maxsize=1 << 16)
+def fold(text):
+    """Return text NFC-normalized, without diacritics, lowercased ("Đặng Thị" -> "dang thi")"""
+    text = unicodedata.normalize('NFD', unicodedata.normalize('NFC', str(text)).translate(_FOLD))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(text.casefold().split())
+
+
+class CheckInIndex:
+    """Type-ahead lookup of participants by folded name or STT.
+
+    Every record contributes its STT and each word-suffix of its folded
+    name ("nguyen van thanh", "van thanh", "thanh") to one sorted key
+    array, which serves as a flattened trie: all keys with a given prefix
+    are a contiguous run found with one bisect, so a lookup costs
+    O(log n + results) regardless of roster size.
+    """
+
+    def __init__(self, records=()):
+        self.records = []
+        self._keys = []
+        self._owners = []
+        self.build(records)
+
+    def build(self, records):
+        self.records = list(records)
+        pairs = []
+        for position, record in enumerate(self.records):
+            pairs.append((normalize_stt(record.get('STT')).casefold(), position))
+            words = fold(record.get('Name', '')).split()
+            for i in range(len(words)):
+                pairs.append((' '.join(words[i:]), position))
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._owners = [position for _, position in pairs]
+
+    def __len__(self):
+        return len(self.records)
+
+    def search(self, query, limit=20):
+        """Return up to limit records whose STT or a name word starts with query"""
+        query = fold(query)
+        if not query:
+            return []
+        keys = self._keys
+        owners = self._owners
+        seen = set()
+        results = []
+        i = bisect_left(keys, query)
+        while i < len(keys) and keys[i].startswith(query):
+            position = owners[i]
+            if position not in seen:
+                seen.add(position)
+                results.append(self.records[position])
+                if len(results) == limit:
+                    break
+            i += 1
+        return results
+
+
+class CheckInDesk:
+    """Who is present, persisted as an append-only JSON-lines log.
+
+    Presence is kept per roster file as a set of STTs that survives
+    restarts; STTs are row numbers, so another roster's check-ins never
+    apply. When required, the DrawEngine shares the current roster's set
+    as its presence filter and each check-in or check-out only adds or
+    drops that one participant from the drawable pool.
+    """
+
+    def __init__(self, engine, path='checkins.jsonl'):
+        self.engine = engine
+        self.path = Path(path)
+        self.roster = None
+        self._present_by_roster = {}
+        self.present = set()
+        self.required = False
+        self.index = CheckInIndex()
+        self._file = None
+        self._replay()
+        self.present = self._present_by_roster.setdefault(None, set())
+
+    def _replay(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line
+                    present = self._present_by_roster.setdefault(entry.get('roster'), set())
+                    if entry.get('op') == 'reset':
+                        present.clear()
+                    elif entry.get('present'):
+                        present.add(entry['stt'])
+                    else:
+                        present.discard(entry.get('stt'))
+        except Exception as e:
+            print(f"Error loading check-ins: {e}")
+
+    def set_roster(self, path):
+        """Switch to the check-ins recorded for another roster file"""
+        self.roster = roster_key(path)
+        self.present = self._present_by_roster.setdefault(self.roster, set())
+        if self.required:
+            self.engine.set_presence_filter(self.present)
+
+    def _log(self, entry):
+        entry['roster'] = self.roster
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            print(f"Error saving check-in: {e}")
+
+    def rebuild_index(self):
+        """Index the current roster (winners included, so they can still check in).
+
+        Safe to call from a worker thread: searches keep using the old
+        index until the new one is swapped in.
+        """
+        winners = [entry['winner'] for entry in self.engine.roster_entries()]
+        self.index = CheckInIndex(list(self.engine.pool) + winners)
+
+    def search(self, query, limit=20):
+        return self.index.search(query, limit)
+
+    def is_present(self, stt):
+        return normalize_stt(stt) in self.present
+
+    def set_present(self, stt, present):
+        stt = normalize_stt(stt)
+        if (stt in self.present) == present:
+            return
+        self._log({'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'stt': stt, 'present': present})
+        if self.required:
+            self.engine.mark_present(stt, present)
+        elif present:
+            self.present.add(stt)
+        else:
+            self.present.discard(stt)
+
+    def toggle(self, stt):
+        """Flip a participant's presence and return the new state"""
+        present = not self.is_present(stt)
+        self.set_present(stt, present)
+        return present
+
+    def reset(self):
+        """Mark everyone on the current roster absent"""
+        self._log({'op': 'reset'})
+        if self.required:
+            for stt in list(self.present):
+                self.engine.mark_present(stt, False)
+        self.present.clear()
+
+    def require(self, required):
+        """Only let checked-in participants be drawn (or lift the restriction)"""
+        self.required = required
+        self.engine.set_presence_filter(self.present if required else None)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
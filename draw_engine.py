@@ -0,0 +1,375 @@
+import os
+from participant_pool import ParticipantPool, normalize_stt
+from roster_cache import RosterCache
+from rules_engine import PrizeRules, RulesEngine
+from winners_journal import WinnersJournal, win_entries
+from excel_writeback import ExcelWriteBack
+from name_ring import NameRing
+from metrics import metrics
+from sqlite_store import SQLiteStore, is_store_path
+
+
+def roster_key(path):
+    """Identify a roster file in journal entries, independent of how it was opened"""
+    if not path:
+        return None
+    return os.path.normcase(os.path.abspath(path))
+
+
+class DrawEngine:
+    """Headless lucky draw: roster, eligibility, picking and persistence.
+
+    Nothing here touches Tk, so the same engine drives the app, scripts
+    and benchmarks. Listeners registered with add_listener are called
+    with the journal entries of every committed draw (the announce hook).
+    A roster opened from a SQLite store is shared with other stations:
+    winners are claimed there first, and sync_store() drops people other
+    stations have drawn.
+
+    Journal entries record the roster they were drawn from, and only
+    winners from the loaded roster are excluded or counted against
+    quotas; a new event with a new roster starts from a clean slate.
+    """
+
+    def __init__(self, journal=None, roster_cache=None, writeback=None, use_cache=True):
+        self.roster_path = None
+        self.store = None
+        self.present = None
+        self._ring_stale = False
+        self._presence_changes = 0
+        self.pool = ParticipantPool()
+        self.winners = []
+        self.winner_entries = []
+        self.prize_rules = PrizeRules()
+        self.rules = RulesEngine(self.pool, self.prize_rules)
+        self.name_ring = NameRing()
+        self.journal = journal or WinnersJournal()
+        self.roster_cache = roster_cache or RosterCache()
+        self.use_cache = use_cache
+        self.writeback = writeback or ExcelWriteBack(
+            on_error=lambda e: print(f"Error updating Excel file: {e}"),
+            on_written=self.roster_cache.invalidate
+        )
+        self._listeners = []
+        self._candidate_listeners = []
+
+    @property
+    def eligible(self):
+        """Participants who may win the current prize"""
+        return self.rules.eligible
+
+    def add_listener(self, callback):
+        """Call callback(entries) after every committed draw"""
+        self._listeners.append(callback)
+
+    def add_candidate_listener(self, callback):
+        """Call callback(record) for every candidate shown while rolling"""
+        self._candidate_listeners.append(callback)
+
+    def load_roster(self, path, progress=None, cancel=None):
+        """Load a roster file, excluding everyone who has already won"""
+        return self.install_roster(path, self.read_roster(path, progress, cancel))
+
+    def read_roster(self, path, progress=None, cancel=None):
+        """Parse a roster without touching engine state; safe on a worker thread.
+
+        progress(rows) is called once per parsed chunk, and setting the
+        cancel event raises LoadCancelled. Returns a value for install_roster.
+        """
+        with metrics.timer('roster_load'):
+            store = None
+            if is_store_path(path):
+                store = SQLiteStore(path)
+                pool = store.load_pool()
+            elif self.use_cache:
+                pool = self.roster_cache.load_roster(path, progress, cancel)
+            else:
+                from roster_import import load_roster
+                pool = load_roster(path, progress, cancel)
+            # Index here too, so the Tk thread only swaps the result in
+            stamp = self._rules_stamp()
+            return pool, store, self._prepare_pool(pool, roster_key(path)), stamp
+
+    def install_roster(self, path, loaded):
+        """Switch to a roster returned by read_roster; call on the owning thread"""
+        pool, store, rules, stamp = loaded
+        self.roster_path = path
+        # Rebuild if winners, prize or presence changed while parsing
+        self.set_pool(pool, rules if stamp == self._rules_stamp() else None)
+        if self.store is not None:
+            self.store.close()
+        self.store = store
+        if store is None:
+            self.writeback.attach(path)
+        metrics.count('participants_loaded', len(self.pool))
+        return len(self.pool)
+
+    def _rules_stamp(self):
+        return (self.prize_rules, len(self.winners), self.present, self._presence_changes)
+
+    def _prepare_pool(self, pool, roster):
+        """Drop journaled winners from a pool and index it for the current prize"""
+        entries = self.roster_entries(roster)
+        for entry in entries:
+            # Winners already journaled must not be drawn again
+            pool.remove(entry['winner'].get('STT'))
+        return RulesEngine(pool, self.prize_rules, self._prize_winners(self.prize_rules, entries), self.present)
+
+    def set_pool(self, pool, rules=None):
+        """Install a participant pool and rebuild the indexes that depend on it"""
+        if rules is None:
+            rules = self._prepare_pool(pool, roster_key(self.roster_path))
+        self.pool = pool
+        self.rules = rules
+        self.name_ring.rebuild_async(self.eligible)
+
+    def apply_roster_diff(self, added=(), removed=(), updated=()):
+        """Apply external roster edits keyed on STT without reloading.
+
+        added and updated are records, removed are STTs. Anyone who has
+        already won is ignored, so an edit can never make them drawable
+        again. Returns (added, removed, updated) counts actually applied.
+        """
+        won = {normalize_stt(e['winner'].get('STT')) for e in self.roster_entries()}
+        counts = [0, 0, 0]
+        for stt in removed:
+            record = self.pool.remove(stt)
+            if record is not None:
+                for closed in self.rules.remove(record):
+                    self.name_ring.discard(closed)
+                counts[1] += 1
+        for record in updated:
+            stt = normalize_stt(record.get('STT'))
+            current = self.pool.get(stt)
+            if current is None or stt in won:
+                continue
+            # Re-index under the new Group/Department and recheck eligibility
+            for closed in self.rules.remove(current):
+                self.name_ring.discard(closed)
+            current.clear()
+            current.update(record)
+            self.rules.add(current)
+            counts[2] += 1
+        for record in added:
+            stt = normalize_stt(record.get('STT'))
+            if not stt or stt in won or stt in self.pool:
+                continue
+            record = dict(record)
+            self.pool.add(record)
+            self.rules.add(record)
+            counts[0] += 1
+        if counts[0] or counts[2]:
+            self._ring_stale = True
+        metrics.count('roster_rows_added', counts[0])
+        metrics.count('roster_rows_removed', counts[1])
+        metrics.count('roster_rows_updated', counts[2])
+        return tuple(counts)
+
+    def load_previous_winners(self):
+        """Replay the winners journal and return its entries"""
+        entries = self.journal.replay()
+        self.winner_entries = entries
+        self.winners = [entry['winner'] for entry in entries]
+        if self.journal.needs_compaction(len(entries)):
+            self.journal.compact(entries)
+        return entries
+
+    def clear_winners(self):
+        """Clear the winners history, e.g. when a new event starts"""
+        self.journal.clear()
+        self.winners = []
+        self.winner_entries = []
+        self.rules.apply(self.prize_rules)
+        self._ring_stale = True
+
+    def roster_entries(self, roster=None):
+        """Journal entries drawn from a roster (default: the loaded one).
+
+        Entries journaled before rosters were recorded match every roster,
+        and with no roster loaded every entry is returned. Rosters marked
+        with same_roster() share their entries.
+        """
+        if roster is None:
+            roster = roster_key(self.roster_path)
+        if roster is None:
+            return list(self.winner_entries)
+        rosters = {roster} | self.journal.aliases.get(roster, set())
+        return [e for e in self.winner_entries if e.get('roster', roster) in rosters]
+
+    def matching_winners(self):
+        """Winners journaled under another roster file whose STT and Name
+        match someone in the loaded roster, e.g. a copy or a re-sent file"""
+        roster = roster_key(self.roster_path)
+        rosters = {roster} | self.journal.aliases.get(roster, set())
+        matches = []
+        for entry in self.winner_entries:
+            if entry.get('roster', roster) in rosters:
+                continue
+            winner = entry['winner']
+            record = self.pool.get(winner.get('STT'))
+            if record is not None and record.get('Name') == winner.get('Name'):
+                matches.append(entry)
+        return matches
+
+    def same_roster(self, entries):
+        """Treat the rosters these entries came from as the loaded one, and
+        exclude their winners; remembered in the journal"""
+        roster = roster_key(self.roster_path)
+        for other in sorted({entry['roster'] for entry in entries}):
+            self.journal.alias(roster, other)
+        self.set_pool(self.pool)
+        if self.store is None:
+            self.writeback.remove_many(entry['winner'].get('STT') for entry in entries)
+
+    def prize_winners(self, rules):
+        """Winners the loaded roster already has for a prize, from the journal"""
+        return self._prize_winners(rules, self.roster_entries())
+
+    @staticmethod
+    def _prize_winners(rules, entries):
+        return [e['winner'] for e in entries if e.get('prize') == rules.name]
+
+    def set_prize_rules(self, rules):
+        """Switch to a new prize and recompute who is eligible"""
+        self.prize_rules = rules
+        self.rules.apply(rules, self.prize_winners(rules))
+        self.name_ring.rebuild_async(self.eligible)
+
+    def set_presence_filter(self, present):
+        """Only let STTs in the present set win; None lets everyone.
+
+        The set is shared, not copied: mark_present() keeps it and the
+        eligible pool in step.
+        """
+        self.present = present
+        self.rules.present = present
+        self.rules.apply(self.prize_rules, self.prize_winners(self.prize_rules))
+        self.name_ring.rebuild_async(self.eligible)
+
+    def mark_present(self, stt, present):
+        """Check one participant in or out, updating only their eligibility"""
+        stt = normalize_stt(stt)
+        if self.present is None:
+            return
+        self._presence_changes += 1
+        if present:
+            self.present.add(stt)
+            record = self.pool.get(stt)
+            if record is not None and stt not in self.eligible and self.rules.is_eligible(record):
+                self.eligible.add(record)
+                self._ring_stale = True  # reshuffled on the next draw
+        else:
+            self.present.discard(stt)
+            if self.eligible.remove(stt) is not None:
+                self.name_ring.discard(stt)
+
+    def next_candidate(self):
+        """Return the eligible index to show on the next animation frame, or
+        None once nobody is eligible (checked out or removed mid-roll)"""
+        if self._ring_stale:
+            self._ring_stale = False
+            self.name_ring.rebuild_async(self.eligible)
+        eligible = self.eligible
+        if not eligible:
+            return None
+        slot = self.name_ring.next()
+        index = eligible.index_of(slot[0]) if slot else None
+        if index is None:
+            # Ring is still being shuffled; fall back to a direct pick
+            index = eligible.random_index()
+        for listener in self._candidate_listeners:
+            listener(eligible[index])
+        return index
+
+    def sync_store(self):
+        """Drop participants other stations have claimed; returns how many"""
+        if self.store is None:
+            return 0
+        dropped = 0
+        for stt in self.store.claimed_since():
+            record = self.pool.remove(stt)
+            if record is not None:
+                for closed in self.rules.remove(record):
+                    self.name_ring.discard(closed)
+                dropped += 1
+        return dropped
+
+    def pick(self):
+        """Return a random eligible participant, or None if nobody is eligible.
+
+        Uniform unless the prize is weighted, exactly like pick_batch().
+        """
+        with metrics.timer('pick'):
+            self.sync_store()
+            if not self.eligible:
+                return None
+            if self.prize_rules.weight_column:
+                winners = self.rules.sample(1, self.prize_rules.weight_column)
+                return winners[0] if winners else None
+            return self.eligible[self.eligible.random_index()]
+
+    def pick_batch(self, count, weight_column=None):
+        """Return up to count distinct eligible winners, honouring quotas.
+
+        Weighted by the prize's weight_column unless one is given here.
+        """
+        if weight_column is None:
+            weight_column = self.prize_rules.weight_column
+        with metrics.timer('pick_batch'):
+            self.sync_store()
+            return self.rules.sample(count, weight_column)
+
+    def commit_winner(self, winner):
+        """Commit a single winner and return its journal entry, or None if
+        another station claimed them first"""
+        entries = self.commit_winners([winner])
+        return entries[0] if entries else None
+
+    def commit_winners(self, winners):
+        """Remove winners from the pool and persist them in one pass.
+
+        With a shared store, winners another station got first are dropped
+        from the pool and left out of the returned entries.
+        """
+        if self.store is not None:
+            requested = len(winners)
+            with metrics.timer('store_claim'):
+                winners = self.store.claim_winners(winners, self.prize_rules.name)
+                self.sync_store()
+            metrics.count('claims_lost', requested - len(winners))
+            if not winners:
+                return []
+        for winner in winners:
+            self.pool.remove(winner.get('STT'))
+            for stt in self.rules.record_winner(winner):
+                self.name_ring.discard(stt)
+        self.winners.extend(winners)
+        try:
+            with metrics.timer('winners_persist'):
+                entries = self.journal.append_many(
+                    winners, self.prize_rules.name, roster_key(self.roster_path)
+                )
+        except Exception as e:
+            print(f"Error saving winners: {e}")
+            entries = win_entries(winners, self.prize_rules.name, roster_key(self.roster_path))
+        self.winner_entries.extend(entries)
+        metrics.count('winners_committed', len(entries))
+        if self.store is None:
+            self.writeback.remove_many(winner.get('STT') for winner in winners)
+        for listener in self._listeners:
+            listener(entries)
+        return entries
+
+    def flush(self, timeout=None):
+        """Wait for queued roster updates to reach the disk"""
+        if not self.writeback.close(timeout):
+            print(f"Roster updates not written: {self.writeback.last_error}")
+            return False
+        return True
+
+    def close(self, timeout=None):
+        flushed = self.flush(timeout)
+        self.journal.close()
+        if self.store is not None:
+            self.store.close()
+        return flushed
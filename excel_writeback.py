@@ -0,0 +1,207 @@
+import csv
+import os
+import threading
+import time
+from pathlib import Path
+from participant_pool import normalize_stt
+from metrics import metrics
+
+
+def is_transient(error):
+    """Whether a failed rewrite is worth retrying (file locked, disk busy)"""
+    return isinstance(error, OSError) and not isinstance(
+        error, (FileNotFoundError, IsADirectoryError, NotADirectoryError)
+    )
+
+
+class ExcelWriteBack:
+    """Background writer that removes drawn participants from the roster file.
+
+    Removals are queued from the UI thread and applied by a worker, which
+    waits briefly so a burst of draws becomes a single rewrite. The new
+    workbook is written to a temporary file and renamed over the original,
+    so a crash mid-write never leaves a half-written roster behind. The
+    .xlsx, .csv and .parquet rosters read by roster_import are supported.
+
+    Removals are queued per file, so switching rosters never discards
+    ones that could not be written yet. I/O errors such as a workbook
+    locked by Excel are retried; anything else (a missing STT header, a
+    deleted or corrupt file) is reported once and the removals are kept
+    in failed instead of being retried forever.
+    """
+
+    def __init__(self, delay=0.5, retry_delay=2.0, on_error=None, on_written=None):
+        self.path = None
+        self.delay = delay
+        self.retry_delay = retry_delay
+        self.on_error = on_error
+        self.on_written = on_written
+        self.last_error = None
+        self.failed = {}  # path -> STTs whose removal failed permanently
+        self._cond = threading.Condition()
+        self._pending = {}  # path -> STTs still to remove
+        self._removed = {}  # path -> STTs already removed from the file
+        self._writing = False
+        self._stopped = False
+        self._thread = None
+
+    def attach(self, path):
+        """Point the writer at a new roster file without waiting.
+
+        Removals still queued for the old file stay queued; the worker
+        writes them after the new file's.
+        """
+        with self._cond:
+            self.path = path
+            self._cond.notify_all()
+
+    def removed_from(self, path):
+        """STTs this writer has taken out of path so far"""
+        with self._cond:
+            return frozenset(self._removed.get(path, ()))
+
+    def remove(self, stt):
+        """Queue a participant's removal from the roster file"""
+        self.remove_many([stt])
+
+    def remove_many(self, stts):
+        """Queue several removals to be written together"""
+        with self._cond:
+            if self.path is None:
+                return
+            self._pending.setdefault(self.path, set()).update(normalize_stt(stt) for stt in stts)
+            self._cond.notify_all()
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout=None):
+        """Block until every queued removal is written; False on timeout or if any failed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self.failed
+
+    def close(self, timeout=None):
+        """Flush pending removals and stop the worker"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        return flushed
+
+    def _report(self, error):
+        self.last_error = error
+        if self.on_error:
+            self.on_error(error)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped and not self._pending:
+                    self._thread = None
+                    return
+            # Give a burst of draws a moment to pile up into one write
+            time.sleep(self.delay)
+            with self._cond:
+                if not self._pending:
+                    continue
+                path = self.path if self.path in self._pending else next(iter(self._pending))
+                batch = self._pending.pop(path)
+                self._writing = True
+            retry = False
+            try:
+                with metrics.timer('excel_writeback'):
+                    self._rewrite(path, batch)
+                self.last_error = None
+            except Exception as e:
+                retry = is_transient(e)
+                with self._cond:
+                    if retry:
+                        self._pending.setdefault(path, set()).update(batch)
+                    else:
+                        self.failed.setdefault(path, set()).update(batch)
+                self._report(e)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+            if retry:
+                time.sleep(self.retry_delay)
+
+    def _rewrite(self, path, removed):
+        """Rewrite the roster without the removed rows, atomically"""
+        suffix = Path(path).suffix.lower()
+        writer = {
+            '.csv': self._write_csv,
+            '.parquet': self._write_parquet,
+        }.get(suffix, self._write_xlsx)
+        tmp_path = f"{path}.tmp"
+        if not writer(path, tmp_path, removed):
+            return
+        with open(tmp_path, 'rb+') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        with self._cond:
+            self._removed.setdefault(path, set()).update(removed)
+        if self.on_written:
+            self.on_written(path)
+
+    def _write_xlsx(self, path, tmp_path, removed):
+        """Stream the workbook into a new one without the removed rows"""
+        from openpyxl import Workbook, load_workbook
+
+        source = load_workbook(path, read_only=True)
+        try:
+            sheet = source.active
+            target = Workbook(write_only=True)
+            target_sheet = target.create_sheet(sheet.title)
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return False
+            stt_column = list(header).index('STT')
+            target_sheet.append(header)
+            for row in rows:
+                stt = row[stt_column] if stt_column < len(row) else None
+                if normalize_stt(stt) not in removed:
+                    target_sheet.append(row)
+        finally:
+            source.close()
+        target.save(tmp_path)
+        return True
+
+    def _write_csv(self, path, tmp_path, removed):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as source, \
+                open(tmp_path, 'w', encoding='utf-8-sig', newline='') as target:
+            rows = csv.reader(source)
+            header = next(rows, None)
+            if header is None:
+                return False
+            stt_column = header.index('STT')
+            writer = csv.writer(target)
+            writer.writerow(header)
+            for row in rows:
+                stt = row[stt_column] if stt_column < len(row) else None
+                if normalize_stt(stt) not in removed:
+                    writer.writerow(row)
+        return True
+
+    def _write_parquet(self, path, tmp_path, removed):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        stt = pc.utf8_trim_whitespace(pc.cast(table['STT'], pa.string()))
+        keep = pc.invert(pc.is_in(stt, value_set=pa.array(sorted(removed), pa.string())))
+        pq.write_table(table.filter(pc.fill_null(keep, True)), tmp_path)
+        return True
@@ -1,82 +1,92 @@
-import pandas as pd
-import json
-from pathlib import Path
 from tkinter import filedialog, messagebox
+import queue
 import threading
+from roster_import import ROSTER_FILETYPES, LoadCancelled
 
 class FileOperations:
-    def __init__(self):
-        self.excel_path = None
-        self.participants = []
-        self.winners = []
+    """Tk front end for roster files: file dialogs and error popups.
 
-    def load_excel_file(self):
-        """Load and validate Excel file"""
-        try:
-            file_path = filedialog.askopenfilename(
-                filetypes=[("Excel files", "*.xlsx")]
-            )
-            if not file_path:
-                return
-            # Load necessary columns, handle missing columns
-            df = pd.read_excel(file_path, dtype=str)
-            if 'STT' not in df.columns or 'Name' not in df.columns:
-                raise ValueError("Required columns 'STT' and 'Name' not found")
-            self.excel_path = file_path
-            self.participants = df.to_dict('records')
-            return len(self.participants)
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"Error loading file: {str(e)}"
-            )
-            return 0
+    All roster, winner and persistence state lives in the DrawEngine.
+    """
+
+    def __init__(self, engine, root=None, poll_interval=50):
+        self.engine = engine
+        self.root = root
+        self.poll_interval = poll_interval
+
+    @property
+    def excel_path(self):
+        return self.engine.roster_path
+
+    def choose_roster_file(self):
+        """Ask the host for a roster file; returns '' if cancelled"""
+        return filedialog.askopenfilename(filetypes=ROSTER_FILETYPES)
+
+    def load_excel_file_async(self, on_progress=None, on_complete=None, file_path=None):
+        """Choose a roster on the Tk thread and parse it on a worker.
+
+        The worker only parses and posts messages to a queue; the Tk thread
+        drains it with root.after, reporting on_progress(rows) and finally
+        installing the roster and calling on_complete(num_participants)
+        (0 if cancelled or failed). Pass file_path to reload a roster
+        without asking. Returns an Event that cancels the load, or None if
+        no file was chosen.
+        """
+        file_path = file_path or self.choose_roster_file()
+        if not file_path:
+            return None
+        cancel = threading.Event()
+        messages = queue.Queue()
 
-    def load_excel_file_async(self, on_complete):
-        """Load Excel in a background thread, then invoke on_complete."""
         def worker():
-            num_participants = self.load_excel_file()
-            on_complete(num_participants)
-        threading.Thread(target=worker, daemon=True).start()
+            try:
+                loaded = self.engine.read_roster(
+                    file_path, lambda rows: messages.put(('progress', rows)), cancel
+                )
+            except LoadCancelled:
+                messages.put(('cancelled', None))
+            except Exception as e:
+                messages.put(('error', e))
+            else:
+                messages.put(('loaded', loaded))
 
-    def update_excel_file(self, winner):
-        """Update Excel file and save winners"""
-        try:
-            df = pd.read_excel(self.excel_path)
-            df = df[df['STT'] != winner['STT']]
-            df.to_excel(self.excel_path, index=False)
-            self.save_winners()
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"Error updating Excel file: {str(e)}"
-            )
+        def poll():
+            rows = None
+            while True:
+                try:
+                    kind, value = messages.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'progress':
+                    rows = value  # only the latest count matters
+                    continue
+                finish(kind, value)
+                return
+            if rows is not None and on_progress:
+                on_progress(rows)
+            self.root.after(self.poll_interval, poll)
 
-    def save_winners(self):
-        """Save winners to JSON file"""
-        try:
-            with open('winners.json', 'w', encoding='utf-8') as f:
-                json.dump(self.winners, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            print(f"Error saving winners: {e}")
+        def finish(kind, value):
+            count = 0
+            if kind == 'loaded':
+                if cancel.is_set():
+                    if value[1] is not None:
+                        value[1].close()
+                else:
+                    count = self.engine.install_roster(file_path, value)
+            elif kind == 'error':
+                messagebox.showerror("Error", f"Error loading file: {str(value)}")
+            if on_complete:
+                on_complete(count)
+
+        threading.Thread(target=worker, name='roster-load', daemon=True).start()
+        self.root.after(self.poll_interval, poll)
+        return cancel
 
     def load_previous_winners(self):
-        """Load previously saved winners"""
+        """Replay the winners journal and return its entries"""
         try:
-            if Path('winners.json').exists():
-                with open('winners.json', 'r') as f:
-                    self.winners = json.load(f)
-                    return self.winners
+            return self.engine.load_previous_winners()
         except Exception as e:
             print(f"Error loading winners: {e}")
             return []
-
-    def clear_winners_file(self):
-        with open('winners.json', 'w', encoding='utf-8') as f:
-            json.dump([], f, ensure_ascii=False, indent=4)
-
-    def save_participants_to_excel(self):
-        if not self.excel_path:
-            return
-        df = pd.DataFrame(self.participants)
-        df.to_excel(self.excel_path, index=False)
@@ -0,0 +1,102 @@
+import os
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+class BackgroundImage:
+    """Window-sized background bitmaps resampled once per resolution.
+
+    The source image is decoded and resized on a worker thread, and each
+    variant is cached on disk as a PPM, which Tk loads natively without
+    PIL. Later launches and window resizes reuse the cached variants
+    instead of decoding the source again.
+    """
+
+    def __init__(self, root, label, source_path, cache_dir='.image_cache', poll_interval=50):
+        self.root = root
+        self.label = label
+        self.source_path = Path(source_path)
+        self.cache_dir = Path(cache_dir)
+        self.poll_interval = poll_interval
+        self._photos = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._wanted = None
+        self._resize_job = None
+
+    def _variant_path(self, size):
+        stat = self.source_path.stat()
+        width, height = size
+        name = f"{self.source_path.stem}_{width}x{height}_{stat.st_size}_{stat.st_mtime_ns}.ppm"
+        return self.cache_dir / name
+
+    def show(self, width, height):
+        """Display the background at the given size, rendering it if needed"""
+        size = (max(1, int(width)), max(1, int(height)))
+        self._wanted = size
+        if size in self._photos:
+            self.label.config(image=self._photos[size])
+            return
+        try:
+            path = self._variant_path(size)
+        except OSError as e:
+            print(f"Background image not available: {e}")
+            return
+        if path.exists():
+            self._display(size, path)
+            return
+        future = self._executor.submit(self._render, path, size)
+        self.root.after(self.poll_interval, self._wait_for, future, size, path)
+
+    def show_for_screen(self):
+        self.show(self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+
+    def _render(self, path, size):
+        from PIL import Image
+
+        with Image.open(self.source_path) as image:
+            resized = image.convert('RGB').resize(size, Image.LANCZOS)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        resized.save(tmp_path, format='PPM')
+        os.replace(tmp_path, path)
+
+    def _wait_for(self, future, size, path):
+        if not future.done():
+            self.root.after(self.poll_interval, self._wait_for, future, size, path)
+            return
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Error loading background image: {e}")
+            return
+        if size == self._wanted:
+            self._display(size, path)
+
+    def _display(self, size, path):
+        try:
+            photo = tk.PhotoImage(file=str(path))
+        except tk.TclError as e:
+            print(f"Error loading background image: {e}")
+            return
+        self._photos[size] = photo
+        self.label.config(image=photo)
+
+    def bind_resize(self, delay=200):
+        """Follow window resizes, settling on the final size before rendering"""
+        def on_configure(event):
+            if event.widget is not self.root:
+                return
+            if self._resize_job is not None:
+                self.root.after_cancel(self._resize_job)
+            self._resize_job = self.root.after(delay, self._apply_resize)
+        self.root.bind('<Configure>', on_configure, add='+')
+
+    def _apply_resize(self):
+        self._resize_job = None
+        size = (self.root.winfo_width(), self.root.winfo_height())
+        if size != self._wanted and min(size) > 1:
+            self.show(*size)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,50 +1,118 @@
 import os
 import sys
+import multiprocessing
+import threading
+from startup_profiler import StartupProfiler
+
+# Created before the other imports so --profile-startup can time them
+profiler = StartupProfiler.from_argv(sys.argv)
+
 import tkinter as tk
 from tkinter import messagebox
-from datetime import datetime
-import random
 from audio_handler import AudioHandler
 from ui_components import UIComponents
 from file_operations import FileOperations
-from PIL import Image, ImageTk
+from draw_engine import DrawEngine
+from image_assets import BackgroundImage
+from rules_engine import PrizeRules, WEIGHT_COLUMN
+from animation_scheduler import AnimationScheduler, FrameTimings
+from reveal_effects import RevealEffects
+from broadcast import BroadcastServer
+from metrics import metrics, export_options_from_argv
+from metrics_overlay import MetricsOverlay
+from checkin import CheckInDesk
+from roster_watcher import RosterWatcher
+from winners_report import WinnersReport
+
+profiler.mark('imports')
 
 class ModernLuckyDraw:
-    def __init__(self, root):
+    def __init__(self, root, profiler=None, broadcast=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         self.root.title("Lucky Draw FIS DT HCM")
         self.root.attributes('-fullscreen', True)  # Set to full screen by default
         
         # Initialize modules
         self.audio_handler = AudioHandler(root)
-        self.file_operations = FileOperations()
-        self.file_operations.clear_winners_file()
+        self.engine = DrawEngine()
+        self.winners_report = WinnersReport()
+        self.engine.add_listener(self.winners_report.add)
+        self.broadcast = broadcast
+        if broadcast is not None:
+            broadcast.attach(self.engine)
+            broadcast.start()
+        self.file_operations = FileOperations(self.engine, root)
+        self.roster_load = None
+        self.checkin = CheckInDesk(self.engine)
+        self.roster_watcher = RosterWatcher(root, self.engine, on_applied=self.on_roster_edited)
         self.ui_components = UIComponents(root, self.get_colors())
+        self.profiler.mark('modules')
         
         # Set background image
         self.set_background_image()
-        
-        # Setup audio
-        self.audio_handler.setup_audio()
+        self.profiler.mark('background image')
         
         self.is_drawing = False
         self.animation_speed = 50
         self.current_participant = None
+        self.current_participant_index = None
         self.current_participant_name = ""  # Khởi tạo thuộc tính này
+        self.chosen_winner = None
+        self.slowdown_ms = 3000
+        self.frame_timings = FrameTimings()
+        self.animation = AnimationScheduler(
+            root, self.animate_selection, self.animation_speed, self.frame_timings, name='rolling'
+        )
+        self.reveal_interval = 1500
+        self.reveal_job = None
+        self.reveal_pending = []
         
         # Setup UI
         self.ui_components.setup_styles()
         self.ui_components.create_ui()
-        self.load_previous_winners()
         self.ui_components.file_label.config(text="No file loaded") 
+        self.reveal_effects = RevealEffects(
+            root, self.ui_components.name_label, self.ui_components.colors
+        )
         # Bind buttons to methods
         self.ui_components.file_btn.config(command=self.load_excel_file)
+        self.ui_components.cancel_load_btn.config(command=self.cancel_roster_load)
+        self.ui_components.rules_btn.config(command=self.edit_prize_rules)
+        self.ui_components.checkin_btn.config(command=self.open_checkin)
+        self.ui_components.new_event_btn.config(command=self.new_event)
         self.ui_components.start_btn.config(command=self.start_draw)
         self.ui_components.stop_btn.config(command=self.stop_draw)
         self.ui_components.next_btn.config(command=self.next_round)
+        self.ui_components.reveal_all_btn.config(command=self.reveal_all)
         
         # Bind ESC key to exit
         self.root.bind("<Escape>", self.exit_program)
+        # F12 shows live hot-path timings
+        self.metrics_overlay = MetricsOverlay(root, metrics, self.ui_components.colors)
+        self.metrics_export = export_options_from_argv(sys.argv)
+        if self.metrics_export:
+            metrics.start_export(**self.metrics_export)
+        self.profiler.mark('ui')
+        
+        # Everything else waits until the window has been drawn
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        """Load audio and previous winners once the first frame is up"""
+        self.profiler.first_frame()
+        self.audio_handler.setup_audio()
+        self.load_previous_winners()
+        self.profiler.mark('previous winners')
+        self.root.after(100, self.finish_profile)
+
+    def finish_profile(self, waited=0):
+        """Close the startup profile once background audio loading is done"""
+        if not self.audio_handler.audio_ready.is_set() and waited < 10000:
+            self.root.after(100, self.finish_profile, waited + 100)
+            return
+        self.profiler.mark('audio ready')
+        self.profiler.finish()
         
     def get_colors(self):
         """Return color scheme"""
@@ -58,36 +126,184 @@ class ModernLuckyDraw:
             'silver': '#C0C0C0'
         }
         
-    def load_excel_file(self):
-        """Load participants from Excel file"""
-        num_participants = self.file_operations.load_excel_file()
-        self.update_file_label(num_participants)
-        if num_participants > 0:
-            self.ui_components.start_btn.config(state='normal')
+    def load_excel_file(self, file_path=None):
+        """Choose a roster and load it without blocking the window"""
+        if self.roster_load is not None:
+            return
+        self.roster_load = self.file_operations.load_excel_file_async(
+            self.on_roster_progress, self.on_roster_loaded, file_path
+        )
+        if self.roster_load is None:
+            return
+        ui = self.ui_components
+        ui.file_btn.config(state='disabled')
+        ui.start_btn.config(state='disabled')
+        ui.file_label.config(text="⏳ Loading participants...")
+        ui.cancel_load_btn.pack(side='left')
+
+    def on_roster_progress(self, rows):
+        self.ui_components.file_label.config(text=f"⏳ Loading participants... {rows:,} rows")
+
+    def cancel_roster_load(self):
+        if self.roster_load is not None:
+            self.roster_load.set()
+            self.ui_components.file_label.config(text="⏳ Cancelling...")
+
+    def on_roster_loaded(self, num_participants):
+        """Roster load finished, failed or was cancelled"""
+        self.roster_load = None
+        ui = self.ui_components
+        ui.cancel_load_btn.pack_forget()
+        ui.file_btn.config(state='normal')
+        if num_participants == 0:
+            # Keep whatever roster was loaded before
+            if len(self.engine.pool):
+                self.update_file_label(len(self.engine.pool))
+                ui.start_btn.config(state='normal')
+            else:
+                ui.file_label.config(text="No file loaded")
+            return
+        self.confirm_matching_winners()
+        self.update_file_label(len(self.engine.pool))
+        self.checkin.set_roster(self.engine.roster_path)
+        self.winners_report.reconcile(self.engine.roster_entries())
+        self.roster_watcher.watch(self.engine.roster_path, self.engine.pool)
+        self.audio_handler.prerender_announcements(self.engine.pool)
+        self.root.after(500, self.poll_prerender_progress)
+        ui.start_btn.config(state='normal')
+        threading.Thread(target=self.checkin.rebuild_index, name='checkin-index', daemon=True).start()
+
+    def confirm_matching_winners(self):
+        """Ask whether earlier winners found in a differently named roster are the same people"""
+        matches = self.engine.matching_winners()
+        if not matches:
+            return
+        sources = sorted({os.path.basename(entry['roster']) for entry in matches})
+        if messagebox.askyesno(
+            "Earlier Winners",
+            f"{len(matches)} people in this roster already won while "
+            f"{', '.join(sources)} was loaded (same STT and name).\n\n"
+            "Is this the same event? Choose Yes to keep them from winning again, "
+            "or No if this is a new event with different people."
+        ):
+            self.engine.same_roster(matches)
+
+    def on_roster_edited(self, counts):
+        """HR changed the roster file; the pool has been updated in place"""
+        self.update_file_label(len(self.engine.pool))
+        if counts[0] or counts[2]:
+            # New or renamed people need their announcement rendered
+            self.audio_handler.prerender_announcements(self.engine.pool)
+        threading.Thread(target=self.checkin.rebuild_index, name='checkin-index', daemon=True).start()
+
+    def open_checkin(self):
+        """Open the check-in desk for marking attendees present"""
+        self.ui_components.open_checkin_dialog(
+            self.checkin,
+            lambda: self.update_file_label(len(self.engine.pool))
+        )
+
+    def new_event(self):
+        """Clear the winners history, after confirmation, and reload the roster"""
+        if self.is_drawing or self.roster_load is not None or self.reveal_job is not None:
+            messagebox.showwarning("Warning", "Finish the current draw or roster load first!")
+            return
+        count = len(self.engine.winner_entries)
+        if not messagebox.askyesno(
+            "New Event",
+            f"Clear all {count} winners and check-ins and start a new event?\n\n"
+            "Everyone left in the roster file can win again. "
+            "People already removed from the file stay removed."
+        ):
+            return
+        self.engine.clear_winners()
+        self.checkin.reset()
+        self.ui_components.winners_view.set_entries([])
+        if self.broadcast is not None:
+            self.broadcast.set_winners([])
+        self.next_round()
+        if self.engine.roster_path:
+            # Winners were taken out of the pool; reread it so they are back
+            self.load_excel_file(self.engine.roster_path)
+        else:
+            self.update_file_label(len(self.engine.pool))
+
+    def edit_prize_rules(self):
+        """Let the host pick the prize and its eligibility rules"""
+        self.ui_components.open_rules_dialog(
+            self.engine.rules.groups,
+            self.engine.prize_rules,
+            self.apply_prize_rules,
+            can_weight=bool(self.engine.pool) and WEIGHT_COLUMN in self.engine.pool[0]
+        )
+
+    def apply_prize_rules(self, name, group, max_per_department, weighted=False):
+        """Recompute the drawable set for a new prize"""
+        rules = PrizeRules(
+            name,
+            groups=[group] if group else None,
+            max_per_department=max_per_department,
+            weight_column=WEIGHT_COLUMN if weighted else None
+        )
+        self.engine.set_prize_rules(rules)
+        self.ui_components.prize_label.config(text=rules.name)
+        self.update_file_label(len(self.engine.pool))
 
     def update_file_label(self, num_participants):
         """Update the file label with the number of participants loaded"""
-        self.ui_components.file_label.config(
-            text=f"✅ Loaded {num_participants} participants"
-        )
+        text = f"✅ Loaded {num_participants} participants"
+        rules = self.engine.prize_rules
+        if rules.groups or rules.departments or rules.has_quotas or rules.weight_column:
+            text += f"  ·  🎯 {len(self.engine.eligible)} eligible ({rules.describe()})"
+        done, total = self.audio_handler.prerender_progress
+        if total and done < total:
+            text += f"  ·  🔊 Preparing announcements {done}/{total}"
+        self.ui_components.file_label.config(text=text)
+
+    def poll_prerender_progress(self):
+        """Refresh the announcement pre-render progress until it completes"""
+        self.update_file_label(len(self.engine.pool))
+        done, total = self.audio_handler.prerender_progress
+        if done < total:
+            self.root.after(500, self.poll_prerender_progress)
         
     def start_draw(self):
         """Start the drawing process with music"""
-        if not self.file_operations.participants:
+        if not self.engine.pool:
             messagebox.showwarning("Warning", "Please load participants first!")
             return
+        if not self.engine.eligible:
+            messagebox.showwarning("Warning", "No participants are eligible for this prize!")
+            return
         self.is_drawing = True
         self.ui_components.start_btn.config(state='disabled')
         self.ui_components.stop_btn.config(state='normal')
-        self.animation_speed = 50
         self.audio_handler.play_background_music()
-        self.animate_selection()
+        self.animation.start()
         
     def stop_draw(self):
-        """Stop the drawing process and music"""
+        """Slow the rolling names down until they land on the winner"""
         self.ui_components.stop_btn.config(state='disabled')
-        self.audio_handler.reduce_volume()
-        self.root.after(3000, self.finish_selection)
+        self.audio_handler.reduce_volume(self.slowdown_ms)
+        self.chosen_winner = None if self.get_batch_size() > 1 else self.engine.pick()
+        self.animation.decelerate(self.slowdown_ms, self.land_on_winner)
+
+    def abort_draw(self):
+        """Stop rolling because nobody is left to draw"""
+        self.is_drawing = False
+        self.ui_components.stop_btn.config(state='disabled')
+        self.next_round()
+        messagebox.showwarning("Warning", "No participants are eligible for this prize!")
+
+    def land_on_winner(self):
+        """Final animation frame: show the chosen winner"""
+        if self.chosen_winner is not None:
+            self.current_participant_name = self.chosen_winner['Name']
+            self.ui_components.name_label.config(
+                text=self.current_participant_name,
+                fg=self.ui_components.colors['text']
+            )
+        self.finish_selection()
         
     def finish_selection(self):
         """Complete drawing process"""
@@ -95,44 +311,102 @@ class ModernLuckyDraw:
         self.root.after(100, self._finish_selection)
 
     def _finish_selection(self):
-        winner_record = next(
-            x for x in self.file_operations.participants 
-            if x['Name'] == self.current_participant_name
-        )
-        self.file_operations.winners.append(winner_record)
-        self.file_operations.participants.remove(winner_record)
+        with metrics.timer('finish_selection'):
+            self._commit_selection()
+
+    def _commit_selection(self):
+        """Commit the drawn winner(s) and start the reveal"""
+        batch_size = self.get_batch_size()
+        if batch_size > 1:
+            self._finish_batch(batch_size)
+            return
+        chosen = self.chosen_winner
+        self.chosen_winner = None
+        winner_record = chosen and self.engine.eligible.get(chosen['STT'])
+        entry = self.engine.commit_winner(winner_record) if winner_record else None
+        while entry is None:
+            # Became ineligible during the slowdown, or another station claimed them
+            winner_record = self.engine.pick()
+            if winner_record is None:
+                break
+            entry = self.engine.commit_winner(winner_record)
         self.audio_handler.stop_background_music()
+        if entry is None:
+            messagebox.showwarning("Warning", "No participants are eligible for this prize!")
+            self.next_round()
+            return
+        self.audio_handler.play_fanfare()
+        # Only single draws are read out; batch reveals are not
+        self.audio_handler.announce_winner(entry['winner'])
         
-        winner_text = winner_record['Name'].encode('utf-8').decode('utf-8')
-        if 'Group' in winner_record and 'Department' in winner_record:
-            winner_text += f"\n{winner_record['Group'].encode('utf-8').decode('utf-8')} - {winner_record['Department'].encode('utf-8').decode('utf-8')}"
+        winner_text = self.format_winner(winner_record)
         
-        self.fade_in_text(winner_text)
-        self.ui_components.winners_list.insert(
-            0,
-            f"🏆 {datetime.now().strftime('%Y-%m-%d %H:%M')} - {winner_text}"
-        )
-        self.file_operations.update_excel_file(winner_record)
-        self.file_operations.save_participants_to_excel()
-        self.update_file_label(len(self.file_operations.participants))
+        self.reveal_effects.reveal(winner_text)
+        self.ui_components.winners_view.add(entry)
+        self.update_file_label(len(self.engine.pool))
         self.ui_components.next_btn.config(state='normal')
-        self.audio_handler.announce_winner(winner_record)
-        self.audio_handler.cleanup_winner_audio()
 
-    def fade_in_text(self, text, step=0):
-        """Fade in the text by gradually increasing the opacity"""
-        if step > 10:
+    def get_batch_size(self):
+        """Return how many winners the current draw should produce"""
+        try:
+            return max(1, int(self.ui_components.batch_size.get()))
+        except ValueError:
+            return 1
+
+    def _finish_batch(self, batch_size):
+        """Draw several winners in one pass and reveal them one by one"""
+        entries = []
+        while len(entries) < batch_size:
+            # Top up if another station claimed some of the picks first
+            winners = self.engine.pick_batch(batch_size - len(entries))
+            if not winners:
+                break
+            entries += self.engine.commit_winners(winners)
+        self.audio_handler.stop_background_music()
+        if entries:
+            self.audio_handler.play_fanfare()
+        self.update_file_label(len(self.engine.pool))
+        self.reveal_winners(entries, 1, len(entries))
+
+    def reveal_winners(self, pending, position, total):
+        """Show precomputed batch winners in sequence"""
+        self.reveal_job = None
+        self.reveal_pending = pending
+        if not pending:
+            self.ui_components.reveal_all_btn.config(state='disabled')
+            self.ui_components.next_btn.config(state='normal')
             return
-        alpha = int(255 * (step / 10))
-        self.ui_components.name_label.config(
-            text=text,
-            fg=self.ui_components.colors['gold']
+        entry = pending.pop(0)
+        winner_text = self.format_winner(entry['winner'])
+        self.reveal_effects.reveal(f"{winner_text}\n({position}/{total})")
+        self.ui_components.winners_view.add(entry)
+        self.ui_components.reveal_all_btn.config(state='normal' if pending else 'disabled')
+        self.reveal_job = self.root.after(
+            self.reveal_interval, self.reveal_winners, pending, position + 1, total
         )
-        self.ui_components.name_label.update_idletasks()
-        self.root.after(50, self.fade_in_text, text, step + 1)
-        
+
+    def reveal_all(self):
+        """Skip the rest of a batch reveal and list the remaining winners at once"""
+        if self.reveal_job is None:
+            return
+        self.root.after_cancel(self.reveal_job)
+        pending = self.reveal_pending
+        if pending:
+            self.ui_components.winners_view.add_many(pending)
+            self.reveal_effects.reveal(f"+{len(pending)} more winners\nsee the gallery")
+            pending.clear()
+        self.reveal_winners(pending, 0, 0)
+
+    def format_winner(self, winner_record):
+        """Return the display text for a winner"""
+        winner_text = str(winner_record['Name'])
+        if 'Group' in winner_record and 'Department' in winner_record:
+            winner_text += f"\n{winner_record['Group']} - {winner_record['Department']}"
+        return winner_text
+
     def next_round(self):
         """Prepare for next round"""
+        self.reveal_effects.cancel()
         self.ui_components.name_label.config(
             text="Ready for Next Draw",
             fg=self.ui_components.colors['text']
@@ -140,30 +414,35 @@ class ModernLuckyDraw:
         self.ui_components.start_btn.config(state='normal')
         self.ui_components.next_btn.config(state='disabled')
         self.audio_handler.stop_background_music()
+        if self.broadcast is not None:
+            self.broadcast.publish(phase='idle', winner=None)
         
     def animate_selection(self):
-        """Animate the name selection with visual effects"""
-        if not self.is_drawing:
+        """Show the next rolling name; called by the animation scheduler"""
+        index = self.engine.next_candidate()
+        if index is None:
+            # Everyone left was checked out or removed from the roster mid-roll
+            if not self.animation.land_now():
+                self.abort_draw()
             return
-        name_only_list = [p['Name'] for p in self.file_operations.participants]
-        self.current_participant_name = random.choice(name_only_list)
+        self.current_participant_index = index
+        self.current_participant_name = self.engine.eligible[index]['Name']
         self.ui_components.name_label.config(
             text=self.current_participant_name,
             fg=self.ui_components.colors['text']
         )
-        self.ui_components.name_label.update_idletasks()
-        self.root.after(self.animation_speed, self.animate_selection)
         
     def load_previous_winners(self):
         """Load previously saved winners"""
         winners = self.get_winners_from_file()
         if winners is None:
             winners = []
-        for winner in winners:
-            self.ui_components.winners_list.insert(
-                0,
-                f"🏆 {winner}"
-            )
+        self.ui_components.winners_view.set_entries(winners)
+        if winners:
+            # Only the event that was running, identified by its roster
+            self.winners_report.reconcile(self.engine.roster_entries(winners[-1].get('roster')))
+        if self.broadcast is not None:
+            self.broadcast.set_winners(winners)
             
     def get_winners_from_file(self):
         """Get winners from file"""
@@ -178,17 +457,40 @@ class ModernLuckyDraw:
         # Get the absolute path to the image
         base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
         image_path = os.path.join(base_path, 'assets', 'backGround.png')
-        self.background_image = Image.open(image_path)
-        self.background_photo = ImageTk.PhotoImage(self.background_image)
-        self.background_label = tk.Label(self.root, image=self.background_photo)
+        self.background_label = tk.Label(self.root, bg=self.get_colors()['bg'])
         self.background_label.place(relwidth=1, relheight=1)
         self.background_label.lower()
+        # Decoded and resized off-thread, then cached per resolution
+        self.background_image = BackgroundImage(self.root, self.background_label, image_path)
+        self.background_image.show_for_screen()
+        self.background_image.bind_resize()
         
     def exit_program(self, event):
         """Exit the program"""
         self.root.quit()
 
+    def shutdown(self):
+        """Flush pending writes once the main loop has ended"""
+        if self.frame_timings.frames:
+            self.frame_timings.export_json('frame_timings.json')
+        self.background_image.shutdown()
+        self.audio_handler.cancel_prerender()
+        self.audio_handler.announcer.shutdown()
+        self.audio_handler.shutdown()
+        self.roster_watcher.stop()
+        self.engine.close(timeout=30)
+        self.winners_report.close(timeout=30)
+        self.checkin.close()
+        if self.broadcast is not None:
+            self.broadcast.stop()
+        if self.metrics_export:
+            metrics.stop_export()
+            metrics.export(self.metrics_export.get('json_path'), self.metrics_export.get('textfile_path'))
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # pre-render workers in the frozen exe
     root = tk.Tk()
-    app = ModernLuckyDraw(root)
-    root.mainloop()
\ No newline at end of file
+    profiler.mark('tk init')
+    app = ModernLuckyDraw(root, profiler, BroadcastServer.from_argv(sys.argv))
+    root.mainloop()
+    app.shutdown()
\ No newline at end of file
@@ -0,0 +1,173 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+
+class TimerStats:
+    """Count, total and recent samples for one timed operation"""
+
+    def __init__(self, window=1024):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.recent.append(seconds)
+
+    def quantile(self, fraction):
+        samples = sorted(self.recent)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else 0.0
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'last_ms': round(self.last * 1000, 3),
+            'p50_ms': round(self.quantile(0.5) * 1000, 3),
+            'p95_ms': round(self.quantile(0.95) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class _Timer:
+    __slots__ = ('metrics', 'name', 'started')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.started)
+        if exc_type is not None:
+            self.metrics.count(f"{self.name}_errors")
+        return False
+
+
+class Metrics:
+    """Named timers and counters for the draw's hot paths.
+
+    Recording is a dict lookup and an append under a lock, cheap enough
+    for every animation frame. Timers keep a window of recent samples for
+    p50/p95. The registry exports as a JSON report or as a Prometheus
+    textfile, which a node_exporter textfile collector can scrape.
+    """
+
+    def __init__(self, prefix='luckydraw'):
+        self.prefix = prefix
+        self.started = time.time()
+        self.timers = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._exporter = None
+
+    def timer(self, name):
+        """Context manager timing a block; exceptions also count name_errors"""
+        return _Timer(self, name)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stats = self.timers.get(name)
+            if stats is None:
+                stats = self.timers[name] = TimerStats()
+            stats.add(seconds)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'uptime_s': round(time.time() - self.started, 3),
+                'timers': {name: stats.as_dict() for name, stats in sorted(self.timers.items())},
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def _metric_name(self, name):
+        return f"{self.prefix}_" + re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+    def prometheus_text(self):
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, stats in sorted(self.timers.items()):
+                metric = self._metric_name(name) + '_seconds'
+                lines.append(f"# TYPE {metric} summary")
+                for q in (0.5, 0.95):
+                    lines.append(f'{metric}{{quantile="{q}"}} {stats.quantile(q):.6f}')
+                lines.append(f"{metric}_sum {stats.total:.6f}")
+                lines.append(f"{metric}_count {stats.count}")
+            for name, value in sorted(self.counters.items()):
+                metric = self._metric_name(name) + '_total'
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def _write(self, path, text):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def export_json(self, path):
+        self._write(path, json.dumps(self.snapshot(), indent=4))
+
+    def export_prometheus(self, path):
+        self._write(path, self.prometheus_text())
+
+    def start_export(self, json_path=None, textfile_path=None, interval=10.0):
+        """Rewrite the report files every interval seconds on a daemon thread"""
+        stop = threading.Event()
+
+        def run():
+            while True:
+                self.export(json_path, textfile_path)
+                if stop.wait(interval):
+                    return
+
+        self._exporter = stop
+        threading.Thread(target=run, name='metrics-export', daemon=True).start()
+
+    def export(self, json_path=None, textfile_path=None):
+        try:
+            if json_path:
+                self.export_json(json_path)
+            if textfile_path:
+                self.export_prometheus(textfile_path)
+        except Exception as e:
+            print(f"Error exporting metrics: {e}")
+
+    def stop_export(self):
+        if self._exporter is not None:
+            self._exporter.set()
+            self._exporter = None
+
+
+def export_options_from_argv(argv):
+    """Read --metrics-json=PATH, --metrics-textfile=PATH and --metrics-interval=SECONDS"""
+    options = {}
+    for arg in argv[1:]:
+        for flag, key, convert in (('--metrics-json=', 'json_path', str),
+                                   ('--metrics-textfile=', 'textfile_path', str),
+                                   ('--metrics-interval=', 'interval', float)):
+            if arg.startswith(flag):
+                options[key] = convert(arg[len(flag):])
+    return options
+
+
+metrics = Metrics()
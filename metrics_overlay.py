@@ -0,0 +1,57 @@
+import tkinter as tk
+
+
+class MetricsOverlay:
+    """Live hot-path timings drawn over the draw window, toggled by a hotkey"""
+
+    def __init__(self, root, metrics, colors, hotkey='<F12>', refresh_ms=500):
+        self.root = root
+        self.metrics = metrics
+        self.refresh_ms = refresh_ms
+        self.visible = False
+        self._job = None
+        self.label = tk.Label(
+            root,
+            font=('Consolas', 10),
+            justify='left',
+            anchor='nw',
+            bg=colors['primary'],
+            fg=colors['silver'],
+            padx=10,
+            pady=8
+        )
+        root.bind(hotkey, self.toggle)
+
+    def toggle(self, event=None):
+        if self.visible:
+            self.visible = False
+            self.label.place_forget()
+            if self._job is not None:
+                self.root.after_cancel(self._job)
+                self._job = None
+        else:
+            self.visible = True
+            self.label.place(x=10, y=10)
+            self.label.lift()
+            self._refresh()
+
+    def render(self):
+        """Return the overlay text for the current metrics snapshot"""
+        snapshot = self.metrics.snapshot()
+        lines = [f"{'timer':<28}{'n':>7}{'last':>9}{'p50':>9}{'p95':>9}{'max':>9}  (ms)"]
+        for name, t in snapshot['timers'].items():
+            lines.append(
+                f"{name:<28}{t['count']:>7}{t['last_ms']:>9.1f}{t['p50_ms']:>9.1f}"
+                f"{t['p95_ms']:>9.1f}{t['max_ms']:>9.1f}"
+            )
+        if snapshot['counters']:
+            lines.append('')
+            lines.extend(f"{name:<28}{value:>7}" for name, value in snapshot['counters'].items())
+        return '\n'.join(lines)
+
+    def _refresh(self):
+        self._job = None
+        if not self.visible:
+            return
+        self.label.config(text=self.render())
+        self._job = self.root.after(self.refresh_ms, self._refresh)
@@ -0,0 +1,79 @@
+import random
+import threading
+from participant_pool import normalize_stt
+
+
+class NameRing:
+    """Pre-shuffled ring of display names for the rolling animation.
+
+    Each frame reads the next slot in O(1). A winner is dropped by swapping
+    the last slot into theirs, and a pool reload reshuffles on a background
+    thread while the current ring keeps serving frames.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots = []
+        self._positions = {}
+        self._cursor = 0
+        self._generation = 0
+        self._rebuilding = False
+        self._pending_discards = set()
+
+    def __len__(self):
+        return len(self._slots)
+
+    def rebuild_async(self, pool, on_ready=None):
+        """Reshuffle the ring from the pool on a worker thread"""
+        records = pool.records()
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._rebuilding = True
+            self._pending_discards = set()
+
+        def worker():
+            slots = [(normalize_stt(r.get('STT')), str(r.get('Name', ''))) for r in records]
+            random.shuffle(slots)
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._slots = slots
+                self._positions = {stt: i for i, (stt, _) in enumerate(slots)}
+                self._cursor = 0
+                for stt in self._pending_discards:
+                    self._discard_locked(stt)
+                self._pending_discards = set()
+                self._rebuilding = False
+            if on_ready:
+                on_ready()
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def next(self):
+        """Return the next (STT, name) pair, or None while the ring is empty"""
+        with self._lock:
+            if not self._slots:
+                return None
+            if self._cursor >= len(self._slots):
+                self._cursor = 0
+            slot = self._slots[self._cursor]
+            self._cursor += 1
+            return slot
+
+    def discard(self, stt):
+        """Drop a participant from the ring without rebuilding it"""
+        stt = normalize_stt(stt)
+        with self._lock:
+            if self._rebuilding:
+                self._pending_discards.add(stt)
+            self._discard_locked(stt)
+
+    def _discard_locked(self, stt):
+        index = self._positions.pop(stt, None)
+        if index is None:
+            return
+        last = self._slots.pop()
+        if index < len(self._slots):
+            self._slots[index] = last
+            self._positions[last[0]] = index
@@ -0,0 +1,100 @@
+import random
+
+
+def normalize_stt(value):
+    """Return an STT cell value as a canonical string key"""
+    if value.__class__ is str:
+        return value.strip()
+    if value is None or value != value:  # None or NaN
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+class ParticipantPool:
+    """Compact array of participant records keyed by STT.
+
+    Records are stored densely so a random pick is a single index lookup,
+    and removal swaps the target with the last record before popping, so
+    picking and removing a winner costs the same for any pool size.
+    """
+
+    def __init__(self, records=None):
+        self._records = []
+        self._positions = {}
+        if records:
+            self.extend(records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __contains__(self, stt):
+        return normalize_stt(stt) in self._positions
+
+    def add(self, record):
+        """Append a record, rejecting missing or duplicate STT values"""
+        stt = normalize_stt(record.get('STT'))
+        if not stt:
+            raise ValueError(f"Participant '{record.get('Name')}' has no STT")
+        if stt in self._positions:
+            raise ValueError(f"Duplicate STT '{stt}' in participant list")
+        self._positions[stt] = len(self._records)
+        self._records.append(record)
+
+    def extend(self, records):
+        """Append many records"""
+        for record in records:
+            self.add(record)
+
+    def index_of(self, stt):
+        """Return the current position of a participant, or None"""
+        return self._positions.get(normalize_stt(stt))
+
+    def get(self, stt):
+        """Return the record for an STT, or None"""
+        index = self.index_of(stt)
+        return None if index is None else self._records[index]
+
+    def random_index(self, rng=random):
+        """Return the position of a uniformly random participant"""
+        if not self._records:
+            raise IndexError("Participant pool is empty")
+        return rng.randrange(len(self._records))
+
+    def pop(self, index):
+        """Remove and return the record at index by swapping in the last one"""
+        records = self._records
+        record = records[index]
+        last = records.pop()
+        if last is not record:
+            records[index] = last
+            self._positions[normalize_stt(last.get('STT'))] = index
+        del self._positions[normalize_stt(record.get('STT'))]
+        return record
+
+    def remove(self, stt):
+        """Remove and return the record for an STT, or None if absent"""
+        index = self.index_of(stt)
+        return None if index is None else self.pop(index)
+
+    def copy(self):
+        """Return an independent pool with the same records"""
+        pool = ParticipantPool()
+        pool._records = list(self._records)
+        pool._positions = dict(self._positions)
+        return pool
+
+    def clear(self):
+        self._records = []
+        self._positions = {}
+
+    def records(self):
+        """Return a copy of the records in pool order"""
+        return list(self._records)
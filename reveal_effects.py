@@ -0,0 +1,109 @@
+import time
+from functools import lru_cache
+from animation_scheduler import AnimationScheduler, EASINGS
+
+
+def _rgb(color):
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=32)
+def color_ramp(start, end, steps, easing='ease_out_cubic'):
+    """Return steps hex colors going from start to end"""
+    ease = EASINGS[easing]
+    (r0, g0, b0), (r1, g1, b1) = _rgb(start), _rgb(end)
+    ramp = []
+    for i in range(steps):
+        t = ease(i / (steps - 1)) if steps > 1 else 1
+        ramp.append('#%02x%02x%02x' % (
+            round(r0 + (r1 - r0) * t), round(g0 + (g1 - g0) * t), round(b0 + (b1 - b0) * t)
+        ))
+    return tuple(ramp)
+
+
+@lru_cache(maxsize=32)
+def font_ramp(family, start_size, end_size, weight, steps, easing='ease_out_quad'):
+    """Return steps font tuples growing from start_size to end_size"""
+    ease = EASINGS[easing]
+    return tuple(
+        (family, round(start_size + (end_size - start_size) * (ease(i / (steps - 1)) if steps > 1 else 1)), weight)
+        for i in range(steps)
+    )
+
+
+@lru_cache(maxsize=32)
+def pulse_ramp(base, peak, steps):
+    """Return steps colors going from base up to peak and back"""
+    rise = color_ramp(base, peak, steps // 2 + 1, 'ease_out_quad')
+    return rise + tuple(reversed(rise[:steps - len(rise)]))
+
+
+class RevealEffects:
+    """Winner reveal on a label: fade to gold, grow into place, glow.
+
+    Every effect is a precomputed table of per-frame property values
+    (cached across reveals), and all of them are stepped by one shared
+    AnimationScheduler. Frames are merged and only the properties whose
+    value differs from what the widget already shows are configured.
+    """
+
+    def __init__(self, root, widget, colors, font=('Montserrat', 70, 'bold'),
+                 duration_ms=600, interval_ms=30, clock=time.monotonic):
+        self.widget = widget
+        self.colors = colors
+        self.font = font
+        self.duration_ms = duration_ms
+        self.interval_ms = interval_ms
+        self.clock = clock
+        self.scheduler = AnimationScheduler(root, self._frame, interval_ms, clock=clock, name='reveal')
+        self._tables = ()
+        self._applied = {}
+        self._started = None
+
+    @property
+    def steps(self):
+        return max(2, self.duration_ms // self.interval_ms + 1)
+
+    def effect_tables(self, effects):
+        """Return the per-frame property tables for the named effects"""
+        steps = self.steps
+        family, size, weight = self.font
+        tables = {
+            'fade': ('fg', color_ramp(self.colors['primary'], self.colors['gold'], steps)),
+            'scale': ('font', font_ramp(family, int(size * 0.7), size, weight, steps)),
+            'glow': ('highlightbackground', pulse_ramp(self.colors['primary'], self.colors['gold'], steps)),
+        }
+        return tuple(tables[name] for name in effects)
+
+    def reveal(self, text, effects=('fade', 'scale', 'glow')):
+        """Show text and play the effects over duration_ms"""
+        self.scheduler.stop()
+        self._tables = self.effect_tables(effects)
+        self._applied = {}
+        self._configure(dict({'text': text}, **self._props(0)))
+        self._started = self.clock()
+        self.scheduler.start()
+
+    def cancel(self):
+        """Stop a running reveal, leaving the widget in its final state"""
+        if self.scheduler.running:
+            self.scheduler.stop()
+            self._configure(self._props(self.steps - 1))
+
+    def _props(self, index):
+        return {prop: table[index] for prop, table in self._tables}
+
+    def _configure(self, props):
+        changed = {k: v for k, v in props.items() if self._applied.get(k) != v}
+        if changed:
+            self.widget.config(**changed)
+            self._applied.update(changed)
+
+    def _frame(self):
+        # Index by elapsed time, so a late frame jumps ahead instead of lagging
+        elapsed_ms = (self.clock() - self._started) * 1000
+        index = min(self.steps - 1, int(elapsed_ms / self.duration_ms * (self.steps - 1)))
+        self._configure(self._props(index))
+        if index == self.steps - 1:
+            self.scheduler.stop()
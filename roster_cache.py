@@ -0,0 +1,91 @@
+import hashlib
+import marshal
+import os
+import struct
+from pathlib import Path
+from participant_pool import ParticipantPool
+from roster_import import ROSTER_COLUMNS, iter_roster, with_progress
+
+CACHE_FORMAT = 2
+HEADER_SIZE = struct.Struct('<I')
+
+
+def file_signature(path, chunk_size=1 << 20):
+    """Return (size, mtime_ns, content hash) identifying a file's contents"""
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+class RosterCache:
+    """On-disk snapshots of parsed rosters.
+
+    Each source file gets one snapshot holding its records as marshalled
+    row tuples, behind a length-prefixed header with the source path, size,
+    mtime and content hash. Hashing the file is much cheaper than parsing
+    it, so an unchanged roster reloads without touching openpyxl.
+    """
+
+    def __init__(self, directory='.roster_cache'):
+        self.directory = Path(directory)
+
+    def _entry_path(self, path):
+        key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return self.directory / f"{key}.bin"
+
+    def _key(self, path, signature):
+        return (CACHE_FORMAT, os.path.abspath(path)) + tuple(signature)
+
+    def load(self, path, signature):
+        """Return the cached pool for a file signature, or None on a miss"""
+        entry_path = self._entry_path(path)
+        try:
+            with open(entry_path, 'rb') as f:
+                # marshal.load() on a file reads piecemeal; slurp and loads() instead
+                (key_size,) = HEADER_SIZE.unpack(f.read(HEADER_SIZE.size))
+                if marshal.loads(f.read(key_size)) != self._key(path, signature):
+                    return None
+                columns, rows = marshal.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable roster cache {entry_path}: {e}")
+            return None
+        return ParticipantPool(dict(zip(columns, row)) for row in rows)
+
+    def store(self, path, signature, records):
+        """Write a snapshot of the parsed records for a file signature"""
+        records = list(records)
+        columns = tuple(name for name in ROSTER_COLUMNS if records and name in records[0])
+        rows = [tuple(record.get(name, '') for name in columns) for record in records]
+        entry_path = self._entry_path(path)
+        tmp_path = entry_path.with_suffix('.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            key = marshal.dumps(self._key(path, signature))
+            with open(tmp_path, 'wb') as f:
+                f.write(HEADER_SIZE.pack(len(key)))
+                f.write(key)
+                f.write(marshal.dumps((columns, rows)))
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            print(f"Error writing roster cache: {e}")
+
+    def invalidate(self, path):
+        """Drop the snapshot for a file, e.g. after rewriting it ourselves"""
+        try:
+            self._entry_path(path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def load_roster(self, path, progress=None, cancel=None):
+        """Return the pool for a roster file, parsing it only on a cache miss"""
+        signature = file_signature(path)
+        pool = self.load(path, signature)
+        if pool is None:
+            pool = ParticipantPool(with_progress(iter_roster(path), progress, cancel))
+            self.store(path, signature, pool)
+        return pool
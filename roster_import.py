@@ -0,0 +1,129 @@
+import csv
+import io
+import itertools
+from pathlib import Path
+from participant_pool import ParticipantPool
+
+ROSTER_COLUMNS = ('STT', 'Name', 'Group', 'Department', 'Weight')
+REQUIRED_COLUMNS = ('STT', 'Name')
+ROSTER_FILETYPES = [
+    ("Roster files", "*.xlsx *.csv *.parquet *.db"),
+    ("Excel files", "*.xlsx"),
+    ("CSV files", "*.csv"),
+    ("Parquet files", "*.parquet"),
+    ("Shared draw database", "*.db *.sqlite *.sqlite3"),
+]
+
+
+def cell_text(value):
+    """Return a cell value as display text, the way pandas' dtype=str would"""
+    if value is None or value != value:  # None or NaN
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _column_indexes(header):
+    """Map the roster columns present in a header row to their positions"""
+    header = [cell_text(name).strip() for name in header]
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise ValueError("Required columns 'STT' and 'Name' not found")
+    return [(name, header.index(name)) for name in ROSTER_COLUMNS if name in header]
+
+
+def _records_from_rows(rows):
+    """Turn an iterator of raw rows (header first) into roster records"""
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("Roster file is empty")
+    columns = _column_indexes(header)
+    for row in rows:
+        width = len(row)
+        values = [cell_text(row[i]) if i < width else '' for _, i in columns]
+        if not any(values):
+            continue
+        yield dict(zip((name for name, _ in columns), values))
+
+
+def _iter_xlsx(path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from _records_from_rows(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def _iter_csv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from _records_from_rows(csv.reader(f))
+
+
+def _iter_parquet(path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Reading Parquet rosters requires the 'pyarrow' package")
+    parquet_file = pq.ParquetFile(path)
+    present = [name for name in ROSTER_COLUMNS if name in parquet_file.schema_arrow.names]
+
+    def rows():
+        yield present
+        for batch in parquet_file.iter_batches(columns=present):
+            yield from zip(*(column.to_pylist() for column in batch.columns))
+
+    yield from _records_from_rows(rows())
+
+
+ROSTER_READERS = {
+    '.xlsx': _iter_xlsx,
+    '.csv': _iter_csv,
+    '.parquet': _iter_parquet,
+}
+
+
+class LoadCancelled(Exception):
+    """Raised inside a roster load when its cancel event is set"""
+
+
+def with_progress(records, progress=None, cancel=None, chunk_size=5000):
+    """Pass records through, reporting the row count and checking for
+    cancellation once per chunk"""
+    count = 0
+    for record in records:
+        yield record
+        count += 1
+        if count % chunk_size == 0:
+            if cancel is not None and cancel.is_set():
+                raise LoadCancelled()
+            if progress is not None:
+                progress(count)
+    if progress is not None:
+        progress(count)
+
+
+def iter_roster(path):
+    """Stream roster records keeping only the ROSTER_COLUMNS present in the file"""
+    reader = ROSTER_READERS.get(Path(path).suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported roster file type: {Path(path).suffix}")
+    return reader(path)
+
+
+def iter_csv_tail(path, offset):
+    """Stream the records in the bytes a CSV roster gained after offset"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = next(csv.reader(f), None)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        tail = f.read().decode('utf-8')
+    rows = csv.reader(io.StringIO(tail, newline=''))
+    yield from _records_from_rows(itertools.chain([header or []], rows))
+
+
+def load_roster(path, progress=None, cancel=None):
+    """Build a participant pool directly from a roster file"""
+    return ParticipantPool(with_progress(iter_roster(path), progress, cancel))
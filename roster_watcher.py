@@ -0,0 +1,168 @@
+import hashlib
+import os
+import queue
+import threading
+from pathlib import Path
+from participant_pool import normalize_stt
+from roster_import import iter_csv_tail, iter_roster
+from sqlite_store import is_store_path
+
+
+def _prefix_digest(path, size, chunk_size=1 << 20):
+    digest = hashlib.blake2b(digest_size=20)
+    remaining = size
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def diff_rosters(old, new):
+    """Compare two {stt: record} maps; returns (added, removed STTs, updated)"""
+    added = [record for stt, record in new.items() if stt not in old]
+    removed = [stt for stt in old if stt not in new]
+    updated = [record for stt, record in new.items() if stt in old and old[stt] != record]
+    return added, removed, updated
+
+
+class RosterWatcher:
+    """Follows external edits to the roster file and applies them as diffs.
+
+    A worker thread polls the file's size and mtime. A change is only
+    read once the file has stopped changing for one poll, so a save in
+    progress is never parsed. The worker keeps the last parsed
+    {STT: record} map and diffs each new parse against it, after
+    dropping the rows the write-back removed, so our own rewrites only
+    show up as the HR edits they picked up along the way; when a CSV
+    has only grown, just the appended bytes are parsed. Diffs are handed
+    to the Tk thread with root.after and applied with
+    DrawEngine.apply_roster_diff, which never re-adds a winner.
+    """
+
+    def __init__(self, root, engine, interval=2.0, on_applied=None):
+        self.root = root
+        self.engine = engine
+        self.interval = interval
+        self.on_applied = on_applied
+        self.path = None
+        self._records = {}
+        self._seen = None
+        self._pending_stat = None
+        self._csv_size = None
+        self._csv_digest = None
+        self._diffs = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._generation = 0
+
+    def watch(self, path, records):
+        """Start following path, taking records (the loaded roster) as the baseline"""
+        self.stop()
+        if is_store_path(path):
+            return
+        self._generation += 1
+        self.path = path
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(path, list(records), self._stop, self._generation),
+            name='roster-watcher', daemon=True
+        )
+        self._thread.start()
+        self.root.after(int(self.interval * 1000), self._drain, self._generation)
+
+    def stop(self):
+        self._stop.set()
+        self.path = None
+
+    def _stat(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _run(self, path, records, stop, generation):
+        self._records = {normalize_stt(r.get('STT')): dict(r) for r in records}
+        self._seen = self._stat(path)
+        self._pending_stat = None
+        self._remember_csv(path, self._seen)
+        while not stop.wait(self.interval):
+            stat = self._stat(path)
+            if stat is None or stat == self._seen:
+                self._pending_stat = None
+                continue
+            if stat != self._pending_stat:
+                # Still being written; look again on the next poll
+                self._pending_stat = stat
+                continue
+            self._pending_stat = None
+            # Our rewrites re-read the file, so they can carry HR edits too
+            for stt in self.engine.writeback.removed_from(path):
+                self._records.pop(stt, None)
+            try:
+                diff = self._read_changes(path, stat)
+            except Exception as e:
+                print(f"Error reading roster changes: {e}")
+                continue  # retried when the file changes again
+            self._seen = stat
+            if any(diff):
+                self._diffs.put((generation, diff))
+
+    def _remember_csv(self, path, stat):
+        if stat is not None and Path(path).suffix.lower() == '.csv' and self._ends_with_newline(path):
+            self._csv_size = stat[0]
+            self._csv_digest = _prefix_digest(path, stat[0])
+        else:
+            self._csv_size = self._csv_digest = None
+
+    def _ends_with_newline(self, path):
+        # Appending after a partial last line would change that row
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _read_changes(self, path, stat):
+        old_size = self._csv_size
+        if (old_size is not None and stat[0] > old_size
+                and _prefix_digest(path, old_size) == self._csv_digest):
+            # Rows were only appended: parse just the new bytes
+            records = {}
+            for record in iter_csv_tail(path, old_size):
+                records[normalize_stt(record.get('STT'))] = record
+            added = [r for stt, r in records.items() if stt not in self._records]
+            updated = [r for stt, r in records.items()
+                       if stt in self._records and self._records[stt] != r]
+            self._records.update(records)
+            self._remember_csv(path, stat)
+            return added, [], updated
+        records = {}
+        for record in iter_roster(path):
+            records[normalize_stt(record.get('STT'))] = record
+        diff = diff_rosters(self._records, records)
+        self._records = records
+        self._remember_csv(path, stat)
+        return diff
+
+    def _drain(self, generation):
+        if self.path is None or generation != self._generation:
+            return
+        while True:
+            try:
+                diff_generation, (added, removed, updated) = self._diffs.get_nowait()
+            except queue.Empty:
+                break
+            if diff_generation != generation:
+                continue  # from a roster that has since been replaced
+            counts = self.engine.apply_roster_diff(added, removed, updated)
+            if any(counts):
+                print(f"Roster changed: +{counts[0]} -{counts[1]} ~{counts[2]}")
+                if self.on_applied:
+                    self.on_applied(counts)
+        self.root.after(int(self.interval * 1000), self._drain, generation)
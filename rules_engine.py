@@ -0,0 +1,173 @@
+from collections import Counter, defaultdict
+from participant_pool import ParticipantPool, normalize_stt
+from batch_draw import sample_indexes
+
+
+# Roster column used when a prize is drawn weighted
+WEIGHT_COLUMN = 'Weight'
+
+
+class PrizeRules:
+    """Eligibility, quota and weighting settings for one prize"""
+
+    def __init__(self, name="GRAND PRIZE", groups=None, departments=None,
+                 max_per_group=None, max_per_department=None, weight_column=None):
+        self.name = name
+        self.groups = set(groups) if groups else None
+        self.departments = set(departments) if departments else None
+        self.max_per_group = max_per_group or None
+        self.max_per_department = max_per_department or None
+        self.weight_column = weight_column or None
+
+    @property
+    def has_quotas(self):
+        return bool(self.max_per_group or self.max_per_department)
+
+    def describe(self):
+        parts = []
+        if self.groups:
+            parts.append("Group: " + ", ".join(sorted(self.groups)))
+        if self.departments:
+            parts.append("Department: " + ", ".join(sorted(self.departments)))
+        if self.max_per_group:
+            parts.append(f"max {self.max_per_group} per Group")
+        if self.max_per_department:
+            parts.append(f"max {self.max_per_department} per Department")
+        if self.weight_column:
+            parts.append(f"weighted by {self.weight_column}")
+        return " · ".join(parts) or "All participants"
+
+
+class RulesEngine:
+    """Per-Group/Department indexes and the drawable set for the current prize.
+
+    The indexes are built once per roster. The eligible set is a
+    ParticipantPool of its own, so it supports O(1) random picks, and it is
+    only updated for the records a change actually touches: a winner is
+    removed from it, and when a quota fills up only that Group's or
+    Department's remaining members are dropped.
+    """
+
+    def __init__(self, pool, rules=None, previous_winners=(), present=None):
+        self.pool = pool
+        self.present = present
+        self.by_group = defaultdict(set)
+        self.by_department = defaultdict(set)
+        for record in pool:
+            self._index(record)
+        self.apply(rules or PrizeRules(), previous_winners)
+
+    def _index(self, record):
+        stt = normalize_stt(record.get('STT'))
+        self.by_group[record.get('Group', '')].add(stt)
+        self.by_department[record.get('Department', '')].add(stt)
+
+    def _unindex(self, record):
+        stt = normalize_stt(record.get('STT'))
+        self.by_group[record.get('Group', '')].discard(stt)
+        self.by_department[record.get('Department', '')].discard(stt)
+
+    @property
+    def groups(self):
+        return sorted(g for g, members in self.by_group.items() if g and members)
+
+    @property
+    def departments(self):
+        return sorted(d for d, members in self.by_department.items() if d and members)
+
+    def apply(self, rules, previous_winners=()):
+        """Switch to a new prize, counting winners it already has against quotas"""
+        self.rules = rules
+        self.group_counts = Counter(w.get('Group', '') for w in previous_winners)
+        self.department_counts = Counter(w.get('Department', '') for w in previous_winners)
+        unrestricted = rules.groups is None and rules.departments is None and not rules.has_quotas
+        if unrestricted and self.present is None:
+            self.eligible = self.pool.copy()
+            return
+        if rules.groups is not None:
+            candidates = set().union(*(self.by_group.get(g, ()) for g in rules.groups))
+            records = (self.pool.get(stt) for stt in candidates)
+        else:
+            records = iter(self.pool)
+        self.eligible = ParticipantPool(r for r in records if r is not None and self.is_eligible(r))
+
+    def is_eligible(self, record):
+        """Whether a record may win the current prize"""
+        rules = self.rules
+        group = record.get('Group', '')
+        department = record.get('Department', '')
+        if self.present is not None and normalize_stt(record.get('STT')) not in self.present:
+            return False
+        if rules.groups is not None and group not in rules.groups:
+            return False
+        if rules.departments is not None and department not in rules.departments:
+            return False
+        if rules.max_per_group and self.group_counts[group] >= rules.max_per_group:
+            return False
+        if rules.max_per_department and self.department_counts[department] >= rules.max_per_department:
+            return False
+        return True
+
+    def add(self, record):
+        """Index a participant that joined the pool"""
+        self._index(record)
+        if self.is_eligible(record) and record.get('STT') not in self.eligible:
+            self.eligible.add(record)
+
+    def remove(self, record):
+        """Forget a participant that left the pool; returns STTs no longer drawable"""
+        self._unindex(record)
+        removed = self.eligible.remove(record.get('STT'))
+        return [normalize_stt(record.get('STT'))] if removed else []
+
+    def record_winner(self, record):
+        """Count a winner against the quotas; returns STTs no longer drawable"""
+        closed = self.remove(record)
+        rules = self.rules
+        group = record.get('Group', '')
+        department = record.get('Department', '')
+        self.group_counts[group] += 1
+        self.department_counts[department] += 1
+        if rules.max_per_group and self.group_counts[group] >= rules.max_per_group:
+            closed += self._close(self.by_group.get(group, ()))
+        if rules.max_per_department and self.department_counts[department] >= rules.max_per_department:
+            closed += self._close(self.by_department.get(department, ()))
+        return closed
+
+    def _close(self, members):
+        closed = []
+        for stt in members:
+            if self.eligible.remove(stt) is not None:
+                closed.append(stt)
+        return closed
+
+    def sample(self, count, weight_column=None):
+        """Pick up to count eligible winners, honouring quotas within the batch"""
+        eligible = self.eligible
+        if not self.rules.has_quotas:
+            return [eligible[i] for i in sample_indexes(eligible, count, weight_column)]
+        rules = self.rules
+        group_counts = Counter(self.group_counts)
+        department_counts = Counter(self.department_counts)
+        chosen = []
+        seen = set()
+        # Walk a random order of candidates, skipping those whose quota is full.
+        # A small oversample usually suffices; otherwise fall back to a full order.
+        for size in (min(len(eligible), count * 2 + 16), len(eligible)):
+            for index in sample_indexes(eligible, size, weight_column):
+                if index in seen:
+                    continue
+                seen.add(index)
+                record = eligible[index]
+                group = record.get('Group', '')
+                department = record.get('Department', '')
+                if rules.max_per_group and group_counts[group] >= rules.max_per_group:
+                    continue
+                if rules.max_per_department and department_counts[department] >= rules.max_per_department:
+                    continue
+                group_counts[group] += 1
+                department_counts[department] += 1
+                chosen.append(record)
+                if len(chosen) == count:
+                    return chosen
+        return chosen
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from participant_pool import normalize_stt
+
+SoundClip = namedtuple('SoundClip', ['data', 'extension'])
+
+
+def clip_digest(synthesizer, text):
+    """Identify a clip by voice and message so stale clips are re-rendered"""
+    return hashlib.sha256(f"{synthesizer.name}\0{text}".encode('utf-8')).hexdigest()[:32]
+
+
+def _render_clip(synthesizer, stt, text):
+    """Process-pool worker: synthesize one announcement and return its bytes"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"clip{synthesizer.extension}"
+        synthesizer.synthesize(text, path)
+        return stt, path.read_bytes()
+
+
+class SoundBank:
+    """Packed, memory-mapped file of pre-rendered announcements keyed by STT.
+
+    Clip bytes are appended to the bank file and an index line (STT, offset,
+    length, digest) is appended after each clip is flushed. On open, bytes
+    past the last indexed clip are truncated, so an interrupted pre-render
+    simply resumes with the clips that are still missing.
+    """
+
+    def __init__(self, path='announcements.bank'):
+        self.path = Path(path)
+        self.index_path = Path(f"{path}.idx")
+        self._index = {}
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._mapped_size = 0
+        self._opened = False
+
+    def open(self):
+        """Load the index and drop any clip that was not fully written"""
+        with self._lock:
+            self._index = {}
+            end = 0
+            bank_size = self.path.stat().st_size if self.path.exists() else 0
+            if self.index_path.exists():
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            break
+                        if entry['offset'] + entry['length'] > bank_size:
+                            break
+                        self._index[entry['stt']] = entry
+                        end = max(end, entry['offset'] + entry['length'])
+            if bank_size > end:
+                with open(self.path, 'r+b') as f:
+                    f.truncate(end)
+            self._opened = True
+
+    def __contains__(self, stt):
+        return normalize_stt(stt) in self._index
+
+    def get(self, stt, synthesizer, text):
+        """Return the pre-rendered clip for a winner, or None"""
+        if not self._opened:
+            return None
+        entry = self._index.get(normalize_stt(stt))
+        if entry is None or entry['digest'] != clip_digest(synthesizer, text):
+            return None
+        end = entry['offset'] + entry['length']
+        with self._lock:
+            if end > self._mapped_size:
+                self._remap()
+            data = self._mmap[entry['offset']:end]
+        return SoundClip(data, entry['extension'])
+
+    def _remap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        with open(self.path, 'rb') as f:
+            self._mapped_size = os.fstat(f.fileno()).st_size
+            if self._mapped_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def missing(self, jobs, synthesizer):
+        """Filter (STT, text) jobs down to those without an up-to-date clip"""
+        return [
+            (stt, text) for stt, text in jobs
+            if self._index.get(stt, {}).get('digest') != clip_digest(synthesizer, text)
+        ]
+
+    def prerender(self, jobs, synthesizer, processes=None, progress=None, cancel=None):
+        """Render missing clips in a process pool and append them to the bank.
+
+        jobs is a list of (STT, text); progress(done, total) is called from
+        the calling thread after each clip; cancel is an optional Event.
+        Returns the number of clips that failed to render.
+        """
+        if not self._opened:
+            self.open()
+        jobs = [(normalize_stt(stt), text) for stt, text in jobs]
+        total = len(jobs)
+        pending = self.missing(jobs, synthesizer)
+        done = total - len(pending)
+        failures = 0
+        if progress:
+            progress(done, total)
+        if not pending:
+            return failures
+        texts = dict(pending)
+        with ProcessPoolExecutor(max_workers=processes) as executor, \
+                open(self.path, 'ab') as bank, \
+                open(self.index_path, 'a', encoding='utf-8') as index:
+            futures = [executor.submit(_render_clip, synthesizer, stt, text) for stt, text in pending]
+            for future in as_completed(futures):
+                if cancel is not None and cancel.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                try:
+                    stt, data = future.result()
+                except Exception as e:
+                    failures += 1
+                    print(f"Error pre-rendering announcement: {e}")
+                else:
+                    offset = bank.tell()
+                    bank.write(data)
+                    bank.flush()
+                    entry = {
+                        'stt': stt,
+                        'offset': offset,
+                        'length': len(data),
+                        'digest': clip_digest(synthesizer, texts[stt]),
+                        'extension': synthesizer.extension,
+                    }
+                    index.write(json.dumps(entry) + '\n')
+                    index.flush()
+                    self._index[stt] = entry
+                done += 1
+                if progress:
+                    progress(done, total)
+        return failures
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._mapped_size = 0
@@ -0,0 +1,198 @@
+"""Shared participant pool in SQLite, for several stations drawing at once.
+
+Import a roster once, then open the .db file from every station:
+
+    python sqlite_store.py import roster.xlsx draw.db
+
+A draw made by mistake can be undone with:
+
+    python sqlite_store.py release draw.db 42
+"""
+import argparse
+import json
+import os
+import socket
+import sqlite3
+from datetime import datetime
+from participant_pool import ParticipantPool, normalize_stt
+
+STORE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+FIELDS = (('STT', 'stt'), ('Name', 'name'), ('Group', 'grp'),
+          ('Department', 'department'), ('Weight', 'weight'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS participants (
+    stt TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    grp TEXT NOT NULL DEFAULT '',
+    department TEXT NOT NULL DEFAULT '',
+    weight TEXT NOT NULL DEFAULT '',
+    won_seq INTEGER,
+    won_at TEXT,
+    prize TEXT,
+    station TEXT
+);
+CREATE INDEX IF NOT EXISTS participants_grp ON participants (grp);
+CREATE INDEX IF NOT EXISTS participants_department ON participants (department);
+CREATE UNIQUE INDEX IF NOT EXISTS participants_won_seq ON participants (won_seq);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def is_store_path(path):
+    return os.path.splitext(str(path))[1].lower() in STORE_SUFFIXES
+
+
+class SQLiteStore:
+    """Participant pool shared between app instances through a SQLite file.
+
+    The database runs in WAL mode so readers never block the writer, with
+    synchronous=NORMAL so a claim costs one WAL append rather than a full
+    checkpoint. A winner is claimed with a conditional UPDATE inside an
+    IMMEDIATE transaction: exactly one station can flip a row from
+    unclaimed to won, and the others see rowcount 0 and draw again. Each
+    claim gets an increasing won_seq, so stations pick up each other's
+    winners with an indexed range query.
+    """
+
+    def __init__(self, path, station=None, timeout=5.0):
+        self.path = str(path)
+        self.station = station or f"{socket.gethostname()}:{os.getpid()}"
+        self.synced_seq = 0
+        self._conn = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _columns(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'columns'").fetchone()
+        return json.loads(row[0]) if row else [name for name, _ in FIELDS[:2]]
+
+    def import_records(self, records):
+        """Add roster records; existing STTs (and their win state) are kept. Returns rows added"""
+        records = list(records)
+        columns = [name for name, _ in FIELDS if records and name in records[0]]
+        rows = [
+            (normalize_stt(r.get('STT')),) + tuple(str(r.get(name, '')) for name, _ in FIELDS[1:])
+            for r in records
+        ]
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO participants (stt, name, grp, department, weight) '
+                'VALUES (?, ?, ?, ?, ?)', rows
+            )
+            added = conn.total_changes - before
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('columns', ?)",
+                (json.dumps(columns),)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def _record(self, columns, row):
+        values = dict(zip((name for name, _ in FIELDS), row))
+        return {name: values[name] for name in columns}
+
+    def load_pool(self):
+        """Return a pool of everyone not yet claimed by any station"""
+        columns = self._columns()
+        conn = self._conn
+        self.synced_seq = conn.execute(
+            'SELECT COALESCE(MAX(won_seq), 0) FROM participants'
+        ).fetchone()[0]
+        rows = conn.execute(
+            'SELECT stt, name, grp, department, weight FROM participants WHERE won_seq IS NULL'
+        )
+        return ParticipantPool(self._record(columns, row) for row in rows)
+
+    def claim_winners(self, winners, prize=None):
+        """Atomically claim winners; returns the ones this station got"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        conn = self._conn
+        claimed = []
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            seq = conn.execute('SELECT COALESCE(MAX(won_seq), 0) FROM participants').fetchone()[0]
+            for winner in winners:
+                cursor = conn.execute(
+                    'UPDATE participants SET won_seq = ?, won_at = ?, prize = ?, station = ? '
+                    'WHERE stt = ? AND won_seq IS NULL',
+                    (seq + 1, now, prize, self.station, normalize_stt(winner.get('STT')))
+                )
+                if cursor.rowcount == 1:
+                    seq += 1
+                    claimed.append(winner)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return claimed
+
+    def claimed_since(self, seq=None):
+        """Return STTs claimed after seq (default: since the last call), oldest first"""
+        rows = self._conn.execute(
+            'SELECT won_seq, stt FROM participants WHERE won_seq > ? ORDER BY won_seq',
+            (self.synced_seq if seq is None else seq,)
+        ).fetchall()
+        if rows and seq is None:
+            self.synced_seq = rows[-1][0]
+        return [stt for _, stt in rows]
+
+    def release(self, stt):
+        """Return a claimed participant to the pool (undo a draw); False if not claimed"""
+        cursor = self._conn.execute(
+            'UPDATE participants SET won_seq = NULL, won_at = NULL, prize = NULL, station = NULL '
+            'WHERE stt = ? AND won_seq IS NOT NULL', (normalize_stt(stt),)
+        )
+        return cursor.rowcount == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage a shared SQLite draw database")
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_cmd = commands.add_parser('import', help="import a roster file into a database")
+    import_cmd.add_argument('roster')
+    import_cmd.add_argument('database')
+    status_cmd = commands.add_parser('status', help="show pool and winner counts")
+    status_cmd.add_argument('database')
+    release_cmd = commands.add_parser(
+        'release', help="undo draws: make claimed participants drawable again"
+    )
+    release_cmd.add_argument('database')
+    release_cmd.add_argument('stt', nargs='+')
+    args = parser.parse_args()
+
+    store = SQLiteStore(args.database)
+    try:
+        if args.command == 'import':
+            from roster_import import iter_roster
+            added = store.import_records(iter_roster(args.roster))
+            print(f"Imported {added} participants into {args.database}")
+        elif args.command == 'release':
+            for stt in args.stt:
+                if store.release(stt):
+                    print(f"Released {stt}; stations pick them up on their next roster load")
+                else:
+                    print(f"{stt} has not been drawn")
+        else:
+            total, won = store._conn.execute(
+                'SELECT COUNT(*), COUNT(won_seq) FROM participants'
+            ).fetchone()
+            print(f"{total} participants, {won} claimed, {total - won} remaining")
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import builtins
+import json
+import sys
+import threading
+import time
+
+
+class StartupProfiler:
+    """Records time per startup phase and per first import of each module.
+
+    Phases are delimited by mark(name): each mark closes the phase that
+    started at the previous mark. While enabled, builtins.__import__ is
+    wrapped so the first import of every module is timed (inclusive of
+    the modules it pulls in). A disabled profiler does nothing.
+    """
+
+    def __init__(self, enabled=False, budget_ms=None, report_path=None):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.report_path = report_path
+        self.started = time.perf_counter()
+        self._last_mark = self.started
+        self.phases = []
+        self.imports = []
+        self.first_frame_ms = None
+        self._original_import = None
+        self._lock = threading.Lock()
+        if enabled:
+            self._install_import_hook()
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Build a profiler from --profile-startup[=report.json] and --startup-budget-ms=N"""
+        enabled = False
+        budget_ms = None
+        report_path = None
+        for arg in argv[1:]:
+            if arg == '--profile-startup':
+                enabled = True
+            elif arg.startswith('--profile-startup='):
+                enabled = True
+                report_path = arg.split('=', 1)[1]
+            elif arg.startswith('--startup-budget-ms='):
+                budget_ms = float(arg.split('=', 1)[1])
+        return cls(enabled, budget_ms, report_path)
+
+    def _install_import_hook(self):
+        original = builtins.__import__
+        self._original_import = original
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            started = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                with self._lock:
+                    self.imports.append((name, elapsed, threading.current_thread().name))
+
+        builtins.__import__ = timed_import
+
+    def _remove_import_hook(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, name):
+        """Close the current phase under the given name"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            self.phases.append((name, (now - self._last_mark) * 1000))
+            self._last_mark = now
+
+    def first_frame(self):
+        """Record time-to-first-frame and emit the report"""
+        if not self.enabled or self.first_frame_ms is not None:
+            return
+        self.mark('first frame')
+        self.first_frame_ms = (time.perf_counter() - self.started) * 1000
+        self.report()
+
+    def finish(self):
+        """Stop timing imports, e.g. once background loading has settled"""
+        if self.enabled:
+            self._remove_import_hook()
+            if self.report_path:
+                self.write_report(self.report_path)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                'first_frame_ms': self.first_frame_ms,
+                'budget_ms': self.budget_ms,
+                'over_budget': bool(
+                    self.budget_ms and self.first_frame_ms and self.first_frame_ms > self.budget_ms
+                ),
+                'phases': [{'name': n, 'ms': round(ms, 2)} for n, ms in self.phases],
+                'imports': [
+                    {'module': n, 'ms': round(ms, 2), 'thread': t}
+                    for n, ms, t in sorted(self.imports, key=lambda i: -i[1])
+                ],
+            }
+
+    def report(self, top=15, stream=None):
+        """Print phases and the slowest imports"""
+        stream = stream or sys.stdout
+        data = self.as_dict()
+        print("Startup profile", file=stream)
+        for phase in data['phases']:
+            print(f"  {phase['name']:<28} {phase['ms']:9.1f} ms", file=stream)
+        print(f"  {'time to first frame':<28} {data['first_frame_ms'] or 0:9.1f} ms", file=stream)
+        if data['budget_ms']:
+            status = "OVER BUDGET" if data['over_budget'] else "within budget"
+            print(f"  budget {data['budget_ms']:.0f} ms: {status}", file=stream)
+        print(f"Slowest imports (inclusive, top {top})", file=stream)
+        for item in data['imports'][:top]:
+            print(f"  {item['module']:<28} {item['ms']:9.1f} ms  [{item['thread']}]", file=stream)
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=4)
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draw_engine import DrawEngine
+from excel_writeback import ExcelWriteBack
+from winners_journal import WinnersJournal
+from helpers import write_roster
+
+
+@pytest.fixture
+def new_engine(tmp_path):
+    """Build engines sharing one journal in tmp_path, like app restarts"""
+    engines = []
+
+    def build():
+        engine = DrawEngine(
+            journal=WinnersJournal(tmp_path / 'winners.jsonl', tmp_path / 'winners.json'),
+            writeback=ExcelWriteBack(delay=0),
+            use_cache=False,
+        )
+        engines.append(engine)
+        return engine
+
+    yield build
+    for engine in engines:
+        engine.close(timeout=5)
+
+
+@pytest.fixture
+def roster(tmp_path):
+    return write_roster(tmp_path / 'roster.csv', 40)
@@ -0,0 +1,16 @@
+"""Shared test data builders"""
+import csv
+
+GROUPS = ['HCM', 'HN', 'DN', 'Logistic']
+
+
+def write_roster(path, size, weights=False):
+    """Write a synthetic CSV roster and return its path"""
+    header = ['STT', 'Name', 'Group', 'Department'] + (['Weight'] if weights else [])
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(1, size + 1):
+            row = [i, f"Nguyễn Văn {i}", GROUPS[i % len(GROUPS)], f"Team {i % 5}"]
+            writer.writerow(row + ([i % 3] if weights else []))
+    return str(path)
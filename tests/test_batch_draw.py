@@ -0,0 +1,29 @@
+from batch_draw import sample_indexes, sample_winners
+from participant_pool import ParticipantPool
+
+
+def pool_with_weights(weights):
+    return ParticipantPool(
+        {'STT': str(i), 'Name': f"Person {i}", 'Weight': weight}
+        for i, weight in enumerate(weights, 1)
+    )
+
+
+def test_uniform_sample_is_distinct():
+    pool = pool_with_weights([''] * 50)
+    indexes = sample_indexes(pool, 20, seed=1)
+    assert len(indexes) == len(set(indexes)) == 20
+    assert len(sample_indexes(pool, 80)) == 50
+
+
+def test_weighted_sample_skips_zero_weights():
+    pool = pool_with_weights(['0', '2', '', 'x', '1', '-3'])
+    winners = sample_winners(pool, 6, 'Weight', seed=1)
+    assert sorted(w['STT'] for w in winners) == ['2', '5']
+
+
+def test_weighted_sample_without_positive_weights_is_empty():
+    pool = pool_with_weights(['0', '', 'x'])
+    assert sample_indexes(pool, 2, 'Weight') == []
+    assert sample_indexes(pool, 2, 'Missing') == []
+    assert len(sample_indexes(pool, 2)) == 2
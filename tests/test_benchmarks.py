@@ -0,0 +1,50 @@
+"""DrawEngine hot paths under pytest-benchmark; skipped without the plugin.
+
+    python -m pytest tests/test_benchmarks.py --benchmark-only
+"""
+import pytest
+
+from helpers import write_roster
+
+pytest.importorskip('pytest_benchmark')
+
+SIZE = 10_000
+
+
+@pytest.fixture
+def large_roster(tmp_path):
+    return write_roster(tmp_path / 'large.csv', SIZE)
+
+
+@pytest.fixture
+def loaded_engine(new_engine, large_roster):
+    engine = new_engine()
+    engine.load_roster(large_roster)
+    return engine
+
+
+def test_bench_load_roster(benchmark, new_engine, large_roster):
+    engine = new_engine()
+    assert benchmark(engine.load_roster, large_roster) == SIZE
+
+
+def test_bench_pick(benchmark, loaded_engine):
+    assert benchmark(loaded_engine.pick) is not None
+
+
+def test_bench_pick_batch(benchmark, loaded_engine):
+    assert len(benchmark(loaded_engine.pick_batch, 100)) == 100
+
+
+def test_bench_commit_winner(benchmark, loaded_engine):
+    benchmark.pedantic(
+        lambda: loaded_engine.commit_winner(loaded_engine.pick()), rounds=200, iterations=1
+    )
+    assert len(loaded_engine.pool) == SIZE - 200
+
+
+def test_bench_replay(benchmark, new_engine, loaded_engine):
+    loaded_engine.commit_winners(loaded_engine.pick_batch(1000))
+    loaded_engine.close()
+    engine = new_engine()
+    assert len(benchmark(engine.load_previous_winners)) == 1000
@@ -0,0 +1,72 @@
+import unicodedata
+
+from checkin import CheckInDesk, CheckInIndex, fold
+from helpers import write_roster
+
+PEOPLE = [
+    {'STT': '1', 'Name': 'Đặng Thị Hồng'},
+    {'STT': '2', 'Name': 'Nguyễn Văn Thành'},
+    {'STT': '12', 'Name': 'Trần Thanh Tâm'},
+]
+
+
+def names(records):
+    return [record['Name'] for record in records]
+
+
+def test_fold_strips_diacritics():
+    assert fold('Đặng Thị  HỒNG') == 'dang thi hong'
+    # Decomposed input folds the same as precomposed
+    assert fold('Nguyễn') == fold('Nguyễn') == 'nguyen'
+
+
+def test_search_by_any_name_word_without_diacritics():
+    index = CheckInIndex(PEOPLE)
+    assert names(index.search('dang')) == ['Đặng Thị Hồng']
+    assert names(index.search('thanh')) == ['Nguyễn Văn Thành', 'Trần Thanh Tâm']
+    assert names(index.search('THÀNH')) == names(index.search('thanh'))
+    assert names(index.search('van th')) == ['Nguyễn Văn Thành']
+    assert index.search('') == []
+
+
+def test_search_by_stt_prefix():
+    index = CheckInIndex(PEOPLE)
+    assert names(index.search('1')) == ['Đặng Thị Hồng', 'Trần Thanh Tâm']
+    assert names(index.search('1', limit=1)) == ['Đặng Thị Hồng']
+
+
+def test_checkins_are_scoped_to_the_roster(new_engine, tmp_path):
+    log = tmp_path / 'checkins.jsonl'
+    first = write_roster(tmp_path / 'first.csv', 10)
+    second = write_roster(tmp_path / 'second.csv', 10)
+    desk = CheckInDesk(new_engine(), log)
+    desk.set_roster(first)
+    desk.set_present('3', True)
+    desk.close()
+
+    desk = CheckInDesk(new_engine(), log)
+    desk.set_roster(second)
+    assert not desk.is_present('3')
+    desk.set_roster(first)
+    assert desk.is_present('3')
+    desk.close()
+
+
+def test_required_checkins_filter_the_pool(new_engine, tmp_path):
+    roster = write_roster(tmp_path / 'roster.csv', 10)
+    engine = new_engine()
+    engine.load_roster(roster)
+    desk = CheckInDesk(engine, tmp_path / 'checkins.jsonl')
+    desk.set_roster(roster)
+    desk.set_present('4', True)
+    desk.require(True)
+    assert [record['STT'] for record in engine.eligible] == ['4']
+    desk.set_present('5', True)
+    assert len(engine.eligible) == 2
+    desk.reset()
+    assert not engine.eligible
+    desk.close()
+
+    desk = CheckInDesk(engine, tmp_path / 'checkins.jsonl')
+    desk.set_roster(roster)
+    assert not desk.present
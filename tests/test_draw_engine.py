@@ -0,0 +1,201 @@
+import json
+
+from participant_pool import normalize_stt
+from rules_engine import PrizeRules, WEIGHT_COLUMN
+from helpers import write_roster
+
+
+def stts(records):
+    return {normalize_stt(record['STT']) for record in records}
+
+
+def test_load_roster(new_engine, roster):
+    engine = new_engine()
+    assert engine.load_roster(roster) == 40
+    assert len(engine.eligible) == 40
+    assert engine.eligible.get('7')['Name'] == "Nguyễn Văn 7"
+
+
+def test_pick_returns_eligible_participant(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    for _ in range(20):
+        assert normalize_stt(engine.pick()['STT']) in engine.eligible
+
+
+def test_pick_without_eligible_participants(new_engine, roster):
+    engine = new_engine()
+    assert engine.pick() is None
+    assert engine.next_candidate() is None
+    engine.load_roster(roster)
+    engine.set_prize_rules(PrizeRules(groups=['Nobody']))
+    assert engine.pick() is None
+    assert engine.next_candidate() is None
+
+
+def test_commit_removes_winner_and_journals_it(new_engine, roster, tmp_path):
+    engine = new_engine()
+    engine.load_roster(roster)
+    winner = engine.pick()
+    entry = engine.commit_winner(winner)
+    stt = normalize_stt(winner['STT'])
+    assert stt not in engine.pool and stt not in engine.eligible
+    assert entry['winner'] is winner and entry['prize'] == 'GRAND PRIZE'
+    lines = (tmp_path / 'winners.jsonl').read_text(encoding='utf-8').splitlines()
+    assert json.loads(lines[-1])['winner']['STT'] == winner['STT']
+
+
+def test_commit_notifies_listeners(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    seen = []
+    engine.add_listener(seen.append)
+    entries = engine.commit_winners(engine.pick_batch(3))
+    assert seen == [entries] and len(entries) == 3
+
+
+def test_department_quota_closes_department(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.set_prize_rules(PrizeRules('Quota', max_per_department=1))
+    winner = engine.pick()
+    engine.commit_winner(winner)
+    departments = {record['Department'] for record in engine.eligible}
+    assert winner['Department'] not in departments
+    assert len(departments) == 4
+
+
+def test_pick_batch_honours_quota(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.set_prize_rules(PrizeRules('Quota', max_per_department=2))
+    winners = engine.pick_batch(40)
+    assert len(winners) == 10
+    assert len(stts(winners)) == 10
+
+
+def test_quota_counts_journaled_winners(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.set_prize_rules(PrizeRules('Quota', max_per_department=1))
+    engine.commit_winners(engine.pick_batch(5))
+    engine.close()
+
+    engine = new_engine()
+    engine.load_previous_winners()
+    engine.set_prize_rules(PrizeRules('Quota', max_per_department=1))
+    engine.load_roster(roster)
+    assert not engine.eligible
+
+
+def test_weighting_is_explicit(new_engine, tmp_path):
+    engine = new_engine()
+    engine.load_roster(write_roster(tmp_path / 'weighted.csv', 30, weights=True))
+    # Weight 0 only counts once the prize asks for weighting
+    unweighted = stts(engine.pick_batch(30))
+    assert len(unweighted) == 30
+    engine.set_prize_rules(PrizeRules('Weighted', weight_column=WEIGHT_COLUMN))
+    assert all(int(record['Weight']) > 0 for record in engine.pick_batch(30))
+    assert all(int(engine.pick()['Weight']) > 0 for _ in range(20))
+
+
+def test_replay_excludes_previous_winners(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    entries = engine.commit_winners(engine.pick_batch(5))
+    engine.close()
+
+    engine = new_engine()
+    replayed = engine.load_previous_winners()
+    assert [e['winner']['STT'] for e in replayed] == [e['winner']['STT'] for e in entries]
+    assert engine.load_roster(roster) == 35
+    assert not stts(e['winner'] for e in entries) & stts(engine.eligible)
+
+
+def test_winners_only_excluded_from_their_roster(new_engine, roster, tmp_path):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.commit_winners(engine.pick_batch(5))
+    engine.close()
+
+    engine = new_engine()
+    engine.load_previous_winners()
+    other = write_roster(tmp_path / 'other.csv', 40)
+    assert engine.load_roster(other) == 40
+    assert not engine.roster_entries()
+
+
+def test_clear_winners(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.commit_winners(engine.pick_batch(5))
+    engine.clear_winners()
+    engine.close()
+
+    engine = new_engine()
+    assert engine.load_previous_winners() == []
+
+
+def test_replay_truncates_torn_tail(new_engine, roster, tmp_path):
+    engine = new_engine()
+    engine.load_roster(roster)
+    engine.commit_winners(engine.pick_batch(3))
+    engine.close()
+    path = tmp_path / 'winners.jsonl'
+    intact = path.stat().st_size
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "win", "prize": "GRAND')
+
+    engine = new_engine()
+    assert len(engine.load_previous_winners()) == 3
+    assert path.stat().st_size == intact
+
+
+def test_replay_compacts_cleared_history(new_engine, tmp_path):
+    engine = new_engine()
+    engine.load_roster(write_roster(tmp_path / 'large.csv', 100))
+    for _ in range(70):
+        engine.commit_winner(engine.pick())
+    engine.clear_winners()
+    engine.commit_winner(engine.pick())
+    engine.close()
+
+    engine = new_engine()
+    assert len(engine.load_previous_winners()) == 1
+    assert len((tmp_path / 'winners.jsonl').read_text(encoding='utf-8').splitlines()) == 1
+
+
+def test_copied_roster_can_share_winners(new_engine, roster, tmp_path):
+    # HR re-sends the original roster under another name
+    copy = tmp_path / 'roster v2.csv'
+    copy.write_bytes(open(roster, 'rb').read())
+    engine = new_engine()
+    engine.load_roster(roster)
+    entries = engine.commit_winners(engine.pick_batch(3))
+    engine.close()
+
+    engine = new_engine()
+    engine.load_previous_winners()
+    engine.load_roster(str(copy))
+    matches = engine.matching_winners()
+    assert stts(e['winner'] for e in matches) == stts(e['winner'] for e in entries)
+    engine.same_roster(matches)
+    assert len(engine.pool) == 37 and not engine.matching_winners()
+    engine.close()
+
+    # The alias survives a restart and compaction
+    engine = new_engine()
+    engine.journal.compact(engine.load_previous_winners())
+    engine.load_previous_winners()
+    engine.load_roster(str(copy))
+    assert len(engine.pool) == 37 and not engine.matching_winners()
+
+
+def test_weighted_prize_with_only_zero_weights_left(new_engine, tmp_path):
+    engine = new_engine()
+    engine.load_roster(write_roster(tmp_path / 'weighted.csv', 30, weights=True))
+    engine.set_prize_rules(PrizeRules('Weighted', weight_column=WEIGHT_COLUMN))
+    engine.commit_winners(engine.pick_batch(30))
+    assert len(engine.eligible) == 10
+    assert engine.pick() is None
+    assert engine.pick_batch(5) == []
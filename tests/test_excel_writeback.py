@@ -0,0 +1,96 @@
+import threading
+import time
+
+from excel_writeback import ExcelWriteBack
+from helpers import write_roster
+
+
+def roster_stts(path):
+    with open(path, encoding='utf-8-sig') as f:
+        return [line.split(',')[0] for line in f.read().splitlines()[1:]]
+
+
+def counting(writeback):
+    """Wrap _rewrite to record every batch it is given"""
+    batches = []
+    rewrite = writeback._rewrite
+
+    def recorded(path, removed):
+        batches.append(set(removed))
+        rewrite(path, removed)
+
+    writeback._rewrite = recorded
+    return batches
+
+
+def test_burst_is_written_once(tmp_path):
+    path = write_roster(tmp_path / 'roster.csv', 20)
+    writeback = ExcelWriteBack(delay=0.2)
+    batches = counting(writeback)
+    writeback.attach(path)
+    for stt in ('1', '2', '3'):
+        writeback.remove(stt)
+    assert writeback.close(5)
+    assert batches == [{'1', '2', '3'}]
+    assert roster_stts(path)[:2] == ['4', '5']
+    assert writeback.removed_from(path) == {'1', '2', '3'}
+
+
+def test_transient_error_is_retried(tmp_path):
+    path = write_roster(tmp_path / 'roster.csv', 5)
+    errors = []
+    writeback = ExcelWriteBack(delay=0, retry_delay=0.01, on_error=errors.append)
+    rewrite = writeback._rewrite
+    attempts = []
+
+    def locked_once(path, removed):
+        attempts.append(removed)
+        if len(attempts) == 1:
+            raise PermissionError('locked by Excel')
+        rewrite(path, removed)
+
+    writeback._rewrite = locked_once
+    writeback.attach(path)
+    writeback.remove('2')
+    assert writeback.close(5)
+    assert len(attempts) == 2 and isinstance(errors[0], PermissionError)
+    assert roster_stts(path) == ['1', '3', '4', '5']
+    assert writeback.last_error is None
+
+
+def test_permanent_error_is_not_retried(tmp_path):
+    path = tmp_path / 'roster.csv'
+    path.write_text('No,Name\n1,A\n', encoding='utf-8')
+    errors = []
+    writeback = ExcelWriteBack(delay=0, retry_delay=0.01, on_error=errors.append)
+    batches = counting(writeback)
+    writeback.attach(str(path))
+    writeback.remove('1')
+    assert writeback.flush(5) is False
+    time.sleep(0.05)
+    assert len(batches) == 1 and len(errors) == 1
+    assert writeback.failed == {str(path): {'1'}}
+
+
+def test_attach_does_not_wait_for_the_old_file(tmp_path):
+    old = write_roster(tmp_path / 'old.csv', 5)
+    new = write_roster(tmp_path / 'new.csv', 5)
+    writeback = ExcelWriteBack(delay=0)
+    release = threading.Event()
+    rewrite = writeback._rewrite
+
+    def slow(path, removed):
+        release.wait(5)
+        rewrite(path, removed)
+
+    writeback._rewrite = slow
+    writeback.attach(old)
+    writeback.remove('1')
+    started = time.monotonic()
+    writeback.attach(new)
+    assert time.monotonic() - started < 0.1
+    writeback.remove('5')
+    release.set()
+    assert writeback.close(5)
+    assert roster_stts(old) == ['2', '3', '4', '5']
+    assert roster_stts(new) == ['1', '2', '3', '4']
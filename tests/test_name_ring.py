@@ -0,0 +1,75 @@
+import threading
+
+import name_ring
+from name_ring import NameRing
+from participant_pool import ParticipantPool
+
+
+def pool(count):
+    return ParticipantPool({'STT': str(i), 'Name': f"Person {i}"} for i in range(1, count + 1))
+
+
+def rebuilt(ring, records):
+    ready = threading.Event()
+    ring.rebuild_async(records, ready.set)
+    assert ready.wait(5)
+    return ring
+
+
+def ring_stts(ring):
+    return sorted(ring.next()[0] for _ in range(len(ring)))
+
+
+def test_next_cycles_through_every_name():
+    ring = rebuilt(NameRing(), pool(10))
+    assert ring_stts(ring) == sorted(str(i) for i in range(1, 11))
+    assert NameRing().next() is None
+
+
+def test_discard_swaps_out_one_slot():
+    ring = rebuilt(NameRing(), pool(10))
+    ring.discard(' 4 ')
+    ring.discard('missing')
+    assert len(ring) == 9
+    assert '4' not in ring_stts(ring)
+
+
+def test_discard_during_rebuild_is_applied_to_the_new_ring(monkeypatch):
+    ring = rebuilt(NameRing(), pool(10))
+    release = threading.Event()
+    shuffle = name_ring.random.shuffle
+
+    def slow_shuffle(slots):
+        release.wait(5)
+        shuffle(slots)
+
+    monkeypatch.setattr(name_ring.random, 'shuffle', slow_shuffle)
+    ready = threading.Event()
+    ring.rebuild_async(pool(10), ready.set)
+    # A winner committed while the worker is still shuffling
+    ring.discard('7')
+    assert '7' not in ring_stts(ring)
+    release.set()
+    assert ready.wait(5)
+    assert len(ring) == 9 and '7' not in ring_stts(ring)
+
+
+def test_superseded_rebuild_is_dropped(monkeypatch):
+    ring = NameRing()
+    release = threading.Event()
+    shuffle = name_ring.random.shuffle
+    calls = []
+
+    def first_blocks(slots):
+        calls.append(len(slots))
+        if len(calls) == 1:
+            release.wait(5)
+        shuffle(slots)
+
+    monkeypatch.setattr(name_ring.random, 'shuffle', first_blocks)
+    stale = threading.Event()
+    ring.rebuild_async(pool(10), stale.set)
+    rebuilt(ring, pool(3))
+    release.set()
+    assert not stale.wait(0.2)
+    assert len(ring) == 3
@@ -0,0 +1,85 @@
+import time
+
+from roster_watcher import RosterWatcher, diff_rosters
+from helpers import write_roster
+
+
+class FakeRoot:
+    """Stands in for Tk: after() callbacks are run by the test"""
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, delay, callback, *args):
+        self.calls.append((callback, args))
+
+
+def follow(engine, roster, applied):
+    root = FakeRoot()
+    watcher = RosterWatcher(root, engine, interval=0.02, on_applied=applied.append)
+    watcher.watch(roster, engine.pool)
+    return root, watcher
+
+
+def drain_until(root, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+        calls, root.calls = root.calls, []
+        for callback, args in calls:
+            callback(*args)
+    return condition()
+
+
+def test_diff_rosters():
+    old = {'1': {'STT': '1', 'Name': 'A'}, '2': {'STT': '2', 'Name': 'B'}}
+    new = {'2': {'STT': '2', 'Name': 'Bee'}, '3': {'STT': '3', 'Name': 'C'}}
+    assert diff_rosters(old, new) == ([new['3']], ['1'], [new['2']])
+
+
+def test_appended_rows_are_added(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    applied = []
+    root, watcher = follow(engine, roster, applied)
+    with open(roster, 'a', encoding='utf-8') as f:
+        f.write('999,Late Person,HCM,Team 1\n')
+    try:
+        assert drain_until(root, lambda: '999' in engine.pool)
+        assert applied[-1] == (1, 0, 0)
+    finally:
+        watcher.stop()
+
+
+def test_hr_edit_picked_up_by_own_rewrite_is_applied(new_engine, roster):
+    engine = new_engine()
+    engine.load_roster(roster)
+    applied = []
+    root, watcher = follow(engine, roster, applied)
+    try:
+        # HR saves just before a draw; our rewrite re-reads their row
+        with open(roster, 'a', encoding='utf-8') as f:
+            f.write('999,Late Person,HCM,Team 1\n')
+        winner = engine.pick()
+        engine.commit_winner(winner)
+        assert engine.writeback.flush(5)
+        assert drain_until(root, lambda: '999' in engine.pool)
+        # Our own removal is not reported back as an HR deletion
+        assert all(counts[1] == 0 for counts in applied)
+        assert winner['STT'] not in engine.pool
+    finally:
+        watcher.stop()
+
+
+def test_removed_rows_leave_the_pool(new_engine, roster, tmp_path):
+    engine = new_engine()
+    engine.load_roster(roster)
+    applied = []
+    root, watcher = follow(engine, roster, applied)
+    try:
+        time.sleep(0.05)
+        write_roster(tmp_path / 'roster.csv', 30)
+        assert drain_until(root, lambda: len(engine.pool) == 30)
+        assert '35' not in engine.eligible
+    finally:
+        watcher.stop()
@@ -0,0 +1,65 @@
+import threading
+
+from sqlite_store import SQLiteStore, is_store_path
+
+
+def people(count):
+    return [{'STT': str(i), 'Name': f"Person {i}", 'Group': 'HCM'} for i in range(1, count + 1)]
+
+
+def test_import_keeps_existing_rows(tmp_path):
+    store = SQLiteStore(tmp_path / 'draw.db')
+    assert store.import_records(people(5)) == 5
+    assert store.import_records(people(7)) == 2
+    assert len(store.load_pool()) == 7
+    store.close()
+
+
+def test_concurrent_claims_never_overlap(tmp_path):
+    path = tmp_path / 'draw.db'
+    setup = SQLiteStore(path)
+    setup.import_records(people(200))
+    setup.close()
+    stations = [SQLiteStore(path, station=f"station {i}") for i in range(4)]
+    claimed = [None] * len(stations)
+    start = threading.Barrier(len(stations))
+
+    def draw(i):
+        start.wait()
+        # Every station tries to claim the same people
+        won = []
+        for offset in range(0, 200, 10):
+            won += stations[i].claim_winners(people(200)[offset:offset + 10], 'Prize')
+        claimed[i] = [w['STT'] for w in won]
+
+    threads = [threading.Thread(target=draw, args=(i,)) for i in range(len(stations))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    all_claimed = [stt for won in claimed for stt in won]
+    assert sorted(all_claimed, key=int) == [str(i) for i in range(1, 201)]
+    assert len(stations[0].load_pool()) == 0
+    for store in stations:
+        store.close()
+
+
+def test_claimed_since_and_release(tmp_path):
+    path = tmp_path / 'draw.db'
+    first = SQLiteStore(path, station='first')
+    second = SQLiteStore(path, station='second')
+    first.import_records(people(5))
+    second.load_pool()
+    first.claim_winners(people(5)[1:3])
+    assert second.claimed_since() == ['2', '3']
+    assert second.claimed_since() == []
+    assert first.release('2') is True
+    assert first.release('2') is False
+    assert sorted(r['STT'] for r in second.load_pool()) == ['1', '2', '4', '5']
+    first.close()
+    second.close()
+
+
+def test_is_store_path():
+    assert is_store_path('draw.db') and is_store_path('C:/x/draw.sqlite')
+    assert not is_store_path('roster.xlsx')
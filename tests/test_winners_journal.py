@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from winners_journal import WinnersJournal
+
+
+def winner(stt):
+    return {'STT': stt, 'Name': f"Person {stt}"}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = WinnersJournal(tmp_path / 'winners.jsonl', tmp_path / 'winners.json')
+    yield journal
+    journal.close()
+
+
+def replayed(journal):
+    return [entry['winner']['STT'] for entry in journal.replay()]
+
+
+def test_replay_after_clear(journal):
+    journal.append(winner('1'), 'A')
+    journal.clear()
+    journal.append_many([winner('2'), winner('3')], 'B', roster='r')
+    journal.close()
+    entries = journal.replay()
+    assert [e['winner']['STT'] for e in entries] == ['2', '3']
+    assert entries[0]['prize'] == 'B' and entries[0]['roster'] == 'r'
+    assert journal.line_count == 4
+
+
+def test_torn_last_line_is_truncated(journal):
+    journal.append_many([winner('1'), winner('2')])
+    journal.close()
+    intact = journal.path.stat().st_size
+    with open(journal.path, 'ab') as f:
+        f.write(b'{"op": "win", "winner": {"STT"')
+    assert replayed(journal) == ['1', '2']
+    assert journal.path.stat().st_size == intact
+    journal.append(winner('3'))
+    journal.close()
+    assert replayed(journal) == ['1', '2', '3']
+
+
+def test_malformed_middle_line_keeps_later_winners(journal):
+    journal.append(winner('1'))
+    journal.close()
+    with open(journal.path, 'ab') as f:
+        f.write(b'\x00\x00garbage\n')
+    journal.append_many([winner('2'), winner('3')])
+    journal.close()
+    size = journal.path.stat().st_size
+    assert replayed(journal) == ['1', '2', '3']
+    assert journal.path.stat().st_size == size
+
+
+def test_partial_write_followed_by_append(journal):
+    journal.append(winner('1'))
+    journal.close()
+    # A write that died part-way (e.g. disk full), then a good append
+    with open(journal.path, 'ab') as f:
+        f.write(b'{"op": "win", "prize": "A", "winn')
+    journal.append(winner('2'))
+    journal.close()
+    assert replayed(journal) == ['1', '2']
+
+
+def test_failed_write_starts_next_entry_on_a_new_line(journal, monkeypatch):
+    journal.append(winner('1'))
+
+    def fail(*args):
+        raise OSError(28, 'No space left on device')
+
+    monkeypatch.setattr('winners_journal.os.fsync', fail)
+    with pytest.raises(OSError):
+        journal.append(winner('2'))
+    monkeypatch.undo()
+    journal.append(winner('3'))
+    journal.close()
+    lines = journal.path.read_text(encoding='utf-8').splitlines()
+    assert all(json.loads(line) for line in lines if line)
+    assert replayed(journal) == ['1', '2', '3']
+
+
+def test_compaction_keeps_live_entries(journal):
+    for stt in range(80):
+        journal.append(winner(str(stt)))
+    journal.clear()
+    journal.append(winner('x'))
+    journal.close()
+    entries = journal.replay()
+    assert journal.needs_compaction(len(entries))
+    journal.compact(entries)
+    assert replayed(journal) == ['x']
+    assert journal.line_count == 1
+
+
+def test_legacy_winners_json_is_imported(tmp_path):
+    (tmp_path / 'winners.json').write_text(json.dumps([winner('7')]), encoding='utf-8')
+    journal = WinnersJournal(tmp_path / 'winners.jsonl', tmp_path / 'winners.json')
+    assert replayed(journal) == ['7']
+    journal.close()
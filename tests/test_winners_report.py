@@ -0,0 +1,85 @@
+import csv
+import re
+
+import pytest
+
+from winners_report import HTML_PAGE_END, WinnersReport
+
+
+def entries(prize, *stts, time='2026-10-18 20:00'):
+    return [
+        {'op': 'win', 'time': time, 'prize': prize,
+         'winner': {'STT': stt, 'Name': f"Người {stt}", 'Group': 'HCM', 'Department': 'DT'}}
+        for stt in stts
+    ]
+
+
+def report(tmp_path):
+    return WinnersReport(tmp_path / 'reports', formats=('csv', 'html'), delay=0)
+
+
+def csv_rows(report):
+    with open(report.csv_path, encoding='utf-8-sig', newline='') as f:
+        return [(row['Prize'], row['No.'], row['STT']) for row in csv.DictReader(f)]
+
+
+def html_sections(report):
+    """Return [(prize heading, [STTs])] in page order"""
+    text = report.html_path.read_text(encoding='utf-8')
+    assert text.endswith(HTML_PAGE_END)
+    sections = []
+    for section in re.findall(r'<section>(.*?)</section>', text, re.S):
+        heading = re.search(r'<h2>(.*?)</h2>', section).group(1)
+        rows = re.findall(r'<tr data-prize="[^"]*"><td>\d+</td><td>[^<]*</td><td>([^<]*)</td>', section)
+        sections.append((heading, rows))
+    return sections
+
+
+def test_appends_continue_the_open_prize_section(tmp_path):
+    first = report(tmp_path)
+    first.add(entries('Giải Ba', '1', '2'))
+    first.flush(5)
+    first.add(entries('Giải Ba', '3'))
+    first.add(entries('Giải Nhì', '4'))
+    first.close(5)
+    # A restart keeps appending to the same page and numbering
+    second = report(tmp_path)
+    second.add(entries('Giải Nhì', '5'))
+    second.close(5)
+    assert html_sections(second) == [('Giải Ba', ['1', '2', '3']), ('Giải Nhì', ['4', '5'])]
+    assert csv_rows(second) == [
+        ('Giải Ba', '1', '1'), ('Giải Ba', '2', '2'), ('Giải Ba', '3', '3'),
+        ('Giải Nhì', '1', '4'), ('Giải Nhì', '2', '5'),
+    ]
+
+
+def test_html_escapes_prize_and_names(tmp_path):
+    winners = report(tmp_path)
+    winners.add(entries('<Grand> & "Best"', '1'))
+    winners.close(5)
+    text = winners.html_path.read_text(encoding='utf-8')
+    assert '<h2>&lt;Grand&gt; &amp; &quot;Best&quot;</h2>' in text
+    assert '<Grand>' not in text
+
+
+def test_reconcile_appends_only_missing_entries(tmp_path):
+    journal = entries('Giải Ba', '1', '2', '3')
+    first = report(tmp_path)
+    first.add(journal[:1])
+    first.close(5)
+    second = report(tmp_path)
+    second.reconcile(journal)
+    second.reconcile(journal)
+    second.close(5)
+    assert [row[2] for row in csv_rows(second)] == ['1', '2', '3']
+    assert html_sections(second) == [('Giải Ba', ['1', '2', '3'])]
+
+
+def test_xlsx_has_one_sheet_per_prize(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    winners = WinnersReport(tmp_path / 'reports', formats=('csv', 'xlsx'), delay=0)
+    winners.add(entries('Giải Ba', '1', '2') + entries('Giải: Nhất?', '3'))
+    winners.close(5)
+    workbook = openpyxl.load_workbook(winners.xlsx_path)
+    assert workbook.sheetnames == ['Giải Ba', 'Giải  Nhất ']
+    assert [row[0] for row in workbook['Giải Ba'].iter_rows(min_row=2, values_only=True)] == [1, 2]
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from winners_view import WinnersView
 
 class UIComponents:
     def __init__(self, root, colors):
@@ -15,13 +16,21 @@ class UIComponents:
         }
         self.main_frame = None
         self.file_btn = None
+        self.rules_btn = None
+        self.checkin_btn = None
+        self.new_event_btn = None
         self.file_label = None
+        self.cancel_load_btn = None
+        self.prize_label = None
         self.canvas = None
         self.name_label = None
         self.start_btn = None
         self.stop_btn = None
         self.next_btn = None
-        self.winners_list = None
+        self.reveal_all_btn = None
+        self.batch_size = None
+        self.winners_view = None
+        self.winners_search = None
 
     def setup_styles(self):
         """Configure custom styles and colors"""
@@ -115,6 +124,45 @@ class UIComponents:
         )
         self.file_btn.pack(side='left')
         
+        self.rules_btn = tk.Button(
+            canvas,
+            text="⚙ Prize Rules",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            padx=25,
+            pady=12,
+            relief='flat',
+            cursor='hand2'
+        )
+        self.rules_btn.pack(side='left', padx=(15, 0))
+        
+        self.checkin_btn = tk.Button(
+            canvas,
+            text="✔ Check-in",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            padx=25,
+            pady=12,
+            relief='flat',
+            cursor='hand2'
+        )
+        self.checkin_btn.pack(side='left', padx=(15, 0))
+
+        self.new_event_btn = tk.Button(
+            canvas,
+            text="✨ New Event",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            padx=25,
+            pady=12,
+            relief='flat',
+            cursor='hand2'
+        )
+        self.new_event_btn.pack(side='left', padx=(15, 0))
+        
         self.file_label = tk.Label(
             canvas,
             text="No file selected",
@@ -124,6 +172,19 @@ class UIComponents:
         )
         self.file_label.pack(side='left', padx=25)
 
+        # Packed only while a roster is loading
+        self.cancel_load_btn = tk.Button(
+            canvas,
+            text="✖ Cancel",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            padx=15,
+            pady=6,
+            relief='flat',
+            cursor='hand2'
+        )
+
     def create_display_section(self):
         """Create enhanced main display area"""
         self.display_frame = tk.Frame(
@@ -143,21 +204,23 @@ class UIComponents:
         )
         self.canvas.pack(fill='x', pady=25)
         
-        prize_label = tk.Label(
+        self.prize_label = tk.Label(
             self.display_frame,
             text="GRAND PRIZE",
             font=('Montserrat', 33, 'bold'),
             bg=self.colors['primary'],
             fg=self.colors['gold']
         )
-        prize_label.place(relx=0.5, rely=0.15, anchor='center')
+        self.prize_label.place(relx=0.5, rely=0.15, anchor='center')
         
         self.name_label = tk.Label(
             self.canvas,
             text="Ready to Start",
             font=('Montserrat', 70, 'bold'),
             bg=self.colors['primary'],
-            fg=self.colors['gold']
+            fg=self.colors['gold'],
+            highlightthickness=4,
+            highlightbackground=self.colors['primary']
         )
         self.name_label.place(relx=0.5, rely=0.5, anchor='center')
 
@@ -199,6 +262,40 @@ class UIComponents:
                 self.next_btn = btn
                 btn.configure(state='disabled')
 
+        # Number of winners drawn per Start/Stop cycle
+        tk.Label(
+            controls_frame,
+            text="Winners per draw",
+            font=('Montserrat', 12),
+            bg=self.colors['bg'],
+            fg=self.colors['silver']
+        ).pack(side='left', padx=(30, 10))
+        self.batch_size = tk.Spinbox(
+            controls_frame,
+            from_=1,
+            to=1000,
+            width=5,
+            font=('Montserrat', 14, 'bold'),
+            justify='center',
+            relief='flat'
+        )
+        self.batch_size.pack(side='left')
+
+        # Enabled while a batch is being revealed one winner at a time
+        self.reveal_all_btn = tk.Button(
+            controls_frame,
+            text="⏭ Reveal All",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            relief='flat',
+            padx=15,
+            pady=6,
+            cursor='hand2',
+            state='disabled'
+        )
+        self.reveal_all_btn.pack(side='left', padx=(15, 0))
+
     def create_winners_section(self):
         """Create enhanced winners display section"""
         winners_frame = tk.Frame(
@@ -221,24 +318,212 @@ class UIComponents:
             fg=self.colors['gold']
         ).pack()
         
-        # Create stylish listbox
+        search_frame = tk.Frame(winners_frame, bg=self.colors['secondary'])
+        search_frame.pack(fill='x', padx=15, pady=(0, 10))
+        tk.Label(
+            search_frame,
+            text="🔍",
+            font=('Segoe UI Emoji', 12),
+            bg=self.colors['secondary'],
+            fg=self.colors['silver']
+        ).pack(side='left')
+        self.winners_search = tk.StringVar()
+        tk.Entry(
+            search_frame,
+            textvariable=self.winners_search,
+            font=('Montserrat', 12),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text'],
+            relief='flat'
+        ).pack(side='left', fill='x', expand=True, padx=(8, 0))
+
+        # Only the rows in view are drawn, so thousands of winners stay responsive
         list_frame = tk.Frame(winners_frame, bg=self.colors['secondary'])
         list_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
-        
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.winners_list = tk.Listbox(
-            list_frame,
-            bg=self.colors['primary'],
+        self.winners_view = WinnersView(list_frame, self.colors)
+
+        search_job = []
+
+        def on_search(*_):
+            # Debounce so typing does not refilter on every keystroke
+            if search_job:
+                self.root.after_cancel(search_job.pop())
+            search_job.append(self.root.after(
+                150, lambda: (search_job.clear(), self.winners_view.set_filter(self.winners_search.get()))
+            ))
+
+        self.winners_search.trace_add('write', on_search)
+
+    def open_rules_dialog(self, groups, current, on_apply, can_weight=False):
+        """Open the prize rules dialog; on_apply(name, group, max_per_department, weighted)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Prize Rules")
+        dialog.configure(bg=self.colors['secondary'], padx=25, pady=20)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        all_groups = "All groups"
+        fields = [
+            ("Prize", tk.StringVar(value=current.name)),
+            ("Only Group", tk.StringVar(
+                value=next(iter(current.groups)) if current.groups else all_groups
+            )),
+            ("Max winners per Department (0 = no limit)",
+             tk.StringVar(value=str(current.max_per_department or 0))),
+        ]
+        for row, (label, variable) in enumerate(fields):
+            tk.Label(
+                dialog,
+                text=label,
+                font=('Montserrat', 12),
+                bg=self.colors['secondary'],
+                fg=self.colors['silver']
+            ).grid(row=row, column=0, sticky='w', pady=6, padx=(0, 15))
+        name_var, group_var, quota_var = (variable for _, variable in fields)
+        tk.Entry(dialog, textvariable=name_var, font=('Montserrat', 12), width=24).grid(
+            row=0, column=1, sticky='ew'
+        )
+        ttk.Combobox(
+            dialog, textvariable=group_var, values=[all_groups] + list(groups),
+            state='readonly', width=22
+        ).grid(row=1, column=1, sticky='ew')
+        tk.Spinbox(dialog, from_=0, to=1000, textvariable=quota_var, width=6).grid(
+            row=2, column=1, sticky='w'
+        )
+        # Only offered when the roster has a Weight column
+        weighted_var = tk.BooleanVar(value=bool(current.weight_column) and can_weight)
+        tk.Checkbutton(
+            dialog,
+            text="Weight chances by the Weight column",
+            variable=weighted_var,
+            state='normal' if can_weight else 'disabled',
+            font=('Montserrat', 12),
+            bg=self.colors['secondary'],
             fg=self.colors['silver'],
+            selectcolor=self.colors['primary'],
+            activebackground=self.colors['secondary']
+        ).grid(row=3, column=0, columnspan=2, sticky='w', pady=6)
+
+        def apply():
+            try:
+                quota = max(0, int(quota_var.get()))
+            except ValueError:
+                messagebox.showwarning("Warning", "Max winners must be a number", parent=dialog)
+                return
+            group = group_var.get()
+            on_apply(
+                name_var.get().strip() or "GRAND PRIZE",
+                None if group == all_groups else group,
+                quota,
+                weighted_var.get()
+            )
+            dialog.destroy()
+
+        tk.Button(
+            dialog,
+            text="Apply",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['accent'],
+            fg=self.colors['text'],
+            relief='flat',
+            padx=20,
+            command=apply
+        ).grid(row=4, column=0, columnspan=2, pady=(15, 0))
+
+    def open_checkin_dialog(self, desk, on_change):
+        """Open the door check-in desk; on_change() runs after presence changes"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Check-in")
+        dialog.configure(bg=self.colors['secondary'], padx=25, pady=20)
+        dialog.transient(self.root)
+
+        query_var = tk.StringVar()
+        required_var = tk.BooleanVar(value=desk.required)
+        status = tk.Label(
+            dialog,
             font=('Montserrat', 12),
-            selectmode='none',
-            height=8,
-            yscrollcommand=scrollbar.set,
+            bg=self.colors['secondary'],
+            fg=self.colors['silver']
+        )
+        entry = tk.Entry(dialog, textvariable=query_var, font=('Montserrat', 14), width=36)
+        entry.pack(fill='x')
+        results = tk.Listbox(
+            dialog,
+            font=('Montserrat', 12),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            selectbackground=self.colors['accent'],
+            height=12,
             relief='flat',
-            borderwidth=0,
             highlightthickness=0
         )
-        self.winners_list.pack(fill='both', expand=True)
-        scrollbar.config(command=self.winners_list.yview)
+        results.pack(fill='both', expand=True, pady=10)
+        shown = []
+
+        def refresh(*_):
+            shown[:] = desk.search(query_var.get())
+            results.delete(0, 'end')
+            for record in shown:
+                mark = "✓" if desk.is_present(record.get('STT')) else "  "
+                line = f"{mark} {record.get('STT')} - {record.get('Name')}"
+                if record.get('Group'):
+                    line += f"  ·  {record.get('Group')} - {record.get('Department', '')}"
+                results.insert('end', line)
+            if shown:
+                results.selection_set(0)
+            status.config(text=f"{len(desk.present)} checked in")
+
+        def toggle(event=None):
+            selection = results.curselection()
+            if not selection:
+                return
+            index = selection[0]
+            desk.toggle(shown[index].get('STT'))
+            refresh()
+            results.selection_clear(0, 'end')
+            results.selection_set(index)
+            on_change()
+
+        def set_required():
+            desk.require(required_var.get())
+            on_change()
+
+        def reset():
+            if not messagebox.askyesno(
+                "Check-in", f"Mark all {len(desk.present)} attendees as not checked in?", parent=dialog
+            ):
+                return
+            desk.reset()
+            refresh()
+            on_change()
+
+        query_var.trace_add('write', refresh)
+        entry.bind('<Return>', toggle)
+        entry.bind('<Down>', lambda e: results.focus_set())
+        results.bind('<Double-Button-1>', toggle)
+        results.bind('<Return>', toggle)
+        tk.Checkbutton(
+            dialog,
+            text="Only checked-in attendees can win",
+            variable=required_var,
+            command=set_required,
+            font=('Montserrat', 12),
+            bg=self.colors['secondary'],
+            fg=self.colors['silver'],
+            selectcolor=self.colors['primary'],
+            activebackground=self.colors['secondary']
+        ).pack(anchor='w')
+        status.pack(anchor='w', pady=(6, 0))
+        tk.Button(
+            dialog,
+            text="Clear check-ins",
+            font=('Montserrat', 12, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['text'],
+            relief='flat',
+            padx=15,
+            command=reset
+        ).pack(anchor='e', pady=(10, 0))
+        refresh()
+        entry.focus_set()
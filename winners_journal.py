@@ -0,0 +1,164 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+
+def win_entries(winners, prize=None, roster=None):
+    """Build journal entries; roster identifies the roster they were drawn from"""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M')
+    entries = [{'op': 'win', 'time': now, 'prize': prize, 'winner': w} for w in winners]
+    if roster is not None:
+        for entry in entries:
+            entry['roster'] = roster
+    return entries
+
+
+class WinnersJournal:
+    """Append-only JSON-lines log of drawn winners.
+
+    Every draw is written as one line and fsync'd before the call returns,
+    so the cost per draw does not grow with the number of winners and a
+    power cut loses at most the line being written. Clearing appends a
+    marker instead of truncating; compaction rewrites the live entries.
+    An alias line records that two roster files hold the same people.
+    """
+
+    def __init__(self, path='winners.jsonl', legacy_path='winners.json'):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path)
+        self.line_count = 0
+        self.aliases = {}  # roster -> rosters holding the same people
+        self._torn = False
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def _write(self, entries):
+        f = self._open()
+        # After a failed write the file may end in a partial line
+        data = '\n' if self._torn else ''
+        data += ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        except Exception:
+            self._torn = True
+            try:
+                self.close()
+            except OSError:
+                self._file = None
+            raise
+        self._torn = False
+        self.line_count += len(entries)
+
+    def append(self, winner, prize=None, roster=None):
+        """Durably record a single winner and return the journal entry"""
+        return self.append_many([winner], prize, roster)[0]
+
+    def append_many(self, winners, prize=None, roster=None):
+        """Durably record several winners with a single fsync"""
+        entries = win_entries(winners, prize, roster)
+        self._write(entries)
+        return entries
+
+    def clear(self):
+        """Mark all previous winners as cleared"""
+        self._write([{'op': 'clear'}])
+        self.aliases = {}
+
+    def alias(self, roster, same_as):
+        """Record that roster holds the same people as same_as"""
+        self._write([{'op': 'alias', 'roster': roster, 'same_as': same_as}])
+        self.aliases.setdefault(roster, set()).add(same_as)
+
+    def replay(self):
+        """Read the journal once and return the live winner entries"""
+        if not self.path.exists():
+            self._import_legacy()
+        entries = []
+        self.line_count = 0
+        self.aliases = {}
+        if not self.path.exists():
+            return entries
+        good_offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write from a crash: only the last line can be partial
+                    break
+                good_offset += len(line)
+                self.line_count += 1
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A failed write (e.g. disk full) followed by good appends;
+                    # the next entry may have been appended to the partial line
+                    entry = self._recover(line)
+                    if entry is None:
+                        print(f"Skipping malformed line {self.line_count} in {self.path}")
+                        continue
+                if entry.get('op') == 'clear':
+                    entries = []
+                    self.aliases = {}
+                elif entry.get('op') == 'win':
+                    entries.append(entry)
+                elif entry.get('op') == 'alias':
+                    self.aliases.setdefault(entry['roster'], set()).add(entry['same_as'])
+        if good_offset != self.path.stat().st_size:
+            self.close()
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_offset)
+        return entries
+
+    def _recover(self, line):
+        start = line.rfind(b'{"op": ')
+        if start <= 0:
+            return None
+        try:
+            return json.loads(line[start:])
+        except ValueError:
+            return None
+
+    def needs_compaction(self, live_count):
+        """Whether the log holds enough dead lines to be worth rewriting"""
+        return self.line_count > max(2 * live_count, 64)
+
+    def compact(self, entries):
+        """Atomically rewrite the journal to contain only the given entries (and aliases)"""
+        self.close()
+        lines = [
+            {'op': 'alias', 'roster': roster, 'same_as': same_as}
+            for roster, others in self.aliases.items() for same_as in sorted(others)
+        ] + list(entries)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in lines:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.line_count = len(lines)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _import_legacy(self):
+        """Carry winners over from the old rewrite-everything winners.json"""
+        try:
+            if self.legacy_path.exists() and self.legacy_path.stat().st_size:
+                with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                    winners = json.load(f)
+                if winners:
+                    self.append_many(winners)
+                    self.close()
+        except Exception as e:
+            print(f"Error importing {self.legacy_path}: {e}")
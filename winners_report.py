@@ -0,0 +1,271 @@
+import csv
+import html
+import os
+import re
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+REPORT_COLUMNS = ('Prize', 'No.', 'Time', 'STT', 'Name', 'Group', 'Department')
+REPORT_FORMATS = ('csv', 'html', 'xlsx')
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="vi">
+<head>
+<meta charset="utf-8">
+<title>Lucky Draw Winners</title>
+<style>
+body { font-family: Montserrat, 'Segoe UI', sans-serif; background: #1a1a2e; color: #fff; margin: 2em; }
+h1 { color: #ffd700; }
+h2 { color: #ffd700; border-bottom: 2px solid #e94560; padding-bottom: .3em; margin-top: 2em; }
+table { border-collapse: collapse; width: 100%; background: #16213e; }
+th { background: #0f3460; text-align: left; }
+th, td { padding: .5em 1em; border-bottom: 1px solid #0f3460; }
+tr:nth-child(even) td { background: #1b2747; }
+</style>
+</head>
+<body>
+<h1>🏆 Winners 🏆</h1>
+"""
+HTML_SECTION_END = "</tbody></table></section>\n"
+HTML_PAGE_END = "</body></html>\n"
+
+
+def entry_key(entry):
+    """Identify a winner row so the report can be reconciled with the journal"""
+    return (entry.get('prize') or '', entry.get('time', ''), str(entry['winner'].get('STT', '')))
+
+
+def report_row(entry, number):
+    """Return the report cells for a journal entry"""
+    winner = entry['winner']
+    return (
+        entry.get('prize') or '',
+        number,
+        entry.get('time', ''),
+        winner.get('STT', ''),
+        winner.get('Name', ''),
+        winner.get('Group', ''),
+        winner.get('Department', ''),
+    )
+
+
+class WinnersReport:
+    """Winners report by prize round, written in the background.
+
+    add() only queues the committed entries, so a reveal never waits on
+    the report. A worker coalesces bursts and appends: rows go to the
+    end of the CSV, and the HTML page is extended in place by seeking
+    back over its closing tags, opening a new section whenever the prize
+    changes. An .xlsx cannot be appended to, so the workbook (one sheet
+    per prize) is regenerated from the CSV at most every xlsx_interval
+    seconds and on close. reconcile() compares the report with the
+    journal and appends whatever a crash kept from being written.
+    """
+
+    def __init__(self, directory='reports', formats=REPORT_FORMATS, delay=0.5, xlsx_interval=30.0):
+        self.directory = Path(directory)
+        self.formats = tuple(formats)
+        self.delay = delay
+        self.xlsx_interval = xlsx_interval
+        stem = f"winners_{date.today().isoformat()}"
+        self.csv_path = self.directory / f"{stem}.csv"
+        self.html_path = self.directory / f"{stem}.html"
+        self.xlsx_path = self.directory / f"{stem}.xlsx"
+        self._cond = threading.Condition()
+        self._pending = []
+        self._writing = False
+        self._stopped = False
+        self._xlsx_dirty = False
+        self._xlsx_written = 0.0
+        self._counts = None
+        self._keys = None
+        self._thread = threading.Thread(target=self._run, name='winners-report', daemon=True)
+        self._thread.start()
+
+    def add(self, entries):
+        """Queue committed winners for the report (engine listener)"""
+        with self._cond:
+            self._pending.extend(entries)
+            self._cond.notify_all()
+
+    def reconcile(self, entries):
+        """Append journal entries that are missing from today's report.
+
+        Rows already in the report are skipped by prize, time and STT, so
+        this is safe to call on every start and roster load.
+        """
+        self.add(entries)
+
+    def flush(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=None):
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    timeout = None
+                    if self._xlsx_dirty:
+                        timeout = max(0.0, self._xlsx_written + self.xlsx_interval - time.monotonic())
+                        if timeout == 0:
+                            break
+                    self._cond.wait(timeout)
+                stopping = self._stopped and not self._pending
+            if not stopping and self._pending:
+                time.sleep(self.delay)  # let a batch reveal arrive as one write
+            with self._cond:
+                batch = self._pending
+                self._pending = []
+                self._writing = True
+            try:
+                if batch:
+                    self._append(batch)
+                if self._xlsx_dirty and (
+                        stopping or time.monotonic() >= self._xlsx_written + self.xlsx_interval):
+                    self._write_xlsx()
+            except Exception as e:
+                print(f"Error writing winners report: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+            if stopping:
+                return
+
+    def _numbered_rows(self, entries):
+        """Number winners within their prize, continuing from earlier appends.
+
+        Entries the report already holds are left out.
+        """
+        if self._counts is None:
+            self._counts = {}
+            self._keys = set()
+            if self.csv_path.exists():
+                with open(self.csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    for row in csv.DictReader(f):
+                        prize = row.get('Prize', '')
+                        self._counts[prize] = self._counts.get(prize, 0) + 1
+                        self._keys.add((prize, row.get('Time', ''), row.get('STT', '')))
+        rows = []
+        for entry in entries:
+            key = entry_key(entry)
+            if key in self._keys:
+                continue
+            self._keys.add(key)
+            prize = key[0]
+            self._counts[prize] = self._counts.get(prize, 0) + 1
+            rows.append(report_row(entry, self._counts[prize]))
+        return rows
+
+    def _append(self, entries):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        rows = self._numbered_rows(entries)
+        if not rows:
+            return
+        self._append_csv(rows)
+        if 'html' in self.formats:
+            self._append_html(rows)
+        if 'xlsx' in self.formats:
+            self._xlsx_dirty = True
+
+    def _append_csv(self, rows):
+        # The CSV is always kept: it is what the xlsx is rebuilt from
+        new = not self.csv_path.exists()
+        with open(self.csv_path, 'a', encoding='utf-8-sig' if new else 'utf-8', newline='') as f:
+            writer = csv.writer(f)
+            if new:
+                writer.writerow(REPORT_COLUMNS)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _append_html(self, rows):
+        if not self.html_path.exists():
+            with open(self.html_path, 'w', encoding='utf-8') as f:
+                f.write(HTML_HEAD + HTML_PAGE_END)
+        with open(self.html_path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 4096))
+            ending = f.read().decode('utf-8', errors='ignore')
+            # Rows carry their prize, so the open section can be continued
+            in_section = ending.endswith(HTML_SECTION_END + HTML_PAGE_END)
+            prizes = re.findall(r'<tr data-prize="([^"]*)">', ending)
+            prize = html.unescape(prizes[-1]) if in_section and prizes else None
+            closing = (HTML_SECTION_END if in_section else '') + HTML_PAGE_END
+            f.seek(size - len(closing.encode('utf-8')))
+            f.truncate()
+            parts = []
+            for row in rows:
+                if not in_section or row[0] != prize:
+                    if in_section:
+                        parts.append(HTML_SECTION_END)
+                    in_section = True
+                    prize = row[0]
+                    parts.append(
+                        f'<section><h2>{html.escape(prize or "Winners")}</h2>\n<table><thead><tr>'
+                        + ''.join(f'<th>{html.escape(c)}</th>' for c in REPORT_COLUMNS[1:])
+                        + '</tr></thead><tbody>\n'
+                    )
+                parts.append(
+                    f'<tr data-prize="{html.escape(prize)}">'
+                    + ''.join(f'<td>{html.escape(str(c))}</td>' for c in row[1:]) + '</tr>\n'
+                )
+            parts.append(HTML_SECTION_END + HTML_PAGE_END)
+            f.write(''.join(parts).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_xlsx(self):
+        try:
+            from openpyxl import Workbook
+            from openpyxl.styles import Font, PatternFill
+        except ImportError:
+            print("Writing the xlsx winners report requires the 'openpyxl' package")
+            self._xlsx_dirty = False
+            return
+        self._xlsx_dirty = False
+        self._xlsx_written = time.monotonic()
+        sheets = {}
+        with open(self.csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            for row in rows:
+                sheets.setdefault(row[0], []).append(row[1:])
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        header_font = Font(bold=True, color='FFFFFF')
+        header_fill = PatternFill('solid', fgColor='0F3460')
+        for prize, prize_rows in sheets.items():
+            # Sheet titles are limited to 31 characters and some symbols
+            title = re.sub(r'[\[\]:*?/\\]', ' ', prize or 'Winners')[:31]
+            sheet = workbook.create_sheet(title)
+            sheet.append(REPORT_COLUMNS[1:])
+            for cell in sheet[1]:
+                cell.font = header_font
+                cell.fill = header_fill
+            for row in prize_rows:
+                sheet.append([int(row[0]) if row[0].isdigit() else row[0]] + row[1:])
+            for column, width in zip('ABCDEF', (6, 18, 10, 32, 16, 24)):
+                sheet.column_dimensions[column].width = width
+            sheet.freeze_panes = 'A2'
+        tmp_path = self.xlsx_path.with_suffix('.tmp')
+        workbook.save(tmp_path)
+        os.replace(tmp_path, self.xlsx_path)
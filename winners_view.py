@@ -0,0 +1,157 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+def winner_row_text(entry):
+    """Return the one-line gallery text for a journal entry"""
+    winner = entry['winner']
+    text = f"🏆 {entry.get('time', '')} - {winner.get('Name', '')}"
+    if winner.get('Group') or winner.get('Department'):
+        text += f"  ·  {winner.get('Group', '')} - {winner.get('Department', '')}"
+    return text
+
+
+def search_key(entry):
+    """Return the lowercased text a search query is matched against"""
+    winner = entry['winner']
+    return " ".join(
+        str(winner.get(column, '')) for column in ('Name', 'Group', 'Department')
+    ).casefold()
+
+
+class WinnersView:
+    """Scrollable winners list that only draws the rows in view.
+
+    Entries live in a plain list (oldest first, shown newest first) and
+    the canvas holds just enough text items to fill the viewport; scrolling
+    re-targets those items instead of creating one per winner. A search
+    filter keeps a list of matching positions, narrowed in place when the
+    query is extended.
+    """
+
+    def __init__(self, parent, colors, font=('Montserrat', 12), row_height=28, padding=10):
+        self.colors = colors
+        self.font = font
+        self.row_height = row_height
+        self.padding = padding
+        self.entries = []
+        self._keys = []
+        self._query = ''
+        self._matches = None
+        self._top = 0
+        self._items = []
+        self._shown = []
+
+        self.scrollbar = ttk.Scrollbar(parent, command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas = tk.Canvas(
+            parent,
+            bg=colors['primary'],
+            height=8 * row_height,
+            relief='flat',
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.canvas.pack(fill='both', expand=True)
+        self.canvas.bind('<Configure>', lambda e: self._render())
+        self.canvas.bind('<MouseWheel>', self._on_wheel)
+        self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+
+    def __len__(self):
+        return len(self.entries) if self._matches is None else len(self._matches)
+
+    def set_entries(self, entries):
+        """Replace the whole list in one pass (initial load)"""
+        self.entries = list(entries)
+        self._keys = [search_key(entry) for entry in self.entries]
+        self._top = 0
+        self._refilter(self._query, narrow=False)
+
+    def add(self, entry):
+        """Add a new winner at the top of the list"""
+        self.add_many([entry])
+
+    def add_many(self, entries):
+        for entry in entries:
+            key = search_key(entry)
+            if self._matches is not None and self._query in key:
+                self._matches.append(len(self.entries))
+            self.entries.append(entry)
+            self._keys.append(key)
+        self._top = 0
+        self._render()
+
+    def clear(self):
+        self.set_entries([])
+
+    def set_filter(self, query):
+        """Show only winners whose Name, Group or Department contains query"""
+        query = query.strip().casefold()
+        if query == self._query:
+            return
+        narrow = bool(self._query) and query.startswith(self._query)
+        self._top = 0
+        self._refilter(query, narrow)
+
+    def _refilter(self, query, narrow):
+        if not query:
+            self._matches = None
+        else:
+            keys = self._keys
+            candidates = self._matches if narrow else range(len(keys))
+            self._matches = [i for i in candidates if query in keys[i]]
+        self._query = query
+        self._render()
+
+    def _entry_at(self, row):
+        """Entry shown on a display row (row 0 is the newest)"""
+        position = len(self) - 1 - row
+        if self._matches is not None:
+            position = self._matches[position]
+        return self.entries[position]
+
+    def _content_height(self):
+        return len(self) * self.row_height
+
+    def yview(self, *args):
+        """Scrollbar protocol: moveto fraction / scroll n units|pages"""
+        height = self.canvas.winfo_height()
+        if args[0] == 'moveto':
+            self._top = float(args[1]) * self._content_height()
+        elif args[0] == 'scroll':
+            step = height if args[2] == 'pages' else self.row_height
+            self._top += int(args[1]) * step
+        self._render()
+
+    def _on_wheel(self, event):
+        self.yview('scroll', -1 if event.delta > 0 else 1, 'units')
+
+    def _render(self):
+        canvas = self.canvas
+        height = max(canvas.winfo_height(), self.row_height)
+        total = self._content_height()
+        self._top = max(0, min(self._top, total - height))
+        needed = height // self.row_height + 2
+        while len(self._items) < needed:
+            self._items.append(canvas.create_text(
+                self.padding, 0, anchor='nw', font=self.font, fill=self.colors['silver']
+            ))
+            self._shown.append(None)
+
+        first = int(self._top // self.row_height)
+        offset = first * self.row_height - self._top
+        count = len(self)
+        for slot, item in enumerate(self._items):
+            row = first + slot
+            text = winner_row_text(self._entry_at(row)) if slot < needed and row < count else ''
+            if text != self._shown[slot]:
+                canvas.itemconfig(item, text=text)
+                self._shown[slot] = text
+            if text:
+                canvas.coords(item, self.padding, offset + slot * self.row_height + 4)
+
+        if total <= height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self._top / total, (self._top + height) / total)